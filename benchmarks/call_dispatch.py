@@ -0,0 +1,141 @@
+"""Benchmark of the per-Call overhead of edx-lint's call checkers.
+
+Lints a generated module made of many calls, mostly to functions and methods
+that no edx-lint checker is interested in, once with only a message that
+doesn't look at calls enabled, and once with every edx-lint message that
+inspects calls enabled too. The difference, divided by the number of calls, is
+the time edx-lint adds to each Call node:
+
+    python benchmarks/call_dispatch.py --calls 20000 --repeat 5
+
+To compare with another version of edx-lint, check it out, and give its
+directory with --before. It is measured in a new interpreter that imports
+edx_lint from there:
+
+    git worktree add /tmp/edx-lint-before <commit>
+    python benchmarks/call_dispatch.py --before /tmp/edx-lint-before
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+PLUGINS = "edx_lint.pylint,edx_lint.pylint.unittest_assert,edx_lint.pylint.events_annotation"
+
+CALL_MESSAGES = [
+    "simplifiable-range",
+    "literal-used-as-attribute",
+    "translation-of-non-string",
+    "wrong-assert-type",
+    "avoid-unittest-asserts",
+    "unsafe-yaml-load",
+    "feature-toggle-needs-doc",
+    "illegal-waffle-usage",
+    "toggle-missing-annotation",
+    "missing-or-incorrect-annotation",
+]
+
+# A message that doesn't inspect calls, so that the baseline runs have something to lint.
+BASELINE_MESSAGE = "line-too-long"
+
+CALL_TEMPLATES = [
+    "function_{n}(arg, {n})",
+    "obj.method_{n}(arg)",
+    "obj.attr.chained_{n}(arg).other()",
+    "self.assertEqual(value, {n})",
+    "range({n})",
+    "_('constant {n}')",
+]
+
+
+def write_module(directory, calls):
+    """Write a module with `calls` calls, returning its path."""
+    path = os.path.join(directory, "calls.py")
+    with open(path, "w") as module:
+        module.write("def calls(obj, arg, value):\n")
+        for n in range(calls):
+            module.write("    " + CALL_TEMPLATES[n % len(CALL_TEMPLATES)].format(n=n) + "\n")
+    return path
+
+
+def lint_time(path, *pylint_args):
+    """Lint a module once, returning the elapsed time."""
+    start = time.perf_counter()
+    Run(
+        [path, "--disable=all", f"--enable={BASELINE_MESSAGE}", "--persistent=n", *pylint_args],
+        reporter=CollectingReporter(),
+        exit=False,
+    )
+    return time.perf_counter() - start
+
+
+def measure(calls, repeat):
+    """Return the best baseline and checked lint times of a module with `calls` calls, in seconds."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_module(directory, calls)
+        baseline_args = [f"--load-plugins={PLUGINS}"]
+        checked_args = [f"--load-plugins={PLUGINS}", "--enable=" + ",".join(CALL_MESSAGES)]
+        # The first runs parse and cache the module, so that the timed runs only measure the checkers.
+        lint_time(path, *baseline_args)
+        lint_time(path, *checked_args)
+        baseline = min(lint_time(path, *baseline_args) for _ in range(repeat))
+        checked = min(lint_time(path, *checked_args) for _ in range(repeat))
+    return baseline, checked
+
+
+def measure_checkout(checkout, calls, repeat):
+    """Measure the edx-lint of another checkout in a new interpreter, returning its baseline and checked times."""
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(checkout))
+    result = subprocess.run(
+        [sys.executable, __file__, "--calls", str(calls), "--repeat", str(repeat), "--json"],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    results = json.loads(result.stdout)
+    if not results["edx_lint"].startswith(os.path.abspath(checkout)):
+        raise RuntimeError(f"{checkout} was not imported, edx_lint came from {results['edx_lint']}")
+    return results["baseline"], results["checked"]
+
+
+def print_results(label, calls, baseline, checked):
+    """Print the times of one version of edx-lint."""
+    print(f"{label}:")
+    print(f"  without call messages:  {baseline:.3f}s")
+    print(f"  with call messages:     {checked:.3f}s")
+    print(f"  overhead per call:      {(checked - baseline) / calls * 1e6:.2f}us")
+
+
+def main():
+    """Run the benchmark and print its results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000, help="number of calls in the generated module")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs, the best one is kept")
+    parser.add_argument("--before", metavar="CHECKOUT", help="directory of another edx-lint checkout to compare with")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    if args.json:
+        import edx_lint  # pylint: disable=import-outside-toplevel
+
+        baseline, checked = measure(args.calls, args.repeat)
+        print(json.dumps({"edx_lint": os.path.abspath(edx_lint.__file__), "baseline": baseline, "checked": checked}))
+        return
+
+    print(f"calls: {args.calls}")
+    if args.before:
+        print_results(f"before ({args.before})", args.calls, *measure_checkout(args.before, args.calls, args.repeat))
+    print_results("after" if args.before else "edx-lint", args.calls, *measure(args.calls, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
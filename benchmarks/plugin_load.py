@@ -0,0 +1,166 @@
+"""Benchmark of the time edx-lint adds to starting pylint.
+
+Pre-commit hooks and editors run pylint on single files, so the time taken to
+load the plugin is paid on every run. This measures:
+
+- the cold import of edx_lint.pylint, in a new interpreter with no compiled
+  bytecode, after pylint is imported,
+- its warm import, in a new interpreter with compiled bytecode,
+- plugin.register() on a new linter,
+- the construction of each edx-lint checker.
+
+The best time of the repeated runs is printed. To compare with another
+version of edx-lint, check it out, and give its directory with --before. It is
+measured in the same run, in new interpreters that import edx_lint from there,
+and the benchmark fails when a time exceeds the time before by more than the
+margin, and by more than the noise of the machine:
+
+    git worktree add /tmp/edx-lint-before <commit>
+    python benchmarks/plugin_load.py --before /tmp/edx-lint-before --margin 0.5 --noise 0.5
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from pylint.lint import PyLinter
+
+from edx_lint.pylint import plugin
+
+PLUGINS = ["edx_lint.pylint", "edx_lint.pylint.unittest_assert", "edx_lint.pylint.events_annotation"]
+
+IMPORT_CODE = """\
+import time
+import pylint.lint
+start = time.perf_counter()
+import edx_lint.pylint
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(pycache_prefix):
+    """Import edx_lint.pylint in a new interpreter, returning the time the import took."""
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache_prefix)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run([sys.executable, "-c", IMPORT_CODE], capture_output=True, check=True, env=env, text=True)
+    return float(result.stdout)
+
+
+def cold_import_time():
+    """Import edx_lint.pylint in a new interpreter, with an empty bytecode cache."""
+    with tempfile.TemporaryDirectory() as pycache_prefix:
+        return import_time(pycache_prefix)
+
+
+def register_time():
+    """Register the edx_lint.pylint checkers on a new linter, returning the time it took."""
+    linter = PyLinter()
+    start = time.perf_counter()
+    plugin.register(linter)
+    return time.perf_counter() - start
+
+
+def checker_classes():
+    """Return the checker classes of the edx-lint plugins, by checker name."""
+    linter = PyLinter()
+    linter.load_plugin_modules(PLUGINS)
+    return {checker.name: type(checker) for checker in linter.get_checkers() if checker is not linter}
+
+
+def construction_time(checker_class):
+    """Construct a checker for a new linter, returning the time it took."""
+    linter = PyLinter()
+    start = time.perf_counter()
+    checker_class(linter)
+    return time.perf_counter() - start
+
+
+def measure(repeat):
+    """Return the best time of `repeat` runs of each measurement, in seconds, by name."""
+    results = {}
+    with tempfile.TemporaryDirectory() as pycache_prefix:
+        # Compile the bytecode for the warm imports.
+        import_time(pycache_prefix)
+        results["warm import"] = min(import_time(pycache_prefix) for _ in range(repeat))
+    results["cold import"] = min(cold_import_time() for _ in range(repeat))
+    results["register"] = min(register_time() for _ in range(repeat))
+    for name, checker_class in sorted(checker_classes().items()):
+        results[f"construct {name}"] = min(construction_time(checker_class) for _ in range(repeat))
+    return results
+
+
+def measure_checkout(checkout, repeat):
+    """Measure the edx-lint of another checkout in new interpreters, returning its results."""
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(checkout))
+    result = subprocess.run(
+        [sys.executable, __file__, "--repeat", str(repeat), "--json"],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    results = json.loads(result.stdout)
+    if not results["edx_lint"].startswith(os.path.abspath(checkout)):
+        raise RuntimeError(f"{checkout} was not imported, edx_lint came from {results['edx_lint']}")
+    return results["results"]
+
+
+def regressions(results, before, margin, noise):
+    """
+    Return the names of the results that exceed their time before by more than `margin`, a fraction, and by more than
+    `noise`, in seconds.
+    """
+    return [
+        name
+        for name, seconds in results.items()
+        if name in before and seconds > before[name] * (1 + margin) and seconds - before[name] > noise
+    ]
+
+
+def main():
+    """Run the benchmark, print its results, and exit with an error if it regressed."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="number of timed runs, the best one is kept")
+    parser.add_argument(
+        "--margin", type=float, default=0.5, help="fraction by which a time may exceed its time before (default 0.5)"
+    )
+    parser.add_argument(
+        "--noise",
+        type=float,
+        default=0.5,
+        help="milliseconds by which any time may exceed its time before (default 0.5)",
+    )
+    parser.add_argument("--before", metavar="CHECKOUT", help="directory of another edx-lint checkout to compare with")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    if args.json:
+        import edx_lint  # pylint: disable=import-outside-toplevel
+
+        print(json.dumps({"edx_lint": os.path.abspath(edx_lint.__file__), "results": measure(args.repeat)}))
+        return
+
+    before = measure_checkout(args.before, args.repeat) if args.before else {}
+    results = measure(args.repeat)
+    for name, seconds in results.items():
+        if not args.before:
+            compared = ""
+        elif name in before:
+            compared = f"{(seconds / before[name] - 1):+.0%}"
+        else:
+            compared = "new"
+        print(f"{name:45} {seconds * 1000:9.3f}ms  {compared:>6}")
+
+    regressed = regressions(results, before, args.margin, args.noise / 1000)
+    if regressed:
+        print(f"Slower than before by more than {args.margin:.0%}: {', '.join(regressed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""The edx_lint fix command."""
+
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+from edx_lint.pylint.autofix import FIXABLE_MESSAGES, FIXES, NothingToFix
+
+
+def fix_main(argv):
+    """
+    fix [--messages=MESSAGE,...] PATH...
+        Fix the simplifiable-range, literal-used-as-attribute, wrong-assert-type
+        and avoid-unittest-asserts messages in the Python files under PATH.
+        By default, only the ones the pylint configuration enables are fixed.
+    """
+    messages = None
+    paths = []
+    for arg in argv:
+        if arg.startswith("--messages="):
+            messages = [message for message in arg.split("=", 1)[1].split(",") if message]
+        else:
+            paths.append(arg)
+
+    unknown = [message for message in messages or () if message not in FIXABLE_MESSAGES]
+    if unknown:
+        print("Can't fix {}, only {}".format(", ".join(unknown), ", ".join(FIXABLE_MESSAGES)))
+        return 1
+    if not paths:
+        print("Please provide the files or directories to fix.")
+        return 1
+
+    # The pylint configuration loads the plugins of the other messages it enables.
+    plugins = sorted({"edx_lint.pylint", *(FIXABLE_MESSAGES[message] for message in messages or ())})
+    pylint_args = [
+        *paths,
+        "--load-plugins=" + ",".join(plugins),
+        # The fixes are collected in this process.
+        "--jobs=1",
+        "--persistent=n",
+    ]
+    with FIXES.collecting(messages):
+        try:
+            Run(pylint_args, reporter=CollectingReporter(), exit=False)
+        except NothingToFix:
+            print(
+                "Nothing to fix: the pylint configuration enables none of {}. Name the messages to fix with "
+                "--messages.".format(", ".join(FIXABLE_MESSAGES))
+            )
+            return 1
+        results = FIXES.apply()
+
+    fixed = 0
+    for result in results:
+        if result.error is not None:
+            print(f"{result.path}: not fixed, the fixes would make it invalid: {result.error}")
+            continue
+        fixed += result.fixed
+        line = f"{result.path}: {result.fixed} fixed"
+        if result.skipped:
+            line += f", {result.skipped} overlapping other fixes, run edx_lint fix again to fix them"
+        print(line)
+    print(f"{fixed} fixed in {sum(result.error is None for result in results)} files")
+    return 0
@@ -4,8 +4,11 @@ import sys
 
 from edx_lint import __version__
 from edx_lint.cmd.check import check_main
+from edx_lint.cmd.fix import fix_main
 from edx_lint.cmd.list import list_main
+from edx_lint.cmd.shard import shard_main
 from edx_lint.cmd.write import write_main
+from edx_lint.cmd.unittest_to_pytest import unittest_to_pytest_main
 from edx_lint.cmd.update import update_main
 from edx_lint.cmd.write_uv_constraints import write_uv_constraints_main
 
@@ -26,6 +29,12 @@ def main(argv=None):
         return write_main(argv[1:])
     elif argv[0] == "update":
         return update_main(argv[1:])
+    elif argv[0] == "fix":
+        return fix_main(argv[1:])
+    elif argv[0] == "shard":
+        return shard_main(argv[1:])
+    elif argv[0] == "unittest_to_pytest":
+        return unittest_to_pytest_main(argv[1:])
     elif argv[0] == "write_uv_constraints":
         return write_uv_constraints_main(argv[1:])
     else:
@@ -43,5 +52,6 @@ version {VERSION}
 Commands:
 """.format(VERSION=__version__)
     )
-    for cmd in [write_main, check_main, list_main, update_main, write_uv_constraints_main]:
+    for cmd in [write_main, check_main, list_main, update_main, fix_main, shard_main, unittest_to_pytest_main,
+                write_uv_constraints_main]:
         print(cmd.__doc__.lstrip("\n"))
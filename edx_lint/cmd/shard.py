@@ -0,0 +1,152 @@
+"""The edx_lint shard command."""
+
+import argparse
+import heapq
+import json
+import os
+from collections import defaultdict
+
+# The number of most recent timings of a file that are averaged to estimate its lint time.
+RECENT_RECORDS = 5
+
+# Lint seconds per byte of source, for files without timings when there are no timings at all.
+DEFAULT_SECONDS_PER_BYTE = 0.0001
+
+
+def python_files(paths):
+    """Yield the Python files named by `paths`, looking in directories recursively."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d != "__pycache__")
+            for filename in sorted(filenames):
+                if filename.endswith(".py"):
+                    yield os.path.join(dirpath, filename)
+
+
+def parse_record(line):
+    """
+    Parse a line of a module tracing file, returning the timing it records, or None if it isn't one.
+
+    Lines cut short by an interrupted run, and the bare file names that older versions of the module tracing checker
+    wrote, aren't timings.
+    """
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(record, dict) or not isinstance(record.get("file"), str) or not record["file"]:
+        return None
+    numbers = ["end", "wall", "size"] if "size" in record else ["end", "wall"]
+    for key in numbers:
+        if not isinstance(record.get(key), (int, float)) or isinstance(record[key], bool):
+            return None
+    return record
+
+
+def read_history(filenames):
+    """
+    Read the module timings recorded by the module tracing checker in the JSON lines files `filenames`.
+
+    Returns a dict of the recorded timings of each file, most recent last, by real path. Missing files, and lines that
+    aren't timings, are skipped.
+    """
+    records = []
+    for filename in filenames:
+        try:
+            with open(filename) as f:
+                records.extend(record for record in map(parse_record, f) if record is not None)
+        except FileNotFoundError:
+            continue
+    history = defaultdict(list)
+    for record in sorted(records, key=lambda record: record["end"]):
+        history[os.path.realpath(record["file"])].append(record)
+    return history
+
+
+def estimate_times(files, history):
+    """
+    Return the expected lint time of each of `files`, in seconds.
+
+    Files with timings in `history` get the average of their recent timings, the others are estimated from their size,
+    with the seconds per byte of all the recent timings.
+    """
+    recent = {path: records[-RECENT_RECORDS:] for path, records in history.items()}
+    sized = [record for records in recent.values() for record in records if record.get("size")]
+    if sized:
+        seconds_per_byte = sum(record["wall"] for record in sized) / sum(record["size"] for record in sized)
+    else:
+        seconds_per_byte = DEFAULT_SECONDS_PER_BYTE
+
+    estimates = {}
+    for file in files:
+        records = recent.get(os.path.realpath(file))
+        if records:
+            estimates[file] = sum(record["wall"] for record in records) / len(records)
+        else:
+            estimates[file] = os.path.getsize(file) * seconds_per_byte
+    return estimates
+
+
+def plan_shards(estimates, num_shards):
+    """
+    Split the files of `estimates` into `num_shards` shards with balanced expected times.
+
+    Longest-processing-time-first: the files are assigned from the slowest, each to the shard with the least expected
+    time so far. Returns a list of (expected seconds, sorted files) pairs.
+    """
+    shards = [[] for _ in range(num_shards)]
+    heap = [(0.0, shard) for shard in range(num_shards)]
+    totals = [0.0] * num_shards
+    for file in sorted(estimates, key=lambda file: (-estimates[file], file)):
+        total, shard = heapq.heappop(heap)
+        shards[shard].append(file)
+        totals[shard] = total + estimates[file]
+        heapq.heappush(heap, (totals[shard], shard))
+    return [(total, sorted(files)) for total, files in zip(totals, shards)]
+
+
+def shard_main(argv):
+    """
+    shard --shards=N [--history=FILE]... [--output=PATTERN] PATH...
+        Split the Python files under PATH into N lists with balanced expected
+        lint times, from the module timings recorded by running pylint with
+        PYLINT_RECORD_FILES=FILE (the default history), or from their size.
+        Each list is printed on a line, or written to PATTERN with {} replaced
+        by the shard number.
+    """
+    parser = argparse.ArgumentParser(prog="edx_lint shard", add_help=False)
+    parser.add_argument("--shards", type=int, required=True)
+    parser.add_argument("--history", action="append")
+    parser.add_argument("--output")
+    parser.add_argument("paths", nargs="+")
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit:
+        return 1
+
+    if args.shards < 1:
+        print("Please provide a number of shards of at least 1.")
+        return 1
+    history_files = args.history
+    if history_files is None:
+        history_files = [os.environ["PYLINT_RECORD_FILES"]] if os.environ.get("PYLINT_RECORD_FILES") else []
+
+    files = list(python_files(args.paths))
+    missing = [file for file in files if not os.path.isfile(file)]
+    if missing:
+        print(f"File not found: {', '.join(missing)}")
+        return 2
+
+    shards = plan_shards(estimate_times(files, read_history(history_files)), args.shards)
+    for number, (total, shard_files) in enumerate(shards, start=1):
+        if args.output:
+            filename = args.output.format(number)
+            with open(filename, "w") as f:
+                f.writelines(file + "\n" for file in shard_files)
+            print(f"{filename}: {len(shard_files)} files, {total:.1f}s expected")
+        else:
+            print(" ".join(shard_files))
+    return 0
@@ -0,0 +1,41 @@
+"""The edx_lint unittest_to_pytest command."""
+
+import argparse
+
+from edx_lint.pylint.unittest_assert.codemod import rewrite_files
+
+
+def unittest_to_pytest_main(argv):
+    """
+    unittest_to_pytest [--jobs=N] PATH...
+        Rewrite the unittest assertions in the Python files under PATH as
+        pytest assertions, like `assert a == b` for `self.assertEqual(a, b)`.
+    """
+    parser = argparse.ArgumentParser(prog="edx_lint unittest_to_pytest", add_help=False)
+    parser.add_argument("--jobs", type=int)
+    parser.add_argument("paths", nargs="*")
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit:
+        return 1
+
+    if args.jobs is not None and args.jobs < 1:
+        print("Please provide a number of jobs of at least 1.")
+        return 1
+    if not args.paths:
+        print("Please provide the files or directories to rewrite.")
+        return 1
+
+    rewritten = files = 0
+    for result in rewrite_files(args.paths, jobs=args.jobs):
+        if result.error is not None:
+            print(f"{result.path}: not rewritten: {result.error}")
+        elif result.rewritten or result.left:
+            line = f"{result.path}: {result.rewritten} rewritten"
+            if result.left:
+                line += f", {result.left} left"
+            print(line)
+            rewritten += result.rewritten
+            files += bool(result.rewritten)
+    print(f"{rewritten} assertions rewritten in {files} files")
+    return 0
@@ -9,3 +9,4 @@ Add this to your pylintrc::
 from edx_lint.pylint import plugin
 
 register = plugin.register
+load_configuration = plugin.load_configuration
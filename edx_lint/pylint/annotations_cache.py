@@ -0,0 +1,157 @@
+"""Persistent, content-addressed cache of code annotation search results.
+
+Most modules don't change between two lint runs, so their annotations don't
+either. When this cache is enabled, annotation checkers skip the
+code_annotations search of any module whose content, annotation configuration
+file, edx-lint version and code_annotations version were already seen.
+
+To use, define an environment variable EDX_LINT_ANNOTATIONS_CACHE with the
+directory to store the cache in:
+
+    export EDX_LINT_ANNOTATIONS_CACHE=.edx_lint_cache/annotations
+
+The cache holds at most EDX_LINT_ANNOTATIONS_CACHE_SIZE entries (default
+50000). The least recently used entries are evicted when the pylint process
+exits, which is also when the size is read.
+
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+import code_annotations
+
+from edx_lint import __version__
+
+DIRECTORY = os.environ.get("EDX_LINT_ANNOTATIONS_CACHE", "")
+SIZE_VARIABLE = "EDX_LINT_ANNOTATIONS_CACHE_SIZE"
+DEFAULT_MAX_ENTRIES = 50000
+
+
+def max_entries_from_environment():
+    """
+    Return the number of entries the cache may hold, from the EDX_LINT_ANNOTATIONS_CACHE_SIZE environment variable.
+
+    Raises ValueError, with a message naming the variable, if it isn't a positive integer.
+    """
+    value = os.environ.get(SIZE_VARIABLE, "")
+    if not value:
+        return DEFAULT_MAX_ENTRIES
+    try:
+        max_entries = int(value)
+    except ValueError:
+        max_entries = 0
+    if max_entries < 1:
+        raise ValueError(f"{SIZE_VARIABLE} must be a positive number of entries, not {value!r}")
+    return max_entries
+
+
+class PersistentAnnotationCache:
+    """
+    On-disk cache of the annotations found in a module, keyed by content.
+
+    Each entry is a JSON file named after the hash of the module source, the annotation configuration file, and
+    the edx-lint and code_annotations versions. Reading an entry refreshes its modification time, which is used for
+    LRU eviction.
+    """
+
+    def __init__(self, directory, max_entries=None):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._config_digests = {}
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, source, config_path):
+        """
+        Compute the cache key of a module source (bytes) searched with a configuration file.
+        """
+        if config_path not in self._config_digests:
+            with open(config_path, "rb") as config_file:
+                self._config_digests[config_path] = hashlib.sha256(config_file.read()).hexdigest()
+
+        digest = hashlib.sha256()
+        digest.update(__version__.encode("ascii"))
+        digest.update(b"\0")
+        digest.update(code_annotations.__version__.encode("ascii"))
+        digest.update(b"\0")
+        digest.update(self._config_digests[config_path].encode("ascii"))
+        digest.update(b"\0")
+        digest.update(source)
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Return the list of annotations stored under `key`, or None if there is no such entry.
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as entry:
+                annotations = json.load(entry)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return annotations
+
+    def set(self, key, annotations):
+        """
+        Store a list of annotations under `key`.
+
+        The entry is written to a temporary file first, so that concurrent pylint workers never read partial entries.
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as entry:
+                json.dump(annotations, entry)
+            os.replace(temp_path, self._path(key))
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache holds at most `max_entries` entries.
+
+        Without `max_entries`, the size is read from the environment.
+        """
+        max_entries = self.max_entries if self.max_entries is not None else max_entries_from_environment()
+        entries = []
+        try:
+            with os.scandir(self.directory) as scanner:
+                for dir_entry in scanner:
+                    if dir_entry.name.endswith(".json"):
+                        entries.append((dir_entry.stat().st_mtime, dir_entry.path))
+        except OSError:
+            return
+        if len(entries) <= max_entries:
+            return
+
+        entries.sort()
+        for _mtime, path in entries[:len(entries) - max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+
+def evict_at_exit(cache):
+    """
+    Evict the least recently used entries of a cache, reporting an invalid cache size on stderr.
+    """
+    try:
+        cache.evict()
+    except ValueError as error:
+        print(f"edx-lint: the annotation cache was not evicted: {error}", file=sys.stderr)
+
+
+PERSISTENT_ANNOTATION_CACHE = PersistentAnnotationCache(DIRECTORY) if DIRECTORY else None
+
+if PERSISTENT_ANNOTATION_CACHE is not None:
+    # Checkers are closed once per file in `pylint -j` workers, so evict when the main process is done instead.
+    atexit.register(evict_at_exit, PERSISTENT_ANNOTATION_CACHE)
@@ -2,15 +2,26 @@
 Pylint plugin: checks that feature toggles are properly annotated.
 """
 
+import array
+import bisect
+import functools
 import importlib.resources
+import io
+import os
 import re
+import tokenize
+from collections import defaultdict
 
-from astroid.nodes.node_classes import Const, Name
+from astroid.nodes.node_classes import Assign, AssignName, Attribute, Const, Dict, Name, Subscript
 from code_annotations import annotation_errors
-from code_annotations.base import AnnotationConfig
-from code_annotations.find_static import StaticSearch
-from pylint.checkers import BaseChecker, utils
-
+from pylint.checkers import BaseTokenChecker, utils
+from pylint.constants import WarningScope
+from pylint.reporters.ureports.nodes import Table
+
+from .annotations_cache import PERSISTENT_ANNOTATION_CACHE
+from .annotations_inventory import ANNOTATION_INVENTORY
+from . import call_dispatch
+from .call_dispatch import CallDispatchMixin, calls_to
 from .common import BASE_ID, check_visitors
 
 
@@ -18,9 +29,8 @@ def register_checkers(linter):
     """
     Register checkers.
     """
-    linter.register_checker(FeatureToggleChecker(linter))
+    call_dispatch.register_checkers(linter, FeatureToggleChecker(linter), FeatureToggleAnnotationChecker(linter))
     linter.register_checker(CodeAnnotationChecker(linter))
-    linter.register_checker(FeatureToggleAnnotationChecker(linter))
     linter.register_checker(SettingAnnotationChecker(linter))
 
 
@@ -38,11 +48,199 @@ def check_all_messages(msgs):
     return store_messages
 
 
+@functools.cache
+def load_annotation_config(config_filename):
+    """
+    Load a configuration file from code_annotations/contrib/config, and create its searcher.
+
+    Parsing configuration files and loading their extensions is slow, so this is done once per process, and the
+    results are shared by all annotation checkers.
+
+    Returns:
+        (config_path, config, search) tuple.
+    """
+    # code_annotations imports its extensions and their dependencies: only import it for the checkers that run.
+    from code_annotations.base import AnnotationConfig  # pylint: disable=import-outside-toplevel
+    from code_annotations.find_static import StaticSearch  # pylint: disable=import-outside-toplevel
+
+    config_path = str(importlib.resources.files("code_annotations").joinpath("contrib", "config", config_filename))
+    config = AnnotationConfig(config_path, verbosity=-1)
+    search = StaticSearch(config)
+    return config_path, config, search
+
+
+def source_from_tokens(tokens):
+    """
+    Return the source of a module rebuilt from its tokens, or None if some of its lines have no token.
+
+    Each token has the physical lines it spans, comments and docstrings included: the lines of the tokens that end on
+    new lines make up the source. Lines without any token, like a line with only a backslash continuation, are
+    missing, and so is the source then.
+    """
+    lines = []
+    for token in tokens:
+        end_row = token.end[0]
+        if end_row <= len(lines) or not token.line:
+            continue
+        *token_lines, last_line = token.line.split("\n")
+        token_lines = [line + "\n" for line in token_lines]
+        if last_line:
+            token_lines.append(last_line)
+        start_row = end_row - len(token_lines) + 1
+        if start_row > len(lines) + 1:
+            return None
+        lines.extend(token_lines[len(lines) + 1 - start_row :])
+    if not tokens or tokens[-1].type != tokenize.ENDMARKER or tokens[-1].start[0] != len(lines) + 1:
+        return None
+    return "".join(lines)
+
+
+class ModuleAnnotationCache:
+    """
+    Cache of the source and code_annotations search results of the module currently being checked.
+
+    All annotation checkers search the same module, often with the same configuration file. The module source is
+    rebuilt from the tokens pylint already read, see AnnotationTokenChecker, and annotations are extracted from it in
+    memory rather than by letting code_annotations re-open the file. Results are computed once per (module path,
+    configuration file) and shared between checkers. The cache must be cleared when leaving the module.
+
+    When a PersistentAnnotationCache is provided, results are also looked up in it and stored in it, so that unchanged
+    modules are not searched again in later runs.
+    """
+
+    def __init__(self, persistent_cache=None):
+        self.persistent_cache = persistent_cache
+        self._tokens = None
+        self._texts = {}
+        self._results = {}
+
+    def process_tokens(self, tokens):
+        """
+        Keep the tokens of the module about to be checked.
+        """
+        self._tokens = tokens
+
+    def text(self, node):
+        """
+        Return the source of a module.
+
+        It is rebuilt from the tokens of the module. The module is only read if there are no tokens, like when a
+        checker is used outside of pylint, or if they miss some lines.
+        """
+        module_path = node.path[0]
+        if module_path not in self._texts:
+            text = source_from_tokens(self._tokens) if self._tokens is not None else None
+            if text is None:
+                with node.stream() as stream:
+                    text = stream.read().decode(node.file_encoding or "UTF-8")
+            self._texts[module_path] = text
+        return self._texts[module_path]
+
+    def search(self, node, config_path, search):
+        """
+        Return the annotation search results of a module for a given configuration file.
+
+        Arguments:
+            node: the module node being checked.
+            config_path: path of the code_annotations configuration file used by `search`.
+            search: the StaticSearch instance to use on a cache miss.
+
+        Returns:
+            Dict of found annotations keyed by filename, as returned by `StaticSearch.search()`.
+        """
+        key = (node.path[0], config_path)
+        if key not in self._results:
+            self._results[key] = self._persistent_search(node, config_path, search)
+        return self._results[key]
+
+    def _persistent_search(self, node, config_path, search):
+        """
+        Search a module, going through the persistent cache if there is one.
+        """
+        if self.persistent_cache is None:
+            return self._search_source(node, search)
+
+        persistent_key = self.persistent_cache.key(self.text(node).encode("utf-8"), config_path)
+        annotations = self.persistent_cache.get(persistent_key)
+        if annotations is None:
+            all_results = self._search_source(node, search)
+            annotations = [annotation for results in all_results.values() for annotation in results]
+            self.persistent_cache.set(persistent_key, annotations)
+        return self._module_results(node, annotations)
+
+    @staticmethod
+    def _module_results(node, annotations):
+        """
+        Return the search results of a module made of `annotations`, whether they were searched or cached.
+
+        The same content may live in another file: annotation filenames are the name of the searched module.
+        """
+        if not annotations:
+            return {}
+        filename = os.path.basename(node.path[0])
+        for annotation in annotations:
+            annotation["filename"] = filename
+        return {filename: annotations}
+
+    def _search_source(self, node, search):
+        """
+        Run the search extensions of `search` on the in-memory source of a module.
+
+        This mirrors `StaticSearch._search_one_file()`, minus the file I/O.
+        """
+        config = search.config
+        # This is a hack to avoid re-creating AnnotationConfig every time
+        config.source_path = node.path[0]
+
+        all_results = {}
+        filename_extension = os.path.splitext(config.source_path)[1][1:]
+        if not any(filename_extension in extensions for extensions in config.extensions.values()):
+            return all_results
+
+        file_handle = io.StringIO(self.text(node), newline=None)
+        file_handle.name = config.source_path
+        results = config.mgr.map(search.search_extension, file_handle, config.extensions, filename_extension)
+        search.format_file_results(all_results, [result for _, result in results])
+        return all_results
+
+    def clear(self):
+        """
+        Forget everything about the current module.
+        """
+        self._tokens = None
+        self._texts.clear()
+        self._results.clear()
+
+
+MODULE_ANNOTATION_CACHE = ModuleAnnotationCache(PERSISTENT_ANNOTATION_CACHE)
+
+
+class AnnotationTokenChecker(BaseTokenChecker):
+    """
+    Base class of the checkers that read the source of modules through MODULE_ANNOTATION_CACHE.
+
+    Pylint tokenizes each module before walking it, and gives the tokens to the token checkers: they are kept for the
+    cache, so that modules aren't read again.
+    """
+
+    def create_message_definition_from_tuple(self, msgid, msg_tuple):
+        # The messages of token checkers default to line messages: those of these checkers are reported on nodes.
+        if len(msg_tuple) == 3:
+            msg_tuple = (*msg_tuple, {"scope": WarningScope.NODE})
+        return super().create_message_definition_from_tuple(msgid, msg_tuple)
+
+    def process_tokens(self, tokens):
+        MODULE_ANNOTATION_CACHE.process_tokens(tokens)
+
+
 class AnnotationLines:
     """
     AnnotationLines provides utility methods to work with a string in terms of
     lines.  As an example, it can convert a Call node into a list of its contents
     separated by line breaks.
+
+    The offsets of the lines are only computed the first time a line is
+    requested.
     """
 
     # Regex searches for annotations like: # .. toggle
@@ -53,14 +251,8 @@ class AnnotationLines:
         Arguments:
             module_node: The visited module node.
         """
-        module_as_binary = module_node.stream().read()
-
-        file_encoding = module_node.file_encoding
-        if file_encoding is None:
-            file_encoding = "UTF-8"
-
-        module_as_string = module_as_binary.decode(file_encoding)
-        self._list_of_string_lines = module_as_string.split("\n")
+        self._module_text = MODULE_ANNOTATION_CACHE.text(module_node)
+        self._line_offsets = None
 
     def is_line_annotated(self, line_number):
         """
@@ -71,21 +263,79 @@ class AnnotationLines:
 
         return bool(self._ANNOTATION_REGEX.match(self._get_line_contents(line_number)))
 
+    def _get_line_offsets(self):
+        """
+        Gets the offset of the start of each line, followed by the offset just past the end of the last line.
+        """
+        if self._line_offsets is None:
+            line_offsets = array.array("q", [0])
+            find = self._module_text.find
+            newline = find("\n")
+            while newline != -1:
+                line_offsets.append(newline + 1)
+                newline = find("\n", newline + 1)
+            line_offsets.append(len(self._module_text) + 1)
+            self._line_offsets = line_offsets
+        return self._line_offsets
+
     def _line_count(self):
         """
         Gets the number of lines in the string.
         """
-        return len(self._list_of_string_lines)
+        return len(self._get_line_offsets()) - 1
 
     def _get_line_contents(self, line_number):
         """
         Gets the line of text designated by the provided line number.
         """
-        return self._list_of_string_lines[line_number - 1]
+        line_offsets = self._get_line_offsets()
+        start = line_offsets[line_number - 1]
+        end = line_offsets[line_number] - 1
+        return self._module_text[start:end]
+
+
+class AnnotationGroupIndex:
+    """
+    Index of the annotation groups of a module, by the lines that follow them.
+
+    An annotation group covers the lines from its first line up to the line before the next group. An object is
+    matched with the group covering its last line, with a bisect lookup, whatever the order in which objects are
+    visited. Each group annotates at most one object.
+    """
+
+    def __init__(self):
+        self._line_numbers = []
+        self._claimed = set()
+
+    def add(self, line_number):
+        """
+        Add an annotation group starting at `line_number`.
+        """
+        bisect.insort(self._line_numbers, line_number)
+
+    def claim(self, line_number):
+        """
+        Claim the annotation group covering `line_number`.
+
+        Returns:
+            The first line number of the group, or None if no group covers `line_number` or if it was already claimed.
+        """
+        index = bisect.bisect_right(self._line_numbers, line_number) - 1
+        if index < 0 or index in self._claimed:
+            return None
+        self._claimed.add(index)
+        return self._line_numbers[index]
+
+    def clear(self):
+        """
+        Remove all annotation groups.
+        """
+        self._line_numbers.clear()
+        self._claimed.clear()
 
 
 @check_visitors
-class FeatureToggleChecker(BaseChecker):
+class FeatureToggleChecker(CallDispatchMixin, AnnotationTokenChecker):
     """
     Checks that feature toggles are properly annotated and best practices
     are followed.
@@ -125,20 +375,28 @@ class FeatureToggleChecker(BaseChecker):
         """Parses the module code to provide access to comments."""
         self._lines = AnnotationLines(node)
 
+    def leave_module(self, _node):
+        """Releases the module code."""
+        self._lines = None
+        MODULE_ANNOTATION_CACHE.clear()
+
+    @utils.only_required_for_messages(TOGGLE_NOT_ANNOTATED_MESSAGE_ID)
+    @calls_to(name_suffixes=_WAFFLE_TOGGLE_CLASSES)
     def check_waffle_class_annotated(self, node):
         """
         Check Call node for waffle class instantiation with missing annotations.
         """
-        if not hasattr(node.func, "name"):
+        if not isinstance(node.func, Name):
             return
+        func_name = self.call_name(node)
 
         # Looking for class instantiation, so should start with a capital letter
-        starts_with_capital = self._CHECK_CAPITAL_REGEX.match(node.func.name)
+        starts_with_capital = self._CHECK_CAPITAL_REGEX.match(func_name)
         if not starts_with_capital:
             return
 
         # Search for toggle classes that require an annotation
-        if not node.func.name.endswith(self._WAFFLE_TOGGLE_CLASSES):
+        if not func_name.endswith(self._WAFFLE_TOGGLE_CLASSES):
             return
 
         if not self._lines.is_line_annotated(node.lineno - 1):
@@ -177,34 +435,86 @@ class FeatureToggleChecker(BaseChecker):
 
     def check_django_feature_flag_annotated(self, node):
         """
-        Checks dictionary definitions to see if the django feature flags
-        dict FEATURES is being set. If it is, entries should be
-        correctly annotated.
+        Checks dictionary definitions of the django feature flags dict
+        FEATURES. Entries should be correctly annotated.
+        """
+        for key, _ in node.items:
+            if not self._lines.is_line_annotated(key.lineno - 1):
+                django_feature_toggle_name = key.value
+
+                self.add_message(
+                    self.TOGGLE_NOT_ANNOTATED_MESSAGE_ID,
+                    args=(django_feature_toggle_name,),
+                    node=node,
+                )
+
+    def check_django_feature_flag_item_annotated(self, node, feature_toggle_name):
+        """
+        Checks that a single entry of the django feature flags dict FEATURES
+        is correctly annotated.
+        """
+        if not self._lines.is_line_annotated(node.lineno - 1):
+            self.add_message(
+                self.TOGGLE_NOT_ANNOTATED_MESSAGE_ID,
+                args=(feature_toggle_name,),
+                node=node,
+            )
+
+    def check_django_feature_flags_assignment(self, node):
+        """
+        Checks assignments to see if the django feature flags dict FEATURES
+        is being set, either as a whole with `FEATURES = {...}` or
+        `FEATURES |= {...}`, or one key at a time with `FEATURES["KEY"] = ...`.
         """
-        try:
-            parent_target_name = node.parent.targets[0].name
-        except AttributeError:
+        targets = node.targets if isinstance(node, Assign) else [node.target]
+        for target in targets:
+            if self._is_features_name(target):
+                if isinstance(node.value, Dict):
+                    self.check_django_feature_flag_annotated(node.value)
+            elif isinstance(target, Subscript) and self._is_features_name(target.value):
+                if isinstance(target.slice, Const):
+                    self.check_django_feature_flag_item_annotated(node, target.slice.value)
+
+    @utils.only_required_for_messages(TOGGLE_NOT_ANNOTATED_MESSAGE_ID)
+    @calls_to(attrnames=["update"])
+    def check_django_feature_flags_update(self, node):
+        """
+        Check Call node for updates of the django feature flags dict
+        FEATURES, with `FEATURES.update({...})` or `FEATURES.update(KEY=...)`.
+        """
+        if not isinstance(node.func, Attribute) or node.func.attrname != "update":
+            return
+        if not self._is_features_name(node.func.expr):
             return
 
-        if parent_target_name == "FEATURES":
-            for key, _ in node.items:
-                if not self._lines.is_line_annotated(key.lineno - 1):
-                    django_feature_toggle_name = key.value
+        for arg in node.args:
+            if isinstance(arg, Dict):
+                self.check_django_feature_flag_annotated(arg)
+        for keyword in node.keywords or ():
+            if keyword.arg is not None:
+                self.check_django_feature_flag_item_annotated(keyword, keyword.arg)
 
-                    self.add_message(
-                        self.TOGGLE_NOT_ANNOTATED_MESSAGE_ID,
-                        args=(django_feature_toggle_name,),
-                        node=node,
-                    )
+    @staticmethod
+    def _is_features_name(node):
+        """
+        Is this node the FEATURES name?
+        """
+        return isinstance(node, (AssignName, Name)) and node.name == "FEATURES"
 
+    @utils.only_required_for_messages(ILLEGAL_WAFFLE_MESSAGE_ID)
+    @calls_to(names=_ILLEGAL_WAFFLE_FUNCTIONS, attrnames=_ILLEGAL_WAFFLE_FUNCTIONS)
     def check_illegal_waffle_usage(self, node):
         """
-        Check Call node for illegal waffle calls.
+        Check Call node for illegal waffle calls, such as `flag_is_active(...)` or `waffle.flag_is_active(...)`.
         """
-        if not hasattr(node.func, "name"):
+        if isinstance(node.func, Name):
+            func_name = self.call_name(node)
+        elif isinstance(node.func, Attribute) and self.import_aliases(node).resolve(node.func.expr) == "waffle":
+            func_name = node.func.attrname
+        else:
             return
 
-        if node.func.name in self._ILLEGAL_WAFFLE_FUNCTIONS:
+        if func_name in self._ILLEGAL_WAFFLE_FUNCTIONS:
             feature_toggle_name = "UNKNOWN"
             if len(node.args) >= 1:
                 feature_toggle_name = node.args[0].as_string()
@@ -213,14 +523,6 @@ class FeatureToggleChecker(BaseChecker):
                 self.ILLEGAL_WAFFLE_MESSAGE_ID, args=(feature_toggle_name,), node=node
             )
 
-    @utils.only_required_for_messages(TOGGLE_NOT_ANNOTATED_MESSAGE_ID, ILLEGAL_WAFFLE_MESSAGE_ID)
-    def visit_call(self, node):
-        """
-        Performs various checks on Call nodes.
-        """
-        self.check_waffle_class_annotated(node)
-        self.check_illegal_waffle_usage(node)
-
     @utils.only_required_for_messages(TOGGLE_NOT_ANNOTATED_MESSAGE_ID)
     def visit_classdef(self, node):
         """
@@ -230,47 +532,96 @@ class FeatureToggleChecker(BaseChecker):
         self.check_configuration_model_annotated(node)
 
     @utils.only_required_for_messages(TOGGLE_NOT_ANNOTATED_MESSAGE_ID)
-    def visit_dict(self, node):
+    def visit_assign(self, node):
         """
-        Checks Dict nodes in case a Django FEATURES dictionary is being
-        initialized.
+        Checks assignments in case a Django FEATURES dictionary is being
+        initialized or modified.
         """
-        self.check_django_feature_flag_annotated(node)
+        self.check_django_feature_flags_assignment(node)
+
+    @utils.only_required_for_messages(TOGGLE_NOT_ANNOTATED_MESSAGE_ID)
+    def visit_augassign(self, node):
+        """
+        Checks augmented assignments in case a Django FEATURES dictionary is
+        being merged with another one.
+        """
+        self.check_django_feature_flags_assignment(node)
 
 
 @check_visitors
-class AnnotationBaseChecker(BaseChecker):
+class AnnotationBaseChecker(AnnotationTokenChecker):
     """
     Code annotation checkers should almost certainly inherit from this class.
 
     The CONFIG_FILENAMES class attribute is a list of str filenames located in code_annotations/contrib/config.
+
+    Modules are prefiltered: if a module contains none of the annotation tokens of the configuration files, nor any of
+    the strings in the PREFILTER_TOKENS class attribute, the checker skips it. PREFILTER_TOKENS should list the
+    strings that the other visitors of the checker look for, such as class names. The number of skipped modules is
+    reported with `--reports=y`, in the report whose id is PREFILTER_REPORT_ID.
+
+    Checkers that set the DUPLICATE_DEFINITION_MESSAGE_ID class attribute record the names defined by annotation
+    groups with `record_definition()`. Names that are defined in more than one module are reported when the checker
+    is closed. With `pylint -j`, the definitions found by each worker are merged first, with get_map_data() and
+    reduce_map_data().
     """
 
-    # Override this in child classes
+    # Override these in child classes
     CONFIG_FILENAMES = []
+    PREFILTER_TOKENS = []
+    PREFILTER_REPORT_ID = None
+    DUPLICATE_DEFINITION_MESSAGE_ID = None
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.config_search = []
-        for config_filename in self.CONFIG_FILENAMES:
-            config_path = str(
-                importlib.resources.files("code_annotations").joinpath(
-                    "contrib", "config", config_filename
-                )
-            )
-            config = AnnotationConfig(config_path, verbosity=-1)
-            search = StaticSearch(config)
-            self.config_search.append((config, search))
-            self.current_module_annotations = []
+        self.current_module_annotations = []
+        self.current_module_matches_prefilter = True
+        self.prefilter_stats = {"checked": set(), "skipped": set()}
+        self.definitions = defaultdict(set)
+        if self.PREFILTER_REPORT_ID:
+            self.reports = ((self.PREFILTER_REPORT_ID, f"{self.name} prefilter", self.report_prefilter),)
+
+    @functools.cached_property
+    def config_search(self):
+        """
+        The (config_path, config, search) tuples of the configuration files.
+
+        They are loaded when the checker first checks a module, so that checkers whose messages are all disabled never
+        load them.
+        """
+        return [load_annotation_config(config_filename) for config_filename in self.CONFIG_FILENAMES]
+
+    @functools.cached_property
+    def prefilter_tokens(self):
+        """
+        The strings that a module must contain for the checker to check it.
+        """
+        prefilter_tokens = set(self.PREFILTER_TOKENS)
+        for _config_path, config, _search in self.config_search:
+            prefilter_tokens.update(config.annotation_tokens)
+        return sorted(prefilter_tokens)
+
+    def matches_prefilter(self, node):
+        """
+        Return whether the source of a module contains any of the prefilter tokens.
+        """
+        text = MODULE_ANNOTATION_CACHE.text(node)
+        return any(token in text for token in self.prefilter_tokens)
 
     def check_module(self, node):
         """
         Perform checks on all annotation groups for this module.
+
+        Search results are shared with the other annotation checkers through MODULE_ANNOTATION_CACHE.
         """
-        for config, search in self.config_search:
-            # This is a hack to avoid re-creating AnnotationConfig every time
-            config.source_path = node.path[0]
-            all_results = search.search()
+        self.current_module_matches_prefilter = self.matches_prefilter(node)
+        if not self.current_module_matches_prefilter:
+            self.prefilter_stats["skipped"].add(node.path[0])
+            return
+        self.prefilter_stats["checked"].add(node.path[0])
+
+        for config_path, _config, search in self.config_search:
+            all_results = MODULE_ANNOTATION_CACHE.search(node, config_path, search)
 
             for _file_name, results in all_results.items():
                 for annotations_group in search.iter_groups(results):
@@ -279,6 +630,54 @@ class AnnotationBaseChecker(BaseChecker):
 
     def leave_module(self, _node):
         self.current_module_annotations.clear()
+        self.current_module_matches_prefilter = True
+        MODULE_ANNOTATION_CACHE.clear()
+
+    def open(self):
+        self.prefilter_stats = {"checked": set(), "skipped": set()}
+        self.definitions = defaultdict(set)
+
+    def close(self):
+        """
+        Report the names defined in more than one module.
+        """
+        if not self.DUPLICATE_DEFINITION_MESSAGE_ID:
+            return
+        for name, locations in sorted(self.definitions.items()):
+            if len({module_path for module_path, _line_number in locations}) < 2:
+                continue
+            formatted_locations = ", ".join(
+                f"{os.path.relpath(module_path)}:{line_number}" for module_path, line_number in sorted(locations)
+            )
+            self.add_message(self.DUPLICATE_DEFINITION_MESSAGE_ID, args=(name, formatted_locations))
+
+    def get_map_data(self):
+        return {"prefilter_stats": self.prefilter_stats, "definitions": dict(self.definitions)}
+
+    def reduce_map_data(self, linter, data):
+        # Sets rather than counts or lists are merged: pylint workers may hold several instances of the same checker.
+        for worker_data in data:
+            for key, module_paths in worker_data["prefilter_stats"].items():
+                self.prefilter_stats[key].update(module_paths)
+            for name, locations in worker_data["definitions"].items():
+                self.definitions[name].update(locations)
+        self.close()
+
+    def record_definition(self, name, node, line_number):
+        """
+        Record that an annotation group of a module defines `name`.
+        """
+        if name:
+            self.definitions[name].add((node.path[0], line_number))
+
+    def report_prefilter(self, sect, _stats, _old_stats):
+        """
+        Make a layout with the number of modules checked and skipped thanks to the prefilter.
+        """
+        lines = ["", "modules"]
+        for key in ["checked", "skipped"]:
+            lines += [key, str(len(self.prefilter_stats[key]))]
+        sect.append(Table(children=lines, cols=2, rheaders=1, cheaders=1))
 
     def check_annotation_group(self, search, annotations, node):
         raise NotImplementedError
@@ -297,6 +696,7 @@ class CodeAnnotationChecker(AnnotationBaseChecker):
     CodeAnnotationChecker.CONFIG_FILENAMES (see AnnotationBaseChecker docs).
     """
     CONFIG_FILENAMES = ["feature_toggle_annotations.yaml", "setting_annotations.yaml"]
+    PREFILTER_REPORT_ID = "RP%d50" % BASE_ID
     name = "code-annotations"
     msgs = {
         ("E%d%d" % (BASE_ID, index + 50)): (
@@ -323,15 +723,18 @@ class CodeAnnotationChecker(AnnotationBaseChecker):
                 node=node,
                 line=annotation["line_number"],
             )
+        # The search is shared by all checkers: don't leave errors behind for the next annotation group.
         search.annotation_errors.clear()
+        search.errors.clear()
 
 
-class FeatureToggleAnnotationChecker(AnnotationBaseChecker):
+class FeatureToggleAnnotationChecker(CallDispatchMixin, AnnotationBaseChecker):
     """
     Parse feature toggle annotations and ensure best practices are followed.
     """
 
     CONFIG_FILENAMES = ["feature_toggle_annotations.yaml"]
+    PREFILTER_REPORT_ID = "RP%d60" % BASE_ID
 
     name = "toggle-annotations"
 
@@ -341,6 +744,8 @@ class FeatureToggleAnnotationChecker(AnnotationBaseChecker):
     NON_BOOLEAN_DEFAULT_VALUE = "toggle-non-boolean-default-value"
     MISSING_ANNOTATION = "toggle-missing-annotation"
     INVALID_DJANGO_WAFFLE_IMPORT = "invalid-django-waffle-import"
+    DUPLICATE_NAME_MESSAGE_ID = "toggle-duplicate-name"
+    DUPLICATE_DEFINITION_MESSAGE_ID = DUPLICATE_NAME_MESSAGE_ID
 
     msgs = {
         ("E%d60" % BASE_ID): (
@@ -379,6 +784,11 @@ class FeatureToggleAnnotationChecker(AnnotationBaseChecker):
                 " edx_toggles.toggles.",
             )
         ),
+        ("R%d66" % BASE_ID): (
+            "feature toggle (%s) is annotated in several modules: %s",
+            DUPLICATE_NAME_MESSAGE_ID,
+            "Feature toggle names must be unique across modules",
+        ),
     }
 
     TOGGLE_FUNC_NAMES = [
@@ -390,10 +800,12 @@ class FeatureToggleAnnotationChecker(AnnotationBaseChecker):
         "ExperimentWaffleFlag",
     ]
 
+    PREFILTER_TOKENS = [*TOGGLE_FUNC_NAMES, "waffle"]
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.current_module_annotated_toggle_names = set()
-        self.current_module_annotation_group_line_numbers = []
+        self.current_module_annotation_group_index = AnnotationGroupIndex()
 
     @check_all_messages(msgs)
     def visit_module(self, node):
@@ -402,9 +814,10 @@ class FeatureToggleAnnotationChecker(AnnotationBaseChecker):
         """
         self.check_module(node)
 
-    def leave_module(self, _node):
+    def leave_module(self, node):
+        super().leave_module(node)
         self.current_module_annotated_toggle_names.clear()
-        self.current_module_annotation_group_line_numbers.clear()
+        self.current_module_annotation_group_index.clear()
 
     def check_annotation_group(self, search, annotations, node):
         """
@@ -422,7 +835,7 @@ class FeatureToggleAnnotationChecker(AnnotationBaseChecker):
         for annotation in annotations:
             if line_number is None:
                 line_number = annotation["line_number"]
-                self.current_module_annotation_group_line_numbers.append(line_number)
+                self.current_module_annotation_group_index.add(line_number)
             if annotation["annotation_token"] == ".. toggle_name:":
                 toggle_name = annotation["annotation_data"]
                 self.current_module_annotated_toggle_names.add(toggle_name)
@@ -464,11 +877,26 @@ class FeatureToggleAnnotationChecker(AnnotationBaseChecker):
                 line=line_number,
             )
 
+        self.record_definition(toggle_name, node, line_number)
+        if ANNOTATION_INVENTORY is not None:
+            ANNOTATION_INVENTORY.add("toggle", toggle_name, node.path[0], annotations)
+
+    def close(self):
+        """
+        Close the inventory file, which is opened again if another module is linted.
+        """
+        super().close()
+        if ANNOTATION_INVENTORY is not None:
+            ANNOTATION_INVENTORY.close()
+
     @utils.only_required_for_messages(MISSING_ANNOTATION)
-    def visit_call(self, node):
+    @calls_to(names=TOGGLE_FUNC_NAMES)
+    def check_call(self, node):
         """
         Check for missing annotations.
         """
+        if not self.current_module_matches_prefilter:
+            return
         if self.is_annotation_missing(node):
             self.add_message(
                 self.MISSING_ANNOTATION,
@@ -497,19 +925,13 @@ class FeatureToggleAnnotationChecker(AnnotationBaseChecker):
         """
         if (
             not isinstance(node.func, Name)
-            or node.func.name not in self.TOGGLE_FUNC_NAMES
+            or self.call_name(node) not in self.TOGGLE_FUNC_NAMES
         ):
             return False
 
-        if not self.current_module_annotation_group_line_numbers:
-            # There are no annotations left
-            return True
-
-        annotation_line_number = self.current_module_annotation_group_line_numbers[0]
-        if annotation_line_number > node.tolineno:
-            # The next annotation is located after the current node
+        if self.current_module_annotation_group_index.claim(node.tolineno) is None:
+            # There is no annotation above the current node, or it already annotates another toggle
             return True
-        self.current_module_annotation_group_line_numbers.pop(0)
 
         # Check literal toggle name arguments
         if node.args and isinstance(node.args[0], Const) and isinstance(node.args[0].value, str):
@@ -525,6 +947,7 @@ class SettingAnnotationChecker(AnnotationBaseChecker):
     """
 
     CONFIG_FILENAMES = ["setting_annotations.yaml"]
+    PREFILTER_REPORT_ID = "RP%d70" % BASE_ID
 
     name = "setting-annotations"
 
@@ -570,3 +993,14 @@ class SettingAnnotationChecker(AnnotationBaseChecker):
                 node=node,
                 line=line_number,
             )
+
+        if ANNOTATION_INVENTORY is not None:
+            ANNOTATION_INVENTORY.add("setting", setting_name, node.path[0], annotations)
+
+    def close(self):
+        """
+        Close the inventory file, which is opened again if another module is linted.
+        """
+        super().close()
+        if ANNOTATION_INVENTORY is not None:
+            ANNOTATION_INVENTORY.close()
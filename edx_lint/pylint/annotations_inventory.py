@@ -0,0 +1,90 @@
+"""Inventory of feature toggle and setting annotations, written while linting.
+
+The toggle and setting annotation checkers already find and validate every
+annotation group, so the same pylint run can produce the inventory that would
+otherwise require a separate code_annotations pass.
+
+To use, define an environment variable EDX_LINT_ANNOTATIONS_INVENTORY with the
+name of a file to append JSON lines to:
+
+    export EDX_LINT_ANNOTATIONS_INVENTORY=annotations.jsonl
+
+Each line describes one annotation group, for instance::
+
+    {"kind": "toggle", "name": "MY_FLAG", "filename": "lms/envs/common.py", "line_number": 12,
+     "annotations": {"toggle_name": "MY_FLAG", "toggle_default": "False", ...}}
+
+Annotations are only inventoried by checkers that run, so at least one message
+of the toggle-annotations and setting-annotations checkers must be enabled.
+
+Each line is written with a single append-mode write, so `pylint -j` workers
+can share the file. Delete the file before linting to start a new inventory.
+
+"""
+
+import json
+import os
+
+FILENAME = os.environ.get("EDX_LINT_ANNOTATIONS_INVENTORY", "")
+
+
+class AnnotationInventory:
+    """
+    Append-only JSON lines file of annotation groups.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._fd = None
+        self._current_module_path = None
+        self._current_module_groups = set()
+
+    def add(self, kind, name, module_path, annotations):
+        """
+        Write an annotation group to the inventory.
+
+        Arguments:
+            kind: the kind of annotations, such as "toggle" or "setting".
+            name: the name of the toggle or setting.
+            module_path: path of the module where the annotations were found.
+            annotations: the group of annotation dicts found by code_annotations.
+        """
+        line_number = annotations[0]["line_number"]
+        # Pylint workers sometimes run several instances of the same checker: only write each group once.
+        if module_path != self._current_module_path:
+            self._current_module_path = module_path
+            self._current_module_groups.clear()
+        if (kind, line_number) in self._current_module_groups:
+            return
+        self._current_module_groups.add((kind, line_number))
+
+        record = {
+            "kind": kind,
+            "name": name,
+            "filename": module_path,
+            "line_number": line_number,
+            "annotations": {
+                annotation["annotation_token"].strip(".: "): annotation["annotation_data"]
+                for annotation in annotations
+            },
+        }
+        self._write((json.dumps(record) + "\n").encode("utf-8"))
+
+    def close(self):
+        """
+        Close the inventory file.
+        """
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _write(self, data):
+        """
+        Append data to the file with a single write, which other processes' writes can't be interleaved with.
+        """
+        if self._fd is None:
+            self._fd = os.open(self.filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        os.write(self._fd, data)
+
+
+ANNOTATION_INVENTORY = AnnotationInventory(FILENAME) if FILENAME else None
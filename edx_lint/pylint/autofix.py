@@ -0,0 +1,294 @@
+"""Fixes for the edx-lint messages that can be fixed mechanically.
+
+`edx_lint fix` runs pylint with the project's configuration and the fix
+collector below enabled. Once the configuration is loaded, only the fixable
+messages it enables are kept, or the ones asked for on the command line. The
+checkers of those messages then describe how to fix each message they emit, as
+edits of the module source: byte offsets and replacement text. Once pylint is
+done, the edits of each file are applied in a single pass, and each file is
+rewritten at most once.
+
+A fix is made of one or more edits, which are applied together or not at all.
+The fixes of the messages listed first in FIXABLE_MESSAGES are applied first,
+and fixes that overlap a fix applied before them are left for another run. So
+`self.assertFalse(a is None)` first becomes `self.assertIsNotNone(a)`, and then
+`assert a is not None`. Fixes are only collected for messages that are
+reported, so `# pylint: disable` comments also prevent fixes.
+
+"""
+
+import ast
+import bisect
+import collections
+import contextlib
+import io
+import re
+import tokenize
+
+from astroid import nodes
+from pylint.exceptions import UnknownMessageError
+
+# The messages `edx_lint fix` can fix, with the plugin reporting them, in the order their fixes are applied.
+FIXABLE_MESSAGES = {
+    "simplifiable-range": "edx_lint.pylint",
+    "literal-used-as-attribute": "edx_lint.pylint",
+    "wrong-assert-type": "edx_lint.pylint",
+    "avoid-unittest-asserts": "edx_lint.pylint.unittest_assert",
+}
+
+# Expressions that never need parentheses around them to be an operand.
+ATOMS = (
+    nodes.Attribute,
+    nodes.Call,
+    nodes.Const,
+    nodes.Dict,
+    nodes.DictComp,
+    nodes.GeneratorExp,
+    nodes.JoinedStr,
+    nodes.List,
+    nodes.ListComp,
+    nodes.Name,
+    nodes.Set,
+    nodes.SetComp,
+    nodes.Subscript,
+    nodes.Tuple,
+)
+
+# The position of each message in the order of the fixes, the fixes of other messages come last.
+FIX_ORDER = {msgid: index for index, msgid in enumerate(FIXABLE_MESSAGES)}
+
+Edit = collections.namedtuple("Edit", "start end text")
+
+Fix = collections.namedtuple("Fix", "msgid line edits")
+
+FixResult = collections.namedtuple("FixResult", "path fixed skipped error")
+
+
+class SourceFixes:
+    """
+    The source of one module, and the fixes to apply to it.
+
+    Offsets are in bytes, like the column offsets of astroid nodes.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as source_file:
+            self.source = source_file.read()
+        self.line_offsets = [0]
+        for line in self.source.splitlines(keepends=True):
+            self.line_offsets.append(self.line_offsets[-1] + len(line))
+        self.fixes = []
+
+    def start(self, node):
+        """The offset of the start of a node."""
+        return self.line_offsets[node.lineno - 1] + node.col_offset
+
+    def end(self, node):
+        """The offset of the end of a node."""
+        return self.line_offsets[node.end_lineno - 1] + node.end_col_offset
+
+    def text(self, start, end=None):
+        """
+        The source text between two offsets, or of a node.
+        """
+        if end is None:
+            start, end = self.start(start), self.end(start)
+        return self.source[start:end].decode("utf-8")
+
+    def operand(self, node):
+        """
+        The source text of a node, in parentheses if it could bind to the operators around it.
+        """
+        text = self.text(node)
+        if isinstance(node, ATOMS):
+            return text
+        return f"({text})"
+
+    def code(self, start, end):
+        """
+        The source between two offsets, with its comments blanked out.
+
+        Only meant for the punctuation between nodes: indexes in the returned text are offsets in the source.
+        """
+        return re.sub(rb"#[^\r\n]*", lambda match: b" " * len(match.group()), self.source[start:end]).decode("utf-8")
+
+    def bare_arguments(self, call, count):
+        """
+        Are the first `count` arguments of a call written without parentheses or comments
+        around them, and none of them unpacked with `*`?
+
+        The source of those arguments can then be replaced with other arguments.
+        """
+        if any(isinstance(argument, nodes.Starred) for argument in call.args[:count]):
+            return False
+        offsets = [self.end(call.func)]
+        for argument in call.args[:count]:
+            offsets += [self.start(argument), self.end(argument)]
+        separators = [self.text(start, end).strip() for start, end in zip(offsets[::2], offsets[1::2])]
+        closing = self.text(offsets[-1], self.end(call)).lstrip()
+        return separators[0] == "(" and all(sep == "," for sep in separators[1:]) and closing[:1] in (",", ")")
+
+    def has_comment(self, start, end):
+        """
+        Is there a comment between two offsets? Source that can't be tokenized is assumed to have one.
+        """
+        text = self.source[start:end]
+        if b"#" not in text:
+            return False
+        try:
+            tokens = list(tokenize.tokenize(io.BytesIO(text).readline))
+        except (tokenize.TokenError, SyntaxError):
+            return True
+        return any(token.type == tokenize.COMMENT for token in tokens)
+
+    def add(self, fix):
+        """Add a fix, unless the same fix was already added."""
+        if fix not in self.fixes:
+            self.fixes.append(fix)
+
+    def fixed_source(self):
+        """
+        Apply the fixes that don't overlap each other, in the order of their messages, and then of their positions.
+
+        Returns the fixed source and the number of fixes applied and skipped.
+        """
+        # The offsets of the edits applied so far, sorted by start.
+        starts, ends = [], []
+        applied = []
+        skipped = 0
+        fixes = sorted(
+            self.fixes,
+            key=lambda fix: (FIX_ORDER.get(fix.msgid, len(FIX_ORDER)), min(edit.start for edit in fix.edits)),
+        )
+        for fix in fixes:
+            if any(_overlaps(edit, starts, ends) for edit in fix.edits):
+                skipped += 1
+                continue
+            for edit in fix.edits:
+                index = bisect.bisect(starts, edit.start)
+                starts.insert(index, edit.start)
+                ends.insert(index, edit.end)
+            applied.extend(fix.edits)
+
+        pieces = []
+        offset = 0
+        for edit in sorted(applied):
+            pieces.append(self.source[offset:edit.start])
+            pieces.append(edit.text.encode("utf-8"))
+            offset = edit.end
+        pieces.append(self.source[offset:])
+        return b"".join(pieces), len(self.fixes) - skipped, skipped
+
+
+def _overlaps(edit, starts, ends):
+    """
+    Does an edit overlap one of the edits between `starts` and `ends`? Insertions at the same offset overlap too.
+    """
+    index = bisect.bisect_left(starts, edit.start)
+    if index > 0 and ends[index - 1] > edit.start:
+        return True
+    if index < len(starts) and (starts[index] < edit.end or starts[index] == edit.start):
+        return True
+    return False
+
+
+class NothingToFix(Exception):
+    """Raised when the pylint configuration enables none of the fixable messages."""
+
+
+class FixCollector:
+    """
+    The fixes of all the modules linted, by path.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.messages = None
+        self.files = {}
+
+    @contextlib.contextmanager
+    def collecting(self, messages=None):
+        """
+        Collect fixes while in the context, and forget them when leaving it.
+
+        `messages` are the messages to fix, by default the fixable messages the pylint configuration enables.
+        """
+        self.enabled = True
+        self.messages = messages
+        try:
+            yield self
+        finally:
+            self.enabled = False
+            self.messages = None
+            self.files = {}
+
+    def load_configuration(self, linter):
+        """
+        Once pylint's configuration is loaded, only enable the messages to fix.
+
+        Raises NothingToFix if the configuration enables none of the fixable messages, before pylint gives up on
+        linting without any enabled message.
+        """
+        if not self.enabled:
+            return
+        if self.messages is None:
+            self.messages = [
+                msgid for msgid in FIXABLE_MESSAGES if _is_known(linter, msgid) and linter.is_message_enabled(msgid)
+            ]
+            if not self.messages:
+                raise NothingToFix()
+        linter.disable("all")
+        for msgid in self.messages:
+            linter.enable(msgid)
+
+    def source(self, node):
+        """
+        The SourceFixes of the module of a node.
+        """
+        path = node.root().file
+        source = self.files.get(path)
+        if source is None:
+            source = self.files[path] = SourceFixes(path)
+        return source
+
+    def add(self, checker, msgid, node, edits):
+        """
+        Add the fix of a message a checker reported on a node, unless the message is disabled on the node's line.
+        """
+        line = node.fromlineno
+        if checker.linter.is_message_enabled(msgid, line):
+            self.source(node).add(Fix(msgid, line, tuple(edits)))
+
+    def apply(self):
+        """
+        Rewrite the files that have fixes, once each.
+
+        Files are not rewritten if their fixed source would not parse anymore. Returns a FixResult for each file.
+        """
+        results = []
+        for path, source in sorted(self.files.items()):
+            if not source.fixes:
+                continue
+            fixed_source, fixed, skipped = source.fixed_source()
+            try:
+                ast.parse(fixed_source, filename=path)
+            except SyntaxError as error:
+                results.append(FixResult(path, 0, fixed + skipped, error))
+                continue
+            with open(path, "wb") as source_file:
+                source_file.write(fixed_source)
+            results.append(FixResult(path, fixed, skipped, None))
+        return results
+
+
+def _is_known(linter, msgid):
+    """Is a message defined by a checker of the linter? Plugins that aren't loaded don't define theirs."""
+    try:
+        linter.msgs_store.get_message_definitions(msgid)
+    except UnknownMessageError:
+        return False
+    return True
+
+
+FIXES = FixCollector()
@@ -0,0 +1,223 @@
+"""Dispatch of Call nodes to the edx-lint checkers interested in them.
+
+Pylint calls every `visit_call` method of every checker for every Call node.
+Most edx-lint checkers only care about a handful of callee names, so instead of
+defining `visit_call`, they inherit from `CallDispatchMixin` and declare the
+calls they handle with `calls_to`:
+
+    @utils.only_required_for_messages(MESSAGE_ID)
+    @calls_to(names=["range", "xrange"])
+    def check_call(self, node):
+        ...
+
+The checkers are registered with `register_checkers()` of this module, which
+also registers a CallDispatchChecker, the only one with a `visit_call`. It
+finds the interested methods with one dict lookup on
+the callee name (for `name(...)` calls) or attribute name (for `obj.name(...)`
+calls). Callee names are also looked up as they were imported, so a method
+handling `gettext` also handles `_t(...)` after
+`from django.utils.translation import gettext as _t`; `call_name` returns that
+name to the methods. Methods can also ask for calls by qualified name, such as
+`yaml.load`, which are resolved through the import aliases of the module.
+
+"""
+
+import functools
+
+from astroid.nodes.node_classes import Attribute, Name
+from pylint.checkers import BaseChecker
+
+from .import_aliases import ImportAliases
+
+
+def register_checkers(linter, *checkers):
+    """
+    Register checkers with call handlers, and the call dispatcher that calls them, unless it is registered already.
+    """
+    dispatcher = next((checker for checker in linter.get_checkers() if isinstance(checker, CallDispatchChecker)), None)
+    if dispatcher is None:
+        dispatcher = CallDispatchChecker(linter)
+        linter.register_checker(dispatcher)
+    for checker in checkers:
+        checker.call_dispatcher = dispatcher
+        dispatcher.call_checkers.append(checker)
+        linter.register_checker(checker)
+
+
+def calls_to(names=(), attrnames=(), name_suffixes=(), qualnames=()):
+    """
+    Decorator to declare which calls a checker method handles.
+
+    Arguments:
+        names: callee names of `name(...)` calls, as written or as imported.
+        attrnames: attribute names of `obj.name(...)` calls.
+        name_suffixes: suffixes of the callee names of `name(...)` calls.
+        qualnames: qualified names of the callee, such as "yaml.load", which also matches `y.load(...)` after
+            `import yaml as y`, and `yl(...)` after `from yaml import load as yl`.
+    """
+
+    def store_calls(func):
+        func.call_names = tuple(names)
+        func.call_attrnames = tuple(attrnames)
+        func.call_name_suffixes = tuple(name_suffixes)
+        func.call_qualnames = tuple(qualnames)
+        return func
+
+    return store_calls
+
+
+@functools.cache
+def call_handler_names(checker_class):
+    """
+    Return the names of the methods of a checker class decorated with `calls_to`.
+    """
+    return [name for name in dir(checker_class) if hasattr(getattr(checker_class, name), "call_names")]
+
+
+class CallDispatcher:
+    """
+    Index of the call handlers of checkers, which `visit_call` calls for the Call nodes they handle.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name_handlers = {}
+        self.attrname_handlers = {}
+        self.name_suffix_handlers = {}
+        self.qualname_handlers = {}
+        self.attr_qualname_handlers = {}
+        self.aliases_module = None
+        self.aliases = None
+
+    def add_checker(self, checker):
+        """
+        Index the enabled call handlers of a checker.
+
+        Handlers are enabled under the same conditions as pylint's own visit methods: if they have an
+        `only_required_for_messages` list, one of its messages must be enabled.
+        """
+        for handler_name in call_handler_names(type(checker)):
+            handler = getattr(checker, handler_name)
+            msgids = getattr(handler, "checks_msgs", None)
+            if msgids is not None and not any(checker.linter.is_message_enabled(msgid) for msgid in msgids):
+                continue
+            for name in handler.call_names:
+                self.name_handlers.setdefault(name, []).append(handler)
+            for attrname in handler.call_attrnames:
+                self.attrname_handlers.setdefault(attrname, []).append(handler)
+            for suffix in handler.call_name_suffixes:
+                self.name_suffix_handlers.setdefault(len(suffix), {}).setdefault(suffix, []).append(handler)
+            for qualname in handler.call_qualnames:
+                self.qualname_handlers.setdefault(qualname, []).append(handler)
+                expr, _, attrname = qualname.rpartition(".")
+                if expr:
+                    self.attr_qualname_handlers.setdefault(attrname, {}).setdefault(expr, []).append(handler)
+
+    def clear(self):
+        """
+        Forget the handlers of all checkers.
+        """
+        self.name_handlers = {}
+        self.attrname_handlers = {}
+        self.name_suffix_handlers = {}
+        self.qualname_handlers = {}
+        self.attr_qualname_handlers = {}
+        self.aliases_module = None
+        self.aliases = None
+
+    def import_aliases(self, node):
+        """
+        Return the import aliases of the module being checked, which are tabulated once per module.
+
+        The table is kept for the module node itself: modules outside of packages with the same file name, like two
+        setup.py files, also have the same module name.
+        """
+        module = node.root()
+        if self.aliases_module is not module:
+            self.aliases_module = module
+            self.aliases = ImportAliases(module)
+        return self.aliases
+
+    def visit_call(self, node):
+        """
+        Call the handlers of this Call node, if any.
+        """
+        func = node.func
+        if isinstance(func, Name):
+            aliases = self.import_aliases(node)
+            name = aliases.imported_name(func.name)
+            handlers = self.name_handlers.get(name, ())
+            if name != func.name:
+                # Aliases are also handled under their own name, like `_` for any translation function.
+                handlers = [*handlers, *(h for h in self.name_handlers.get(func.name, ()) if h not in handlers)]
+            for handler in handlers:
+                handler(node)
+            for length, suffix_handlers in self.name_suffix_handlers.items():
+                for handler in suffix_handlers.get(name[-length:], ()):
+                    handler(node)
+            if self.qualname_handlers:
+                for handler in self.qualname_handlers.get(aliases.qualified_names.get(func.name), ()):
+                    handler(node)
+        elif isinstance(func, Attribute):
+            attrname = func.attrname
+            for handler in self.attrname_handlers.get(attrname, ()):
+                handler(node)
+            expr_handlers = self.attr_qualname_handlers.get(attrname)
+            if expr_handlers is not None:
+                for handler in expr_handlers.get(self.import_aliases(node).resolve(func.expr), ()):
+                    handler(node)
+
+
+class CallDispatchChecker(CallDispatcher, BaseChecker):
+    """
+    Not really a checker: it dispatches the Call nodes to the handlers of the checkers that run.
+
+    Pylint only runs the checkers with enabled messages, so the messages of this checker are those of the checkers
+    with call handlers, but they are only defined by their own checker.
+    """
+
+    name = "edx-lint-call-dispatch"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The checkers registered with register_checkers().
+        self.call_checkers = []
+
+    @property
+    def msgs(self):
+        return {msgid: msg for checker in self.call_checkers for msgid, msg in checker.msgs.items()}
+
+    @property
+    def messages(self):
+        return []
+
+    def open(self):
+        """Index the call handlers of the checkers that run, which are those with enabled messages."""
+        super().open()
+        self.clear()
+        for checker in self.call_checkers:
+            if any(self.linter.is_message_enabled(msgid) for msgid in checker.msgs):
+                self.add_checker(checker)
+
+    def close(self):
+        """Forget the call handlers until the next run."""
+        self.clear()
+        super().close()
+
+
+class CallDispatchMixin:
+    """
+    Mixin for checkers with `calls_to` methods, which the call dispatcher of their linter calls.
+
+    The checkers must be registered with `register_checkers()` of this module, which sets their `call_dispatcher`.
+    """
+
+    call_dispatcher = None
+
+    def import_aliases(self, node):
+        """Returns the import aliases of the module of a node being checked."""
+        return self.call_dispatcher.import_aliases(node)
+
+    def call_name(self, node):
+        """Returns the name of the function called by a `name(...)` Call node, as it was imported."""
+        return self.import_aliases(node).imported_name(node.func.name)
@@ -1,5 +1,7 @@
 """Things common to all pylint checkers."""
 
+import sys
+
 from astroid.nodes import ALL_NODE_CLASSES
 
 BASE_ID = 76
@@ -23,6 +25,18 @@ def check_visitors(cls):
     return cls
 
 
+def fix_collector():
+    """
+    The FixCollector of `edx_lint fix` if it is collecting fixes, or None.
+
+    Only `edx_lint fix` imports autofix.py: lint runs don't.
+    """
+    autofix = sys.modules.get("edx_lint.pylint.autofix")
+    if autofix is None or not autofix.FIXES.enabled:
+        return None
+    return autofix.FIXES
+
+
 def usable_class_name(node):
     """Make a reasonable class name for a class node."""
     name = node.qname()
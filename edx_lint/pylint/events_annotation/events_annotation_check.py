@@ -5,7 +5,9 @@ Pylint plugin: checks that Open edX Events are properly annotated.
 from astroid.nodes.node_classes import Name
 from pylint.checkers import utils
 
-from edx_lint.pylint.annotations_check import AnnotationBaseChecker, check_all_messages
+from edx_lint.pylint import call_dispatch
+from edx_lint.pylint.annotations_check import AnnotationBaseChecker, AnnotationGroupIndex, check_all_messages
+from edx_lint.pylint.call_dispatch import CallDispatchMixin, calls_to
 from edx_lint.pylint.common import BASE_ID
 
 
@@ -13,15 +15,16 @@ def register_checkers(linter):
     """
     Register checkers.
     """
-    linter.register_checker(EventsAnnotationChecker(linter))
+    call_dispatch.register_checkers(linter, EventsAnnotationChecker(linter))
 
 
-class EventsAnnotationChecker(AnnotationBaseChecker):
+class EventsAnnotationChecker(CallDispatchMixin, AnnotationBaseChecker):
     """
     Perform checks on events annotations.
     """
 
     CONFIG_FILENAMES = ["openedx_events_annotations.yaml"]
+    PREFILTER_REPORT_ID = "RP%d80" % BASE_ID
 
     name = "events-annotations"
 
@@ -31,6 +34,8 @@ class EventsAnnotationChecker(AnnotationBaseChecker):
     NO_STATUS_MESSAGE_ID = "event-no-status"
     NO_DESCRIPTION_MESSAGE_ID = "event-empty-description"
     MISSING_OR_INCORRECT_ANNOTATION = "missing-or-incorrect-annotation"
+    DUPLICATE_TYPE_MESSAGE_ID = "event-duplicate-type"
+    DUPLICATE_DEFINITION_MESSAGE_ID = DUPLICATE_TYPE_MESSAGE_ID
 
     msgs = {
         ("E%d80" % BASE_ID): (
@@ -61,15 +66,22 @@ class EventsAnnotationChecker(AnnotationBaseChecker):
                 " same module and with a matching type",
             )
         ),
+        ("R%d86" % BASE_ID): (
+            "Event type (%s) is annotated in several modules: %s",
+            DUPLICATE_TYPE_MESSAGE_ID,
+            "Event types must be unique across modules",
+        ),
     }
 
     EVENT_CLASS_NAMES = ["OpenEdxPublicSignal"]
 
+    PREFILTER_TOKENS = EVENT_CLASS_NAMES
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.current_module_annotated_event_types = []
         self.current_module_event_data = []
-        self.current_module_annotation_group_line_numbers = []
+        self.current_module_annotation_group_index = AnnotationGroupIndex()
         self.current_module_annotation_group_map = {}
 
     @check_all_messages(msgs)
@@ -79,8 +91,9 @@ class EventsAnnotationChecker(AnnotationBaseChecker):
         """
         self.check_module(node)
 
-    def leave_module(self, _node):
-        self.current_module_annotation_group_line_numbers.clear()
+    def leave_module(self, node):
+        super().leave_module(node)
+        self.current_module_annotation_group_index.clear()
         self.current_module_annotation_group_map.clear()
 
     def check_annotation_group(self, search, annotations, node):
@@ -98,7 +111,7 @@ class EventsAnnotationChecker(AnnotationBaseChecker):
         for annotation in annotations:
             if line_number is None:
                 line_number = annotation["line_number"]
-                self.current_module_annotation_group_line_numbers.append(line_number)
+                self.current_module_annotation_group_index.add(line_number)
                 self.current_module_annotation_group_map[line_number] = ()
             if annotation["annotation_token"] == ".. event_type:":
                 event_type = annotation["annotation_data"]
@@ -111,6 +124,8 @@ class EventsAnnotationChecker(AnnotationBaseChecker):
             if event_type and event_data and event_name:
                 self.current_module_annotation_group_map[line_number] = (event_type, event_data, event_name,)
 
+        self.record_definition(event_type, node, line_number)
+
         if not event_type:
             self.add_message(
                 self.NO_TYPE_MESSAGE_ID,
@@ -143,10 +158,13 @@ class EventsAnnotationChecker(AnnotationBaseChecker):
             )
 
     @utils.only_required_for_messages(MISSING_OR_INCORRECT_ANNOTATION)
-    def visit_call(self, node):
+    @calls_to(names=EVENT_CLASS_NAMES)
+    def check_call(self, node):
         """
         Check for missing annotations.
         """
+        if not self.current_module_matches_prefilter:
+            return
         if self._is_annotation_missing_or_incorrect(node):
             self.add_message(
                 self.MISSING_OR_INCORRECT_ANNOTATION,
@@ -168,19 +186,14 @@ class EventsAnnotationChecker(AnnotationBaseChecker):
         """
         if (
             not isinstance(node.func, Name)
-            or node.func.name not in self.EVENT_CLASS_NAMES
+            or self.call_name(node) not in self.EVENT_CLASS_NAMES
         ):
             return False
 
-        if not self.current_module_annotation_group_line_numbers:
-            # There are no annotations left
-            return True
-
-        annotation_line_number = self.current_module_annotation_group_line_numbers[0]
-        if annotation_line_number > node.tolineno:
-            # The next annotation is located after the current node
+        annotation_line_number = self.current_module_annotation_group_index.claim(node.tolineno)
+        if annotation_line_number is None:
+            # There is no annotation above the current node, or it already annotates another event
             return True
-        annotation_line_number = self.current_module_annotation_group_line_numbers.pop(0)
 
         current_annotation_group = self.current_module_annotation_group_map[annotation_line_number]
         if not current_annotation_group:
@@ -13,16 +13,19 @@ import re
 from pylint.checkers import BaseChecker, utils
 
 from edx_lint.pylint.common import BASE_ID
+from edx_lint.pylint import inference_budget
+from edx_lint.pylint.inference_budget import InferenceBudgetMixin
 
 
 def register_checkers(linter):
     """
     Register checkers.
     """
+    inference_budget.register_checkers(linter)
     linter.register_checker(FiltersDocstringFormatChecker(linter))
 
 
-class FiltersDocstringFormatChecker(BaseChecker):
+class FiltersDocstringFormatChecker(InferenceBudgetMixin, BaseChecker):
     """Pylint checker for the format of the docstrings of filters."""
 
     name = "filters-docstring-format"
@@ -31,6 +34,8 @@ class FiltersDocstringFormatChecker(BaseChecker):
     DOCSTRING_MISSING_OR_INCORRECT_TYPE = "filter-docstring-missing-or-incorrect-type"
     DOCSTRING_MISSING_TRIGGER_OR_BADLY_FORMATTED = "filter-docstring-missing-trigger"
 
+    INFERENCE_REPORT_ID = "RP%d90" % BASE_ID
+
     msgs = {
         ("E%d91" % BASE_ID): (
             "Filter's (%s) docstring is missing the required `Purpose` section or is badly formatted",
@@ -62,7 +67,13 @@ class FiltersDocstringFormatChecker(BaseChecker):
         OpenEdxPublicFilter class itself.
 
         """
-        if not node.is_subtype_of("openedx_filters.tooling.OpenEdxPublicFilter") or node.name == "OpenEdxPublicFilter":
+        if node.name == "OpenEdxPublicFilter":
+            return
+        with self.inference_budget(node) as budget:
+            ancestors = budget.values(node.ancestors())
+            if not any(anc.qname() == "openedx_filters.tooling.OpenEdxPublicFilter" for anc in ancestors):
+                return
+        if budget.exceeded:
             return
 
         docstring = node.doc_node.value if node.doc_node else ""
@@ -1,20 +1,23 @@
 """Check that getattr and setattr aren't being used with literal attribute names."""
 
+import keyword
 import re
 
 import astroid
 from pylint.checkers import BaseChecker, utils
 
-from .common import BASE_ID, check_visitors
+from . import call_dispatch
+from .call_dispatch import CallDispatchMixin, calls_to
+from .common import BASE_ID, check_visitors, fix_collector
 
 
 def register_checkers(linter):
     """Register checkers."""
-    linter.register_checker(GetSetAttrLiteralChecker(linter))
+    call_dispatch.register_checkers(linter, GetSetAttrLiteralChecker(linter))
 
 
 @check_visitors
-class GetSetAttrLiteralChecker(BaseChecker):
+class GetSetAttrLiteralChecker(CallDispatchMixin, BaseChecker):
     """
     Checks for string literals used as attribute names with getattr and
     friends. `getattr`, `setattr` and `delattr` should be used to get, set and delete attributes of object
@@ -48,22 +51,16 @@ class GetSetAttrLiteralChecker(BaseChecker):
         )
     }
 
-    @utils.only_required_for_messages(MESSAGE_ID)
-    def visit_call(self, node):
-        """Called for every function call in the source code."""
-        if not isinstance(node.func, astroid.Name):
-            # It isn't a simple name, can't deduce what function it is.
-            return
+    ARGUMENT_COUNTS = {"getattr": 2, "setattr": 3, "delattr": 2}
 
-        if node.func.name == "getattr":
+    @utils.only_required_for_messages(MESSAGE_ID)
+    @calls_to(names=["getattr", "setattr", "delattr"])
+    def check_call(self, node):
+        """Called for every call to getattr(), setattr() or delattr() in the source code."""
+        if self.call_name(node) == "getattr":
             if len(node.args) != 2:
                 # We only attend to 2-argument getattr()
                 return
-        elif node.func.name in ["setattr", "delattr"]:
-            pass
-        else:
-            # Not a function we care about.
-            return
 
         second = node.args[1]
         if isinstance(second, astroid.Const):
@@ -73,5 +70,51 @@ class GetSetAttrLiteralChecker(BaseChecker):
                 # for getattr.
                 if re.search(r"^[a-zA-Z_][a-zA-Z0-9_]*$", second.value):
                     self.add_message(self.MESSAGE_ID, args=node.func.name, node=node)
+                    self.fix_call(node, second.value)
 
         # All is well.
+
+    def fix_call(self, node, attrname):
+        """
+        Collect the fix of a call with a literal attribute name, when `edx_lint fix` runs.
+
+        getattr() calls become attribute accesses, and setattr() and delattr() calls on their own line become
+        assignment and del statements. Names that are keywords or would be mangled in a class are left alone.
+        """
+        fixes = fix_collector()
+        if fixes is None or keyword.iskeyword(attrname) or attrname.startswith("__"):
+            return
+        from .autofix import Edit  # pylint: disable=import-outside-toplevel
+
+        function_name = self.call_name(node)
+        if len(node.args) != self.ARGUMENT_COUNTS[function_name] or node.keywords:
+            return
+        if any(isinstance(argument, astroid.Starred) for argument in node.args):
+            return
+        source = fixes.source(node)
+        start, end = source.start(node), source.end(node)
+        if source.has_comment(start, end):
+            return
+
+        obj = node.args[0]
+        if isinstance(obj, astroid.Const) and not isinstance(obj.value, str):
+            # `1.real` is a syntax error.
+            attribute = f"({source.text(obj)}).{attrname}"
+        else:
+            attribute = f"{source.operand(obj)}.{attrname}"
+
+        if function_name == "getattr":
+            text = attribute
+        elif not isinstance(node.parent, astroid.Expr):
+            # setattr() and delattr() return None, so only a statement of their own can become an assignment or del.
+            return
+        elif function_name == "setattr":
+            value = node.args[2]
+            value_text = source.text(value)
+            if isinstance(value, astroid.NamedExpr) or "\n" in value_text:
+                # Arguments can span lines without parentheses, but assigned values can't.
+                value_text = source.operand(value)
+            text = f"{attribute} = {value_text}"
+        else:
+            text = f"del {attribute}"
+        fixes.add(self, self.MESSAGE_ID, node, [Edit(start, end, text)])
@@ -3,16 +3,18 @@
 import astroid
 from pylint.checkers import BaseChecker, utils
 
+from . import call_dispatch
+from .call_dispatch import CallDispatchMixin, calls_to
 from .common import BASE_ID, check_visitors
 
 
 def register_checkers(linter):
     """Register checkers."""
-    linter.register_checker(TranslationStringConstantsChecker(linter))
+    call_dispatch.register_checkers(linter, TranslationStringConstantsChecker(linter))
 
 
 @check_visitors
-class TranslationStringConstantsChecker(BaseChecker):
+class TranslationStringConstantsChecker(CallDispatchMixin, BaseChecker):
     """
     Checks for i18n translation functions (_, ugettext, ungettext, and many
     others) being called on something that isn't a string literal.
@@ -57,16 +59,9 @@ class TranslationStringConstantsChecker(BaseChecker):
     }
 
     @utils.only_required_for_messages(MESSAGE_ID)
-    def visit_call(self, node):
-        """Called for every function call in the source code."""
-        if not isinstance(node.func, astroid.Name):
-            # It isn't a simple name, can't deduce what function it is.
-            return
-
-        if node.func.name not in self.TRANSLATION_FUNCTIONS:
-            # Not a function we care about.
-            return
-
+    @calls_to(names=TRANSLATION_FUNCTIONS)
+    def check_call(self, node):
+        """Called for every call to a translation function in the source code."""
         first = node.args[0]
         if isinstance(first, astroid.Const):
             if isinstance(first.value, str):
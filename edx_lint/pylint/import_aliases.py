@@ -0,0 +1,74 @@
+"""Names bound by the imports of a module.
+
+Checkers that look for calls to a particular function by its name miss the
+calls made through an alias, such as `y.load()` after `import yaml as y`, or
+`yl()` after `from yaml import load as yl`. Resolving those with astroid
+inference is far too slow to do for every call, but the imports of a module
+can be tabulated once, from the module locals astroid already collected.
+
+"""
+
+from astroid.nodes.node_classes import Attribute, Import, ImportFrom, Name
+
+
+class ImportAliases:
+    """
+    The qualified and imported names of the module-level names bound by imports.
+
+    `import yaml as y` binds "y" to "yaml", and `from yaml import load as yl` binds "yl" to "yaml.load", imported as
+    "load". Imports in functions or classes are not taken into account, and names also assigned by other statements
+    are not aliases.
+    """
+
+    def __init__(self, module_node):
+        self.qualified_names = {}
+        self.imported_names = {}
+        for name, statements in module_node.locals.items():
+            if not all(isinstance(statement, (Import, ImportFrom)) for statement in statements):
+                continue
+            qualified_name = self._imported_name(name, statements[-1])
+            if qualified_name is not None:
+                self.qualified_names[name] = qualified_name
+                self.imported_names[name] = qualified_name.rpartition(".")[2]
+
+    @staticmethod
+    def _imported_name(name, statement):
+        """
+        Return the qualified name bound to `name` by an import statement.
+        """
+        if isinstance(statement, Import):
+            for imported, alias in statement.names:
+                if alias == name:
+                    return imported
+                if alias is None and imported.split(".", 1)[0] == name:
+                    return name
+            return None
+
+        # Relative imports from the package itself, like `from . import name`, have no module name.
+        prefix = "." * (statement.level or 0) + (statement.modname + "." if statement.modname else "")
+        for imported, alias in statement.names:
+            if (alias or imported) == name:
+                return prefix + imported
+        # The name was bound by `from module import *`.
+        return prefix + name
+
+    def resolve(self, node):
+        """
+        Return the qualified name of a Name or Attribute node, through the import aliases of its module.
+
+        Names that are not bound by imports are their own qualified name. Returns None for other expressions.
+        """
+        if isinstance(node, Name):
+            return self.qualified_names.get(node.name, node.name)
+        if isinstance(node, Attribute):
+            expr = self.resolve(node.expr)
+            if expr is not None:
+                return f"{expr}.{node.attrname}"
+        return None
+
+    def imported_name(self, name):
+        """
+        Return the name a local name was imported as, such as "gettext" for "_" after
+        `from django.utils.translation import gettext as _`. Names that are not bound by imports are returned as is.
+        """
+        return self.imported_names.get(name, name)
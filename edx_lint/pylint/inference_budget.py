@@ -0,0 +1,154 @@
+"""An inference budget for the edx-lint checkers that use astroid inference.
+
+Inference can take minutes on pathological modules. The checkers that infer
+do it within a budget for each node they check, set with the
+`edx-lint-inference-budget` option: the number of values the checker may take
+from any one of the inferences it makes for the node, like the values of an
+`infer()`, the ancestors of an `ancestors()` or the attributes of an
+`igetattr()`. When an inference yields more values than that, the checker
+gives up on the node and reports the `inference-budget-exceeded`
+informational message instead. The default budget of 0 is no budget at all.
+
+The values are counted as the checker iterates over them, not within astroid:
+the budget doesn't bound the work astroid does to infer one value, nor what it
+caches. It counts values rather than seconds so that the same code gets the
+same messages on every machine. The time each checker spends inferring is
+reported with `--reports=y`.
+
+The option and the message belong to InferenceBudgetChecker, which the
+modules of the checkers that infer register with their own checkers.
+
+"""
+
+import contextlib
+import time
+from collections import Counter
+
+from pylint.checkers import BaseChecker
+from pylint.reporters.ureports.nodes import Table
+
+from .common import BASE_ID
+from .worker_counts import WorkerCountsMixin
+
+INFERENCE_BUDGET_MESSAGE_ID = "inference-budget-exceeded"
+
+
+def register_checkers(linter):
+    """Register the checker of the inference budget, unless it is registered already."""
+    if not any(isinstance(checker, InferenceBudgetChecker) for checker in linter.get_checkers()):
+        linter.register_checker(InferenceBudgetChecker(linter))
+
+
+class InferenceBudgetChecker(BaseChecker):
+    """
+    Not really a checker: it holds the inference budget option, and the message the checkers that infer report when
+    they go over it.
+    """
+
+    name = "edx-lint-inference"
+
+    msgs = {
+        ("I%d05" % BASE_ID): (
+            "Gave up inferring for %s: more than %d values inferred",
+            INFERENCE_BUDGET_MESSAGE_ID,
+            "Used when edx-lint gives up checking a node because inferring it took more values than the "
+            "edx-lint-inference-budget option allows.",
+        ),
+    }
+
+    options = (
+        (
+            "edx-lint-inference-budget",
+            {
+                "default": 0,
+                "type": "int",
+                "metavar": "<number of values>",
+                "help": "The number of values edx-lint checkers may take from any one inference for a node they "
+                "check before giving up on it, or 0 for no limit.",
+            },
+        ),
+    )
+
+
+class InferenceBudgetExceeded(Exception):
+    """Raised when an inference yields more values than the budget allows."""
+
+
+class InferenceBudget:
+    """
+    The number of values a checker may take from any one of the inferences it makes for a node.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.exceeded = False
+
+    def values(self, inferred):
+        """
+        Iterate over the values of an inference, raising InferenceBudgetExceeded when they go over the budget.
+        """
+        for count, value in enumerate(inferred, start=1):
+            if self.limit and count > self.limit:
+                self.exceeded = True
+                raise InferenceBudgetExceeded(count)
+            yield value
+
+
+class InferenceBudgetMixin(WorkerCountsMixin):
+    """
+    Mixin for checkers that infer, to do it within the inference budget.
+
+    The modules of the checkers must call `register_checkers()` of this module too. Checkers set INFERENCE_REPORT_ID
+    to report their inference time.
+    """
+
+    INFERENCE_REPORT_ID = None
+
+    # The time spent inferring, the number of nodes inferred for, and the number given up on.
+    COUNTS = ("inference",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.inference = Counter()
+        if self.INFERENCE_REPORT_ID:
+            self.reports = (
+                *self.reports,
+                (self.INFERENCE_REPORT_ID, f"{self.name} inference", self.report_inference),
+            )
+
+    @contextlib.contextmanager
+    def inference_budget(self, node):
+        """
+        Infer for a node within the budget, iterating over inferences with `values()` of the InferenceBudget this
+        yields.
+
+        When the budget is exceeded, the rest of the `with` block is skipped and `inference-budget-exceeded` is
+        reported on the node.
+        """
+        budget = InferenceBudget(self.linter.config.edx_lint_inference_budget)
+        start = time.perf_counter()
+        try:
+            yield budget
+        except InferenceBudgetExceeded:
+            self.inference["gave up"] += 1
+            self.add_message(INFERENCE_BUDGET_MESSAGE_ID, node=node, args=(node.name, budget.limit))
+        finally:
+            self.inference["seconds"] += time.perf_counter() - start
+            self.inference["nodes"] += 1
+
+    def report_inference(self, sect, _stats, _old_stats):
+        """
+        Make a layout with the time spent inferring, and the number of nodes given up on.
+        """
+        stats = self.total("inference")
+        lines = [
+            "",
+            "inference",
+            "time",
+            f"{stats['seconds']:.3f}s",
+            "nodes",
+            str(stats["nodes"]),
+            "gave up",
+            str(stats["gave up"]),
+        ]
+        sect.append(Table(children=lines, cols=2, rheaders=1, cheaders=1))
@@ -1,44 +1,86 @@
 """Pylint plugin: test classes derived from test classes."""
 
-import astroid
+import collections
 
+import astroid
 from pylint.checkers import BaseChecker, utils
 
 from .common import BASE_ID, check_visitors
+from . import inference_budget
+from .inference_budget import InferenceBudgetMixin
+from .worker_counts import NodeCache, ratio_table
 
 
 def register_checkers(linter):
     """Register checkers."""
+    inference_budget.register_checkers(linter)
     linter.register_checker(LayeredTestClassChecker(linter))
 
 
-def is_test_case_class(node):
+def is_test_case_class(node, budget=None):
     """Is this node a test class?
 
     To be a test class, it has to derive from unittest.TestCase, and not
-    have __test__ defined as False.
+    have __test__ defined as False. Inference is within `budget` if there
+    is one.
 
     """
-    if not node.is_subtype_of("unittest.case.TestCase"):
+    values = budget.values if budget is not None else iter
+    test_case = "unittest.case.TestCase"
+    if node.qname() != test_case and not any(anc.qname() == test_case for anc in values(node.ancestors())):
         return False
 
     dunder_test = node.locals.get("__test__")
     if dunder_test:
         if isinstance(dunder_test[0], astroid.AssignName):
-            value = list(dunder_test[0].assigned_stmts())
+            value = list(values(dunder_test[0].assigned_stmts()))
             if len(value) == 1 and isinstance(value[0], astroid.Const):
                 return bool(value[0].value)
 
     return True
 
 
+Classification = collections.namedtuple("Classification", "is_test has_tests")
+
+
+class ClassificationCache(NodeCache):
+    """
+    Whether classes are test classes, and have test methods, by class qname.
+
+    A test base class is classified again for each of its subclasses, and that infers its bases and its `__test__`:
+    with this cache, each class is only classified the first time.
+    """
+
+    def classify(self, node, budget=None):
+        """
+        Return the Classification of a class. Inference is within `budget` if there is one.
+        """
+        return self.get(node.qname(), node, lambda: self.compute_classification(node, budget))
+
+    @staticmethod
+    def compute_classification(node, budget):
+        """
+        Classify a class, without the cache.
+        """
+        is_test = is_test_case_class(node, budget)
+        has_tests = is_test and any(method.name.startswith("test_") for method in node.mymethods())
+        return Classification(is_test, has_tests)
+
+
 @check_visitors
-class LayeredTestClassChecker(BaseChecker):
-    """Pylint checker for tests inheriting test methods from other tests."""
+class LayeredTestClassChecker(InferenceBudgetMixin, BaseChecker):
+    """
+    Pylint checker for tests inheriting test methods from other tests.
+
+    Classes are classified once per lint run: the hit rate of the cache is
+    reported with `--reports=y`.
+    """
 
     name = "layered-test-class-checker"
 
     MESSAGE_ID = "test-inherits-tests"
+    INFERENCE_REPORT_ID = "RP%d04" % BASE_ID
+    CACHE_REPORT_ID = "RP%d05" % BASE_ID
     msgs = {
         ("E%d03" % BASE_ID): (
             "test class %s inherits tests from %s",
@@ -48,17 +90,33 @@ class LayeredTestClassChecker(BaseChecker):
         )
     }
 
+    # The hits and misses of the test class cache.
+    COUNTS = ("classification_counts",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.classification_counts = collections.Counter()
+        self.classifications = ClassificationCache(self.classification_counts)
+        self.reports = (
+            *self.reports,
+            (self.CACHE_REPORT_ID, f"{self.name} test class cache", self.report_cache),
+        )
+
+    def report_cache(self, sect, _stats, _old_stats):
+        """
+        Make a layout with the hits and misses of the test class cache.
+        """
+        sect.append(ratio_table("classes", self.total("classification_counts"), "hits", "misses", "hit rate"))
+
     @utils.only_required_for_messages(MESSAGE_ID)
     def visit_classdef(self, node):
         """Check each class."""
-        if not is_test_case_class(node):
-            return
-
-        for anc in node.ancestors():
-            if not is_test_case_class(anc):
-                continue
-            for meth in anc.mymethods():
-                if meth.name.startswith("test_"):
+        with self.inference_budget(node) as budget:
+            if not self.classifications.classify(node, budget).is_test:
+                return
+
+            for anc in budget.values(node.ancestors()):
+                if self.classifications.classify(anc, budget).has_tests:
                     self.add_message(self.MESSAGE_ID, args=(node.name, anc.name), node=node)
                     # No need to belabor the point.
                     return
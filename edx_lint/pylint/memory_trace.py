@@ -0,0 +1,127 @@
+"""A pylint checker that records how much memory each module takes to check.
+
+This helps find the modules, and the code, responsible for lint runs that run
+out of memory.
+
+To use, define an environment variable EDX_LINT_MEMORY_TRACE, with a value of
+a file name to write the results to:
+
+    export EDX_LINT_MEMORY_TRACE=lint_memory.json
+
+Python allocations are traced with tracemalloc, and snapshots are taken when
+each module is visited and left. For each module, the "peak" memory allocated
+in between, and the memory "retained" when leaving it, are recorded in bytes,
+with the source files that retained the most memory. The modules with the
+highest peaks and the most retained memory are written to the file once
+pylint is done, merged across -j workers. EDX_LINT_MEMORY_TRACE_TOP sets how
+many of them are written (default 20).
+
+Tracing memory makes pylint several times slower. Without the environment
+variable, the checker is not even registered.
+
+"""
+
+import json
+import multiprocessing
+import os
+import tracemalloc
+
+from pylint.checkers import BaseChecker
+
+from .common import BASE_ID, check_visitors
+
+FILENAME = os.environ.get("EDX_LINT_MEMORY_TRACE", "")
+TOP_MODULES = int(os.environ.get("EDX_LINT_MEMORY_TRACE_TOP", "20"))
+
+# The number of source files retaining the most memory recorded for each module.
+TOP_FILES = 5
+
+# Files not to blame for retained memory: the snapshots themselves are allocated in tracemalloc.py.
+IGNORED_FILES = {tracemalloc.__file__, "<unknown>"}
+
+
+def register_checkers(linter):
+    """Register checkers."""
+    if FILENAME:
+        linter.register_checker(MemoryTracingChecker(linter))
+
+
+@check_visitors
+class MemoryTracingChecker(BaseChecker):
+    """
+    Not really a checker, it doesn't generate any messages: it records the memory used to check each module.
+    """
+
+    name = "memory-tracing-checker"
+
+    msgs = {("E%d08" % BASE_ID): ("memory tracing", "memory-tracing", "Not a message: enables memory tracing.")}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.records = []
+        self.started_tracing = False
+        self.module_snapshot = None
+        self.module_start = 0
+
+    def open(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+
+    def visit_module(self, _node):
+        """Start measuring a module."""
+        self.module_snapshot = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        self.module_start, _peak = tracemalloc.get_traced_memory()
+
+    def leave_module(self, node):
+        """Record the peak and retained memory of a module, and the files that retained it."""
+        current, peak = tracemalloc.get_traced_memory()
+        differences = tracemalloc.take_snapshot().compare_to(self.module_snapshot, "filename")
+        self.module_snapshot = None
+        files = [
+            {"file": difference.traceback[0].filename, "retained": difference.size_diff}
+            for difference in differences
+            if difference.size_diff > 0 and difference.traceback[0].filename not in IGNORED_FILES
+        ]
+        self.records.append(
+            {
+                "file": node.file,
+                "peak": peak - self.module_start,
+                "retained": current - self.module_start,
+                "files": files[:TOP_FILES],
+            }
+        )
+
+    def get_map_data(self):
+        # pylint asks a -j worker for its records after every module, so each record is only returned once.
+        records = self.records
+        self.records = []
+        return records
+
+    def reduce_map_data(self, linter, data):
+        for worker_records in data:
+            self.records.extend(worker_records)
+        self.close()
+
+    def close(self):
+        """
+        Write the modules with the highest peaks and the most retained memory, unless this is a -j worker.
+        """
+        if multiprocessing.parent_process() is not None:
+            # Workers return their records to the main process with get_map_data().
+            return
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+        if not self.records:
+            return
+        results = {
+            "modules": len(self.records),
+            "peak": sorted(self.records, key=lambda record: record["peak"], reverse=True)[:TOP_MODULES],
+            "retained": sorted(self.records, key=lambda record: record["retained"], reverse=True)[:TOP_MODULES],
+        }
+        with open(FILENAME, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        self.records = []
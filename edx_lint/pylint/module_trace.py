@@ -1,15 +1,28 @@
-"""A pylint checker that simply records what module it's visiting.
+"""A pylint checker that records the modules it visits, and how long they take.
 
-This helps diagnose problems with pylint not running on all files.
+This helps diagnose problems with pylint not running on all files, and find
+the slow files of a lint run.
 
 To use, define an environment variable PYLINT_RECORD_FILES, with a value of
 a file name to write them to:
 
-    set PYLINT_RECORD_FILES=pylinted_files.txt
+    set PYLINT_RECORD_FILES=pylinted_files.jsonl
+
+A JSON object is appended to the file for each module, with the module "file",
+the "pid" of the pylint process or -j worker that linted it, its "size" in
+bytes, the "start" and "end" timestamps of its visit, and the "wall" time
+between them, in seconds. The visit starts when pylint sets the module as its
+current one, before any checker sees it, and ends when pylint moves on to the
+next module or closes the checkers, once all of them have left it. The lines
+are buffered, and written when the checker is closed. `edx_lint shard` reads
+them to balance lint runs across CI workers.
 
 """
 
+import functools
+import json
 import os
+import time
 
 from pylint.checkers import BaseChecker
 
@@ -20,8 +33,8 @@ FILENAME = os.environ.get("PYLINT_RECORD_FILES", "")
 
 
 def register_checkers(linter):
-    """Register checkers."""
-    if FILENAME:
+    """Register checkers, unless they are registered already, like in -j workers that load the plugins again."""
+    if FILENAME and not any(isinstance(checker, ModuleTracingChecker) for checker in linter.get_checkers()):
         linter.register_checker(ModuleTracingChecker(linter))
 
 
@@ -36,13 +49,60 @@ class ModuleTracingChecker(BaseChecker):
 
     msgs = {("E%d00" % BASE_ID): ("bogus", "bogus", "bogus")}
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.records = []
+        self.module_start = None
+        self.module = None
+
+    def open(self):
+        """Start timing each module when pylint sets it as the current one."""
+        # -j workers load the plugins again, and open the checkers for each module: only chain the original method.
+        method = getattr(self.linter.set_current_module, "untraced", self.linter.set_current_module)
+
+        @functools.wraps(method)
+        def set_current_module(*args, **kwargs):
+            self.record_module()
+            self.module_start = (time.time(), time.perf_counter())
+            return method(*args, **kwargs)
+
+        set_current_module.untraced = method
+        self.linter.set_current_module = set_current_module
+
     def visit_module(self, node):
         """Called for each module being examined."""
-        # This pointless statement is here because removing the statement causes a different warning. Currently we run
-        # pylint at multiple versions in the Open edX platform.  However, the other warning (no-self-use) exists in the
-        # old version of pylint (pre 2.13.0) but not the new version. This is the only way to fix the warning in a way
-        # that will work for both the old and new version.
-        self    # pylint: disable=pointless-statement
+        self.module = node
+
+    def record_module(self):
+        """Record the module visited since it was set as the current one, and its timing."""
+        node, self.module = self.module, None
+        if node is None:
+            return
+        start, start_counter = self.module_start
+        wall = time.perf_counter() - start_counter
+        try:
+            size = os.path.getsize(node.file)
+        except (OSError, TypeError):
+            size = None
+        self.records.append(
+            {
+                "file": node.file,
+                "pid": os.getpid(),
+                "size": size,
+                "start": start,
+                "end": time.time(),
+                "wall": wall,
+            }
+        )
+
+    def close(self):
+        """Record the last module, and write the buffered records."""
+        self.record_module()
+        self.linter.set_current_module = getattr(
+            self.linter.set_current_module, "untraced", self.linter.set_current_module
+        )
+        if not self.records:
+            return
         with open(FILENAME, "a") as f:
-            f.write(node.file)
-            f.write("\n")
+            f.writelines(json.dumps(record) + "\n" for record in self.records)
+        self.records.clear()
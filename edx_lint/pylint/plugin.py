@@ -1,9 +1,15 @@
 """Plugin management for edx-lint.
 
 This module imports all our plugins, and creates the register function that
-will register them with pylint.
+will register them with pylint. The opt-in memory tracing and profiling are
+only imported when their environment variable or option is set, and autofix.py
+only by `edx_lint fix`.
 """
 
+import os
+
+from pylint.checkers import BaseChecker
+
 from edx_lint.pylint import (
     annotations_check,
     getattr_check,
@@ -15,6 +21,7 @@ from edx_lint.pylint import (
     right_assert_check,
     yaml_load_check,
 )
+from edx_lint.pylint.common import fix_collector
 
 MODS = [
     annotations_check,
@@ -36,3 +43,40 @@ def register(linter):
     # add all of the checkers
     for mod in MODS:
         mod.register_checkers(linter)
+    linter.register_checker(ProfileOptionChecker(linter))
+    if os.environ.get("EDX_LINT_MEMORY_TRACE"):
+        from edx_lint.pylint import memory_trace  # pylint: disable=import-outside-toplevel
+
+        memory_trace.register_checkers(linter)
+
+
+def load_configuration(linter):
+    """Amend the checkers once the configuration is loaded."""
+    if linter.config.edx_lint_profile:
+        from edx_lint.pylint import profiling  # pylint: disable=import-outside-toplevel
+
+        profiling.load_configuration(linter)
+    fixes = fix_collector()
+    if fixes is not None:
+        fixes.load_configuration(linter)
+
+
+class ProfileOptionChecker(BaseChecker):
+    """
+    Not really a checker: it holds the option that enables profiling.py, so that the module is only imported when
+    the option is set.
+    """
+
+    name = "edx-lint-profile"
+
+    options = (
+        (
+            "edx-lint-profile",
+            {
+                "default": os.environ.get("EDX_LINT_PROFILE", ""),
+                "type": "string",
+                "metavar": "<file>",
+                "help": "Profile the edx-lint checkers, and write the profile to this JSON file when pylint exits.",
+            },
+        ),
+    )
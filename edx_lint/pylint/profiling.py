@@ -0,0 +1,139 @@
+"""Profiling of the edx-lint checkers.
+
+This helps find which edx-lint checker, and which of its methods, a lint run
+spends its time in.
+
+To use, define an environment variable EDX_LINT_PROFILE, or the
+`edx-lint-profile` pylint option, with the name of a JSON file to write the
+profile to:
+
+    export EDX_LINT_PROFILE=edx_lint_profile.json
+
+Once pylint's configuration is loaded, the `visit_*` and `leave_*` methods of
+the edx-lint checkers, and their `calls_to` methods, are wrapped to count
+their calls and the time spent in them. With `pylint -j`, the counts of the
+workers are merged. When pylint exits, the methods are printed to stderr by
+decreasing time, and written to the JSON file.
+
+The option belongs to a checker of plugin.py, which only imports this module
+when profiling is asked for.
+
+"""
+
+import atexit
+import functools
+import json
+import sys
+import time
+from collections import Counter
+
+from pylint.checkers import BaseChecker
+
+from .common import check_visitors
+from .worker_counts import WorkerCountsMixin
+
+
+def load_configuration(linter):
+    """Register the profiler, and start profiling the edx-lint checkers."""
+    profiler = ProfilingChecker(linter)
+    linter.register_checker(profiler)
+    profiler.profile_checkers()
+
+
+@check_visitors
+class ProfilingChecker(WorkerCountsMixin, BaseChecker):
+    """
+    Not really a checker: it holds the profile of the other edx-lint checkers.
+    """
+
+    name = "edx-lint-profiler"
+
+    # Calls and seconds, by "checker-name.method_name".
+    COUNTS = ("calls", "seconds")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profiling = False
+        self.calls = Counter()
+        self.seconds = Counter()
+
+    def profile_checkers(self):
+        """
+        Wrap the visitors and call handlers of the edx-lint checkers, and write the profile when pylint exits.
+        """
+        if self.profiling:
+            return
+        self.profiling = True
+        for checker in self.linter.get_checkers():
+            checker_class = type(checker)
+            if checker is self or not checker_class.__module__.startswith("edx_lint."):
+                continue
+            for name in dir(checker_class):
+                is_visitor = name.startswith(("visit_", "leave_"))
+                if not is_visitor and not hasattr(getattr(checker_class, name), "call_names"):
+                    continue
+                method = getattr(checker, name)
+                # -j workers load the plugins again, and profile the checkers of the parent process a second time.
+                if not hasattr(method, "profiled_as"):
+                    setattr(checker, name, self.profiled(f"{checker.name}.{name}", method))
+        atexit.register(self.write_profile)
+
+    def profiled(self, key, method):
+        """
+        Wrap a method to count its calls and time under `key`.
+
+        The wrapper keeps the attributes of the method, like `checks_msgs` and `call_names`.
+        """
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.seconds[key] += time.perf_counter() - start
+                self.calls[key] += 1
+
+        wrapper.profiled_as = key
+        return wrapper
+
+    def get_map_data(self):
+        """
+        Return the profile since the previous call, or None when not profiling.
+        """
+        if not self.profiling:
+            return None
+        return super().get_map_data()
+
+    def reduce_map_data(self, linter, data):
+        super().reduce_map_data(linter, [worker_data for worker_data in data if worker_data is not None])
+
+    def profile(self):
+        """
+        Return the profiled methods by decreasing time, as dicts of their checker, method, calls and seconds.
+        """
+        calls, seconds = self.total("calls"), self.total("seconds")
+        methods = []
+        for key in sorted(calls, key=lambda key: (-seconds[key], key)):
+            checker_name, method_name = key.split(".")
+            methods.append(
+                {"checker": checker_name, "method": method_name, "calls": calls[key], "seconds": seconds[key]}
+            )
+        return methods
+
+    def write_profile(self):
+        """
+        Print the profile as a table on stderr, and write it to the profile file.
+        """
+        methods = self.profile()
+        print(f"{'seconds':>10} {'calls':>10} {'per call':>10}  method", file=sys.stderr)
+        for method in methods:
+            per_call = method["seconds"] / method["calls"]
+            print(
+                f"{method['seconds']:10.3f} {method['calls']:10d} {per_call * 1000:8.3f}ms  "
+                f"{method['checker']}.{method['method']}",
+                file=sys.stderr,
+            )
+        with open(self.linter.config.edx_lint_profile, "w") as profile_file:
+            json.dump({"methods": methods}, profile_file, indent=2)
+            profile_file.write("\n")
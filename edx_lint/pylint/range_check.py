@@ -4,16 +4,18 @@ import astroid
 
 from pylint.checkers import BaseChecker, utils
 
-from .common import BASE_ID, check_visitors
+from . import call_dispatch
+from .call_dispatch import CallDispatchMixin, calls_to
+from .common import BASE_ID, check_visitors, fix_collector
 
 
 def register_checkers(linter):
     """Register checkers."""
-    linter.register_checker(RangeChecker(linter))
+    call_dispatch.register_checkers(linter, RangeChecker(linter))
 
 
 @check_visitors
-class RangeChecker(BaseChecker):
+class RangeChecker(CallDispatchMixin, BaseChecker):
     """
     Checks for range() and xrange() used with unneeded arguments.
 
@@ -38,16 +40,9 @@ class RangeChecker(BaseChecker):
     msgs = {("C%d20" % BASE_ID): ("%s() call could be %s-argument", MESSAGE_ID, "range() call could be simplified")}
 
     @utils.only_required_for_messages(MESSAGE_ID)
-    def visit_call(self, node):
-        """Called for every function call in the source code."""
-        if not isinstance(node.func, astroid.Name):
-            # It isn't a simple name, can't deduce what function it is.
-            return
-
-        if node.func.name not in self.RANGE_FUNCTIONS:
-            # Not a function we care about.
-            return
-
+    @calls_to(names=RANGE_FUNCTIONS)
+    def check_call(self, node):
+        """Called for every call to range() or xrange() in the source code."""
         first = node.args[0]
         if not isinstance(first, astroid.Const):
             # Computed first argument, can't tell what it is.
@@ -70,9 +65,30 @@ class RangeChecker(BaseChecker):
             if len(node.args) == 2:
                 # range(0, n): bad.
                 self.add_message(self.MESSAGE_ID, args=(node.func.name, "single"), node=node)
+                self.fix_call(node, node.args[1:])
             elif three1:
                 # range(0, n, 1): bad.
                 self.add_message(self.MESSAGE_ID, args=(node.func.name, "single"), node=node)
+                self.fix_call(node, node.args[1:2])
         elif three1:
             # range(n, m, 1): bad.
             self.add_message(self.MESSAGE_ID, args=(node.func.name, "two"), node=node)
+            self.fix_call(node, node.args[:2])
+
+    def fix_call(self, node, arguments):
+        """
+        Collect the fix of a range() call, replacing its arguments with `arguments`, when `edx_lint fix` runs.
+        """
+        fixes = fix_collector()
+        if fixes is None:
+            return
+        from .autofix import Edit  # pylint: disable=import-outside-toplevel
+
+        source = fixes.source(node)
+        if not source.bare_arguments(node, len(node.args)):
+            return
+        start, end = source.start(node.args[0]), source.end(node.args[-1])
+        if source.has_comment(start, end):
+            return
+        text = ", ".join(source.text(argument) for argument in arguments)
+        fixes.add(self, self.MESSAGE_ID, node, [Edit(start, end, text)])
@@ -7,16 +7,18 @@ import astroid
 
 from pylint.checkers import BaseChecker, utils
 
-from .common import BASE_ID, check_visitors
+from . import call_dispatch
+from .call_dispatch import CallDispatchMixin, calls_to
+from .common import BASE_ID, check_visitors, fix_collector
 
 
 def register_checkers(linter):
     """Register checkers."""
-    linter.register_checker(AssertChecker(linter))
+    call_dispatch.register_checkers(linter, AssertChecker(linter))
 
 
 @check_visitors
-class AssertChecker(BaseChecker):
+class AssertChecker(CallDispatchMixin, BaseChecker):
     """
     Implements a few pylint checks on unitests asserts - making sure the right
     assert is used if assertTrue or assertFalse are misused.
@@ -64,19 +66,11 @@ class AssertChecker(BaseChecker):
     msgs = {("C%d90" % BASE_ID): ("%s", MESSAGE_ID, "Use assert(Not)Equal instead of assertTrue/False")}
 
     @utils.only_required_for_messages(MESSAGE_ID)
-    def visit_call(self, node):
+    @calls_to(attrnames=AFFECTED_ASSERTS)
+    def check_call(self, node):
         """
         Check that various assertTrue/False functions are not misused.
         """
-        if not isinstance(node.func, astroid.Attribute):
-            # If it isn't a getattr ignore this. All the assertMethods are
-            # attributes of self:
-            return
-
-        if node.func.attrname not in self.AFFECTED_ASSERTS:
-            # Not an attribute / assert we care about
-            return
-
         first_arg = node.args[0]
         existing_code = "%s(%s)" % (node.func.attrname, first_arg.as_string())
 
@@ -87,7 +81,8 @@ class AssertChecker(BaseChecker):
 
             compare = first_arg.ops[0][0]
             right = first_arg.ops[0][1]
-            if isinstance(right, astroid.Const) and right.value is None:
+            compares_none = isinstance(right, astroid.Const) and right.value is None
+            if compares_none:
                 # Comparing to None, handle specially.
                 better = self.BETTER_NONE_COMPARES[compare]
             else:
@@ -96,3 +91,34 @@ class AssertChecker(BaseChecker):
             if node.func.attrname == "assertFalse":
                 better = self.INVERTED[better]
             self.add_message(self.MESSAGE_ID, args="%s should be %s" % (existing_code, better), node=node)
+            self.fix_call(node, better, compares_none)
+
+    def fix_call(self, node, better, compares_none):
+        """
+        Collect the fix of a misused assertTrue/False call, when `edx_lint fix` runs.
+
+        `self.assertTrue(a == b)` becomes `self.assertEqual(a, b)`, and `self.assertTrue(a is None)` becomes
+        `self.assertIsNone(a)`.
+        """
+        fixes = fix_collector()
+        if fixes is None:
+            return
+        from .autofix import Edit  # pylint: disable=import-outside-toplevel
+
+        source = fixes.source(node)
+        first_arg = node.args[0]
+        if not source.bare_arguments(node, 1):
+            return
+        start, end = source.start(first_arg), source.end(first_arg)
+        if source.has_comment(start, end):
+            return
+        func_end = source.end(node.func)
+        func_name_start = func_end - len(node.func.attrname)
+        if source.text(func_name_start, func_end) != node.func.attrname:
+            return
+
+        arguments = [source.text(first_arg.left)]
+        if not compares_none:
+            arguments.append(source.text(first_arg.ops[0][1]))
+        edits = [Edit(func_name_start, func_end, better), Edit(start, end, ", ".join(arguments))]
+        fixes.add(self, self.MESSAGE_ID, node, edits)
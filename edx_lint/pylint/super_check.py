@@ -1,22 +1,69 @@
 """Pylint plugin: check that tests have used super() properly."""
 
+from collections import Counter
+
 import astroid
 from pylint.checkers import BaseChecker, utils
-try:
-    from pylint.checkers.classes import _ancestors_to_call
-except ImportError:  # Backward compatibility with pylint<2.13
-    from pylint.checkers.classes.class_checker import _ancestors_to_call
 
 from .common import BASE_ID, check_visitors, usable_class_name
+from . import inference_budget
+from .inference_budget import InferenceBudgetMixin
+from .worker_counts import NodeCache, ratio_table
 
 
 def register_checkers(linter):
     """Register checkers."""
+    inference_budget.register_checkers(linter)
     linter.register_checker(UnitTestSetupSuperChecker(linter))
 
 
+class AncestorMethodCache(NodeCache):
+    """
+    The methods that base classes provide, by class qname and method name.
+
+    Test base classes are shared by many test modules, and looking up a method of a base class walks its whole MRO:
+    the checker keeps this cache for the whole lint run, so each base class method is looked up once.
+    """
+
+    def ancestors_to_call(self, klass_node, method_name, budget=None):
+        """
+        Return a dict of the direct base classes providing `method_name`, and their method.
+
+        This is pylint's `_ancestors_to_call`, with the methods of the bases cached. Inference is within `budget` if
+        there is one.
+        """
+        values = budget.values if budget is not None else iter
+        to_call = {}
+        for base_node in values(klass_node.ancestors(recurs=False)):
+            method = self.method(base_node, method_name, values)
+            if method is not None:
+                to_call[base_node] = method
+        return to_call
+
+    def method(self, base_node, method_name, values=iter):
+        """
+        Return the method a base class provides, or None if it doesn't provide it or the method is abstract.
+        """
+        return self.get(
+            (base_node.qname(), method_name), base_node, lambda: self.lookup_method(base_node, method_name, values)
+        )
+
+    @staticmethod
+    def lookup_method(base_node, method_name, values=iter):
+        """
+        Look up the method a base class provides, without the cache.
+        """
+        try:
+            method = next(values(base_node.igetattr(method_name)))
+        except astroid.InferenceError:
+            return None
+        if not isinstance(method, astroid.UnboundMethod) or method.is_abstract():
+            return None
+        return method
+
+
 @check_visitors
-class UnitTestSetupSuperChecker(BaseChecker):
+class UnitTestSetupSuperChecker(InferenceBudgetMixin, BaseChecker):
     """
     Checks that unittest methods have used super() properly.
 
@@ -25,6 +72,14 @@ class UnitTestSetupSuperChecker(BaseChecker):
     `super-method-not-called` error.  If super is used, but with the wrong
     class name, it issues a `non-parent-method-called` error.
 
+    The methods of the base classes are cached for the whole lint run. Calls
+    like `ParentName.setUp(self)` whose receiver is written like one of the
+    bases of the class are resolved without inference. The cache hit rate and
+    the number of receivers resolved without inference are reported with
+    `--reports=y`.
+
+    Inference is limited by the inference budget, see inference_budget.py.
+
     """
 
     name = "unit-test-super-checker"
@@ -34,6 +89,10 @@ class UnitTestSetupSuperChecker(BaseChecker):
 
     METHOD_NAMES = ["setUp", "tearDown", "setUpClass", "tearDownClass", "setUpTestData"]
 
+    CACHE_REPORT_ID = "RP%d01" % BASE_ID
+    RECEIVERS_REPORT_ID = "RP%d02" % BASE_ID
+    INFERENCE_REPORT_ID = "RP%d03" % BASE_ID
+
     msgs = {
         ("E%d01" % BASE_ID): (
             "super(...).%s() not called (%s)",
@@ -47,6 +106,55 @@ class UnitTestSetupSuperChecker(BaseChecker):
         ),
     }
 
+    # The hits and misses of the base class method cache, and how the receivers of parent method calls were resolved:
+    # "syntactic" or "inferred".
+    COUNTS = ("lookups", "receivers")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookups = Counter()
+        self.ancestor_methods = AncestorMethodCache(self.lookups)
+        self.receivers = Counter()
+        self.reports = (
+            *self.reports,
+            (self.CACHE_REPORT_ID, f"{self.name} base class method cache", self.report_cache),
+            (self.RECEIVERS_REPORT_ID, f"{self.name} receiver inference", self.report_receivers),
+        )
+
+    def report_cache(self, sect, _stats, _old_stats):
+        """
+        Make a layout with the hits and misses of the base class method cache.
+        """
+        sect.append(ratio_table("lookups", self.total("lookups"), "hits", "misses", "hit rate"))
+
+    def report_receivers(self, sect, _stats, _old_stats):
+        """
+        Make a layout with the number of parent method call receivers resolved with and without inference.
+        """
+        sect.append(ratio_table("receivers", self.total("receivers"), "syntactic", "inferred", "inference avoided"))
+
+    @staticmethod
+    def direct_base(receiver, method_node, klass_node, to_call):
+        """
+        Return the base class that the receiver of a call like `ParentName.setUp(self)` names, without inference.
+
+        The receiver must be written like one of the bases of the class, and exactly one of the bases providing the
+        method must have its name. Returns None for the other receivers, which need inference.
+        """
+        if isinstance(receiver, astroid.Name):
+            if receiver.name in method_node.locals:
+                return None
+            name = receiver.name
+        elif isinstance(receiver, astroid.Attribute):
+            name = receiver.attrname
+        else:
+            return None
+        receiver_text = receiver.as_string()
+        if not any(base.as_string() == receiver_text for base in klass_node.bases):
+            return None
+        candidates = [klass for klass in to_call if klass.name == name]
+        return candidates[0] if len(candidates) == 1 else None
+
     @utils.only_required_for_messages(NOT_CALLED_MESSAGE_ID, NON_PARENT_MESSAGE_ID)
     def visit_functiondef(self, node):
         """Called for every function definition in the source code."""
@@ -54,12 +162,17 @@ class UnitTestSetupSuperChecker(BaseChecker):
         if not node.is_method():
             return
 
-        method_name = node.name
-        if method_name not in self.METHOD_NAMES:
+        if node.name not in self.METHOD_NAMES:
             return
 
+        with self.inference_budget(node) as budget:
+            self.check_method(node, budget)
+
+    def check_method(self, node, budget):
+        """Check the parent method calls of a method, inferring within the budget."""
+        method_name = node.name
         klass_node = node.parent.frame()
-        to_call = _ancestors_to_call(klass_node, method_name)
+        to_call = self.ancestor_methods.ancestors_to_call(klass_node, method_name, budget)
 
         not_called_yet = dict(to_call)
         for stmt in node.nodes_of_class(astroid.Call):
@@ -75,10 +188,18 @@ class UnitTestSetupSuperChecker(BaseChecker):
                 and isinstance(expr.expr.func, astroid.Name)
                 and expr.expr.func.name == "super"
             ):
+                self.receivers["syntactic"] += 1
                 return
 
+            klass = self.direct_base(expr.expr, node, klass_node, to_call)
+            if klass is not None:
+                self.receivers["syntactic"] += 1
+                not_called_yet.pop(klass, None)
+                continue
+
+            self.receivers["inferred"] += 1
             try:
-                klass = next(expr.expr.infer())
+                klass = next(budget.values(expr.expr.infer()))
                 if klass is astroid.Uninferable:
                     continue
 
@@ -0,0 +1,164 @@
+"""Rewrite unittest assertions as pytest assertions, across a whole test tree.
+
+The `edx_lint unittest_to_pytest` command rewrites the assertions that the
+avoid-unittest-asserts message reports: `self.assertEqual(a, b)` becomes
+`assert a == b`, and `self.assertRaises(Error)` becomes `pytest.raises(Error)`.
+The files are parsed with astroid, without running pylint, and are rewritten
+in parallel by a pool of processes.
+
+Only the calls, their parentheses and the commas between their arguments are
+edited, so the comments and formatting of the rest of the files are kept.
+
+"""
+
+import collections
+import concurrent.futures
+import os
+
+import astroid
+from astroid import nodes
+
+from edx_lint.pylint.autofix import Edit, Fix, FixCollector, SourceFixes
+from edx_lint.pylint.unittest_assert.unittest_assert_check import UnittestAssertChecker
+
+CodemodResult = collections.namedtuple("CodemodResult", "path rewritten left error")
+
+
+def raises_edits(source, node):
+    """
+    The edits rewriting an assertRaises call with pytest.raises, or None if it can't be rewritten.
+
+    `with self.assertRaises(Error) as context:` becomes `with pytest.raises(Error) as context:`, and the uses of
+    `context.exception` in the same function become `context.value`. A call of a function, like
+    `self.assertRaises(Error, function, arg)` on a line of its own, becomes a `with pytest.raises(Error):` block.
+    """
+    if not node.args or any(isinstance(arg, nodes.Starred) for arg in node.args[:2]):
+        return None
+    call_start, call_end = source.start(node), source.end(node)
+
+    if isinstance(node.parent, nodes.With):
+        context_var = dict(node.parent.items).get(node, False)
+        if context_var is False or len(node.args) != 1 or node.keywords:
+            return None
+        edits = [Edit(call_start, source.end(node.func), "pytest.raises")]
+        if isinstance(context_var, nodes.AssignName):
+            for attribute in node.scope().nodes_of_class(nodes.Attribute):
+                if attribute.attrname != "exception" or not isinstance(attribute.expr, nodes.Name):
+                    continue
+                if attribute.expr.name == context_var.name:
+                    attribute_end = source.end(attribute)
+                    edits.append(Edit(attribute_end - len("exception"), attribute_end, "value"))
+        return edits
+
+    if not isinstance(node.parent, nodes.Expr) or len(node.args) < 2 or node.lineno != node.end_lineno:
+        return None
+    line_start = source.line_offsets[node.lineno - 1]
+    line_end = source.line_offsets[node.lineno]
+    indent = source.text(line_start, call_start)
+    if indent.strip() or source.code(call_end, line_end).strip():
+        # The call shares its line with other statements.
+        return None
+    function_end = source.end(node.args[1])
+    comma = source.code(function_end, call_end - 1).find(",")
+    arguments = "" if comma < 0 else source.text(function_end + comma + 1, call_end - 1).strip().rstrip(",")
+    text = (
+        f"with pytest.raises({source.text(node.args[0])}):\n"
+        f"{indent}    {source.operand(node.args[1])}({arguments})"
+    )
+    return [Edit(call_start, call_end, text)]
+
+
+def import_pytest_edit(source, module):
+    """
+    The edit adding `import pytest` after the imports at the top of a module.
+    """
+    imports = []
+    for statement in module.body:
+        if not isinstance(statement, (nodes.Import, nodes.ImportFrom)):
+            break
+        imports.append(statement)
+    if imports:
+        offset = source.line_offsets[imports[-1].end_lineno]
+    elif module.body:
+        first = module.body[0]
+        decorators = getattr(first, "decorators", None)
+        offset = source.line_offsets[min(first.lineno, decorators.lineno if decorators else first.lineno) - 1]
+    else:
+        offset = len(source.source)
+    text = "import pytest\n"
+    if offset and source.source[offset - 1:offset] not in (b"\n", b"\r"):
+        text = "\n" + text
+    return Edit(offset, offset, text)
+
+
+def rewrite_file(path):
+    """
+    Rewrite the unittest assertions of one file, returning a CodemodResult.
+    """
+    try:
+        source = SourceFixes(path)
+        if b".assert" not in source.source:
+            return CodemodResult(path, 0, 0, None)
+        module = astroid.parse(source.source.decode("utf-8"), path=path)
+    except (OSError, UnicodeDecodeError, astroid.AstroidSyntaxError) as error:
+        return CodemodResult(path, 0, 0, error)
+
+    message_id = UnittestAssertChecker.MESSAGE_ID
+    calls = [
+        node for node in module.nodes_of_class(nodes.Call)
+        if isinstance(node.func, nodes.Attribute) and node.func.attrname in UnittestAssertChecker.UNITTEST_ASSERTS
+    ]
+    uses_pytest_raises = False
+    for node in calls:
+        if node.func.attrname == "assertRaises":
+            edits = raises_edits(source, node)
+            uses_pytest_raises = uses_pytest_raises or edits is not None
+        else:
+            edits = UnittestAssertChecker.assertion_edits(source, node)
+        if edits is not None:
+            source.add(Fix(message_id, node.fromlineno, tuple(edits)))
+    if not source.fixes:
+        return CodemodResult(path, 0, len(calls), None)
+
+    import_fixes = 0
+    imports_pytest = any(isinstance(statement, nodes.Import) for statement in module.locals.get("pytest", ()))
+    if uses_pytest_raises and not imports_pytest:
+        source.add(Fix("import-pytest", 1, (import_pytest_edit(source, module),)))
+        import_fixes = 1
+
+    collector = FixCollector()
+    collector.files[path] = source
+    result = collector.apply()[0]
+    if result.error is not None:
+        return CodemodResult(path, 0, len(calls), result.error)
+    rewritten = result.fixed - import_fixes
+    return CodemodResult(path, rewritten, len(calls) - rewritten, None)
+
+
+def python_files(paths):
+    """
+    The Python files in `paths`, and in the directories in `paths`.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(dirname for dirname in dirnames if not dirname.startswith("."))
+            for filename in sorted(filenames):
+                if filename.endswith(".py"):
+                    yield os.path.join(dirpath, filename)
+
+
+def rewrite_files(paths, jobs=None):
+    """
+    Rewrite the unittest assertions of the Python files under `paths`, with `jobs` processes.
+
+    Yields a CodemodResult for each file, in order.
+    """
+    files = list(python_files(paths))
+    if jobs == 1 or len(files) < 2:
+        yield from map(rewrite_file, files)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(rewrite_file, files, chunksize=8)
@@ -1,18 +1,22 @@
 """Checker for using pytest assertion instead of unittest assertion."""
-import astroid
+import re
 
+from astroid import nodes
 from pylint.checkers import BaseChecker, utils
 
+from edx_lint.pylint import call_dispatch
+from edx_lint.pylint.autofix import ATOMS, FIXES, Edit
+from edx_lint.pylint.call_dispatch import CallDispatchMixin, calls_to
 from edx_lint.pylint.common import BASE_ID, check_visitors
 
 
 def register_checkers(linter):
     """Register checkers."""
-    linter.register_checker(UnittestAssertChecker(linter))
+    call_dispatch.register_checkers(linter, UnittestAssertChecker(linter))
 
 
 @check_visitors
-class UnittestAssertChecker(BaseChecker):
+class UnittestAssertChecker(CallDispatchMixin, BaseChecker):
     """
     Checks if a unit test assertion is used, Trigger warning to
     replace it with pytest assertions
@@ -80,19 +84,11 @@ class UnittestAssertChecker(BaseChecker):
     }
 
     @utils.only_required_for_messages(MESSAGE_ID)
-    def visit_call(self, node):
+    @calls_to(attrnames=UNITTEST_ASSERTS)
+    def check_call(self, node):
         """
         Check that unittest assertions are not used.
         """
-        if not isinstance(node.func, astroid.Attribute):
-            # If it isn't a getattr ignore this. All the assertMethods are
-            # attributes of self:
-            return
-
-        if node.func.attrname not in self.UNITTEST_ASSERTS:
-            # Not an attribute we care about
-            return
-
         converted_assert = self.ASSERT_MAPPING.get(node.func.attrname, None)
 
         self.add_message(
@@ -100,3 +96,87 @@ class UnittestAssertChecker(BaseChecker):
             args=f"{node.func.attrname} should be replaced with a pytest assertion something like `{converted_assert}`",
             node=node
         )
+        self.fix_call(node)
+
+    def fix_call(self, node):
+        """
+        Collect the fix of a unittest assertion, when `edx_lint fix` runs.
+        """
+        if not FIXES.enabled:
+            return
+        edits = self.assertion_edits(FIXES.source(node), node)
+        if edits is not None:
+            FIXES.add(self, self.MESSAGE_ID, node, edits)
+
+    @classmethod
+    def assertion_edits(cls, source, node):
+        """
+        The edits rewriting a unittest assertion as an assert statement, or None if it can't be rewritten.
+
+        `self.assertEqual(a, b, msg)` becomes `assert a == b, msg`. Only the call, its parentheses and the commas
+        between its arguments are edited, so the comments and line breaks in the arguments are kept. Assertions
+        that are not statements of their own, or that need an import (like math.isclose) or a context manager
+        (like pytest.raises) are not rewritten.
+        """
+        template = cls.ASSERT_MAPPING[node.func.attrname]
+        if not template.startswith("assert ") or "math." in template:
+            return None
+        if not isinstance(node.parent, nodes.Expr):
+            return None
+        if any(isinstance(argument, nodes.Starred) for argument in node.args):
+            return None
+        if any(keyword.arg != "msg" for keyword in node.keywords):
+            return None
+
+        # "assert arg1 == arg2" is split into the text around the arguments: "", " == " and "".
+        parts = re.split(r"arg\d", template[len("assert "):])
+        args = list(node.args)
+        msg = node.keywords[0] if node.keywords else None
+        if msg is None and len(args) == len(parts):
+            msg = args.pop()
+        if len(args) != len(parts) - 1:
+            return None
+
+        # Assertions over several lines are wrapped in parentheses, so that their line breaks are kept.
+        multiline = node.lineno != node.end_lineno
+        call_start, call_end = source.start(node), source.end(node)
+        func_end = source.end(node.func)
+        open_paren = func_end + source.code(func_end, source.start(args[0])).index("(")
+        edits = [Edit(call_start, open_paren + 1, "assert " + ("(" if multiline else "") + parts[0])]
+
+        for index, arg in enumerate(args):
+            start, end = source.start(arg), source.end(arg)
+            before, after = parts[index], parts[index + 1]
+            whole = (before.endswith(("(", ", ")) and after.startswith((",", ")"))) or (not before and not after)
+            parens = isinstance(arg, nodes.NamedExpr) or not (whole or isinstance(arg, ATOMS))
+            # The punctuation before the argument, after the opening parenthesis or comma.
+            preceding = source.code(open_paren + 1 if index == 0 else source.end(args[index - 1]), start)
+            if "(" in preceding.partition(",")[2 if index else 0]:
+                # The argument is already in parentheses.
+                parens = False
+            if parens:
+                edits.append(Edit(start, start, "("))
+            if index + 1 < len(args):
+                comma = end + source.code(end, source.start(args[index + 1])).index(",")
+                edits.append(Edit(end, end, ")" if parens else ""))
+                edits.append(Edit(comma, comma + 1, after.rstrip()))
+            else:
+                edits.append(Edit(end, end, (")" if parens else "") + after))
+
+        last_end = source.end(args[-1])
+        if msg is not None:
+            msg_start = source.start(msg)
+            comma = last_end + source.code(last_end, msg_start).index(",")
+            edits.append(Edit(comma, comma + 1, "), (" if multiline else ","))
+            if isinstance(msg, nodes.Keyword):
+                # Remove "msg=".
+                edits.append(Edit(msg_start, source.start(msg.value), ""))
+                last_end = source.end(msg.value)
+            else:
+                last_end = source.end(msg)
+        trailing_comma = source.code(last_end, call_end - 1).find(",")
+        if trailing_comma >= 0:
+            edits.append(Edit(last_end + trailing_comma, last_end + trailing_comma + 1, ""))
+        if not multiline:
+            edits.append(Edit(call_end - 1, call_end, ""))
+        return [edit for edit in edits if edit.start != edit.end or edit.text]
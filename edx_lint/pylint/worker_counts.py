@@ -0,0 +1,107 @@
+"""Counts that checkers report once pylint is done, merged across -j workers.
+
+With `pylint -j`, each worker process lints many files with its own copy of
+the checkers, and pylint collects their `get_map_data()` after every file.
+The main process then gives all of it to the `reduce_map_data()` of its own
+checkers, which didn't lint anything. WorkerCountsMixin implements both for
+the Counter attributes of a checker: workers return what they counted since
+the previous file, and the main process adds it all up.
+
+"""
+
+from collections import Counter
+
+from pylint.reporters.ureports.nodes import Table
+
+
+class WorkerCountsMixin:
+    """
+    Mixin for checkers with counts to report.
+
+    Each class in the hierarchy of the checker names its Counter attributes in COUNTS. `total(name)` is the count of
+    the whole run. Checkers that return more map data add it to the dict that this mixin returns.
+    """
+
+    COUNTS = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The counts of the -j workers, by attribute name.
+        self.worker_counts = {name: Counter() for name in self.count_names()}
+
+    @classmethod
+    def count_names(cls):
+        """Return the names of the Counter attributes declared by the classes of the checker."""
+        return [name for klass in reversed(cls.__mro__) for name in vars(klass).get("COUNTS", ())]
+
+    def total(self, name):
+        """
+        Return the counts of a Counter attribute, including those of the -j workers.
+        """
+        total = Counter(self.worker_counts[name])
+        total.update(getattr(self, name))
+        return total
+
+    def get_map_data(self):
+        """
+        Return the counts since the previous call, which are reset.
+        """
+        data = {}
+        for name in self.count_names():
+            counts = getattr(self, name)
+            data[name] = dict(counts)
+            # Counters are cleared rather than replaced, as caches may hold them.
+            counts.clear()
+        return data
+
+    def reduce_map_data(self, linter, data):  # pylint: disable=unused-argument
+        for worker_data in data:
+            for name in self.count_names():
+                self.worker_counts[name].update(worker_data[name])
+
+
+class NodeCache:
+    """
+    Values computed for astroid nodes, by key, counting the "hits" and "misses" of the cache in a Counter.
+
+    An entry is only used for the very node it was computed for, so that nodes with the same key in different modules,
+    like classes with the same qname, don't mix.
+    """
+
+    def __init__(self, counts=None):
+        self.entries = {}
+        self.counts = Counter() if counts is None else counts
+
+    @property
+    def hits(self):
+        return self.counts["hits"]
+
+    @property
+    def misses(self):
+        return self.counts["misses"]
+
+    def get(self, key, node, compute):
+        """
+        Return the value cached for a node under `key`, or else compute it with `compute()` and cache it.
+        """
+        cached = self.entries.get(key)
+        if cached is not None and cached[0] is node:
+            self.counts["hits"] += 1
+            return cached[1]
+
+        self.counts["misses"] += 1
+        value = compute()
+        self.entries[key] = (node, value)
+        return value
+
+
+def ratio_table(heading, counts, first, second, ratio):
+    """
+    Make a report table of two counts, and the ratio of the first to their sum.
+
+    For instance, `ratio_table("lookups", counts, "hits", "misses", "hit rate")` for the counts of a NodeCache.
+    """
+    part, other = counts[first], counts[second]
+    formatted_ratio = f"{part / (part + other):.1%}" if part + other else "-"
+    lines = ["", heading, first, str(part), second, str(other), ratio, formatted_ratio]
+    return Table(children=lines, cols=2, rheaders=1, cheaders=1)
@@ -12,16 +12,18 @@ When a new release is published, we may be able to remove this check.
 
 from pylint.checkers import BaseChecker, utils
 
+from . import call_dispatch
+from .call_dispatch import CallDispatchMixin, calls_to
 from .common import BASE_ID, check_visitors
 
 
 def register_checkers(linter):
     """Register checkers."""
-    linter.register_checker(YamlLoadChecker(linter))
+    call_dispatch.register_checkers(linter, YamlLoadChecker(linter))
 
 
 @check_visitors
-class YamlLoadChecker(BaseChecker):
+class YamlLoadChecker(CallDispatchMixin, BaseChecker):
     """
     Checks for unsafe ``yaml.load()`` calls.
     """
@@ -41,11 +43,11 @@ class YamlLoadChecker(BaseChecker):
     }
 
     @utils.only_required_for_messages(MESSAGE_ID)
-    def visit_call(self, node):
+    @calls_to(qualnames=UNSAFE_CALLS)
+    def check_call(self, node):
         """
-        Check whether a call is an unsafe call to yaml.load.
+        Called for every unsafe call to yaml.load, including through aliases such as `import yaml as y`.
         """
-        func_name = node.func.as_string()
-        if func_name in self.UNSAFE_CALLS:
-            suffix = func_name.lstrip("yaml.load")
-            self.add_message(self.MESSAGE_ID, args=(suffix, suffix), node=node)
+        func_name = self.import_aliases(node).resolve(node.func)
+        suffix = func_name[len("yaml.load"):]
+        self.add_message(self.MESSAGE_ID, args=(suffix, suffix), node=node)
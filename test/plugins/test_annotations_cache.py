@@ -0,0 +1,115 @@
+"""Test annotations_cache.py"""
+# pylint: disable=toggle-non-boolean-default-value,toggle-empty-description,annotation-missing-token
+# pylint: disable=setting-boolean-default-value
+
+import os
+import textwrap
+from unittest.mock import patch
+
+import astroid
+import pytest
+from code_annotations.find_static import StaticSearch
+
+from edx_lint.pylint.annotations_cache import PersistentAnnotationCache, evict_at_exit, max_entries_from_environment
+from edx_lint.pylint.annotations_check import MODULE_ANNOTATION_CACHE, ModuleAnnotationCache, load_annotation_config
+
+from .pylint_test import run_pylint
+
+
+SOURCE = """
+# .. toggle_name: MYTOGGLE
+# .. toggle_default: something
+# .. setting_name: MYSETTING
+# .. setting_default: True
+"""
+
+MSG_IDS = "toggle-non-boolean-default-value,setting-boolean-default-value"
+
+
+def run_pylint_with_cache(cache):
+    """Run pylint on SOURCE with a persistent cache, returning the messages and the number of searches."""
+    with patch.object(MODULE_ANNOTATION_CACHE, "persistent_cache", cache):
+        with patch.object(
+            StaticSearch, "search_extension", autospec=True, side_effect=StaticSearch.search_extension
+        ) as mock_search:
+            messages = run_pylint(SOURCE, MSG_IDS)
+    return messages, mock_search.call_count
+
+
+def test_unchanged_modules_are_not_searched_again():
+    cache = PersistentAnnotationCache("cache")
+    messages, searches = run_pylint_with_cache(cache)
+    assert searches == 2
+    assert len(os.listdir("cache")) == 2
+
+    cached_messages, cached_searches = run_pylint_with_cache(cache)
+    assert cached_searches == 0
+    assert cached_messages == messages
+
+
+def test_cached_results_are_the_searched_results():
+    with open("source.py", "w") as f:
+        f.write(textwrap.dedent(SOURCE))
+    module_node = astroid.parse(textwrap.dedent(SOURCE), path=os.path.abspath("source.py"))
+    config_path, _config, search = load_annotation_config("feature_toggle_annotations.yaml")
+    searched = ModuleAnnotationCache(PersistentAnnotationCache("cache")).search(module_node, config_path, search)
+    cached = ModuleAnnotationCache(PersistentAnnotationCache("cache")).search(module_node, config_path, search)
+    assert list(searched) == ["source.py"]
+    assert cached == searched
+
+
+def test_cache_size_from_environment():
+    with patch.dict(os.environ, {"EDX_LINT_ANNOTATIONS_CACHE_SIZE": ""}):
+        assert max_entries_from_environment() == 50000
+    with patch.dict(os.environ, {"EDX_LINT_ANNOTATIONS_CACHE_SIZE": "10"}):
+        assert max_entries_from_environment() == 10
+    for value in ["abc", "0", "-1"]:
+        with patch.dict(os.environ, {"EDX_LINT_ANNOTATIONS_CACHE_SIZE": value}):
+            with pytest.raises(ValueError, match="EDX_LINT_ANNOTATIONS_CACHE_SIZE must be a positive number"):
+                max_entries_from_environment()
+
+
+def test_invalid_cache_size_is_reported(capsys):
+    cache = PersistentAnnotationCache("cache")
+    cache.set("abc", [])
+    with patch.dict(os.environ, {"EDX_LINT_ANNOTATIONS_CACHE_SIZE": "abc"}):
+        evict_at_exit(cache)
+    assert capsys.readouterr().err == (
+        "edx-lint: the annotation cache was not evicted: "
+        "EDX_LINT_ANNOTATIONS_CACHE_SIZE must be a positive number of entries, not 'abc'\n"
+    )
+    assert os.listdir("cache") == ["abc.json"]
+
+
+def test_cache_key():
+    cache = PersistentAnnotationCache("cache")
+    config_path = "config.yaml"
+    with open(config_path, "w") as config_file:
+        config_file.write("annotations: {}")
+
+    key = cache.key(b"source", config_path)
+    assert key == cache.key(b"source", config_path)
+    assert key != cache.key(b"other source", config_path)
+    with patch("edx_lint.pylint.annotations_cache.__version__", "0.0.0"):
+        assert key != cache.key(b"source", config_path)
+    with patch("code_annotations.__version__", "0.0.0"):
+        assert key != cache.key(b"source", config_path)
+
+
+def test_get_and_set():
+    cache = PersistentAnnotationCache("cache")
+    assert cache.get("abc") is None
+    cache.set("abc", [{"line_number": 2}])
+    assert cache.get("abc") == [{"line_number": 2}]
+
+
+def test_lru_eviction():
+    cache = PersistentAnnotationCache("cache", max_entries=2)
+    for mtime, key in enumerate(["a", "b", "c"]):
+        cache.set(key, [])
+        os.utime(os.path.join("cache", key + ".json"), (mtime, mtime))
+    # Reading "a" makes it the most recently used entry.
+    assert cache.get("a") == []
+
+    cache.evict()
+    assert sorted(os.listdir("cache")) == ["a.json", "c.json"]
@@ -1,7 +1,32 @@
 """Test annotations_check.py"""
 # pylint: disable=toggle-non-boolean-default-value,toggle-empty-description,toggle-no-name,annotation-missing-token
 
-from .pylint_test import run_pylint
+import os
+import textwrap
+import tokenize
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+import astroid
+from astroid.nodes import Module
+from code_annotations.find_static import StaticSearch
+from pylint.lint import PyLinter, Run
+from pylint.reporters.text import TextReporter
+
+from edx_lint.pylint.annotations_check import (
+    MODULE_ANNOTATION_CACHE,
+    AnnotationGroupIndex,
+    AnnotationLines,
+    CodeAnnotationChecker,
+    FeatureToggleAnnotationChecker,
+    ModuleAnnotationCache,
+    SettingAnnotationChecker,
+    load_annotation_config,
+    source_from_tokens,
+)
+from edx_lint.pylint.events_annotation.events_annotation_check import EventsAnnotationChecker
+
+from .pylint_test import SimpleReporter, run_pylint
 
 
 def test_waffle_missing_toggle_annotation_check():
@@ -115,6 +140,46 @@ def test_django_feature_flags_missing_doc():
     assert expected == messages
 
 
+def test_django_feature_flags_updates_missing_doc():
+    source = """\
+        FEATURES.update({  #=A
+            # .. toggle_name: CORRECTLY_ANNOTATED_FLAG
+            'CORRECTLY_ANNOTATED_FLAG': True,
+
+            'NO_DOCUMENTATION_FLAG': False,
+        })
+
+        FEATURES.update(
+            # .. toggle_name: CORRECTLY_ANNOTATED_KWARG_FLAG
+            CORRECTLY_ANNOTATED_KWARG_FLAG=True,
+            NO_DOCUMENTATION_KWARG_FLAG=False,  #=B
+        )
+
+        # .. toggle_name: CORRECTLY_ANNOTATED_ITEM_FLAG
+        FEATURES['CORRECTLY_ANNOTATED_ITEM_FLAG'] = True
+
+        FEATURES['NO_DOCUMENTATION_ITEM_FLAG'] = True  #=C
+
+        FEATURES |= {  #=D
+            'NO_DOCUMENTATION_MERGED_FLAG': True,
+        }
+
+        OTHER_FEATURES = {}
+        OTHER_FEATURES.update({'NOT_A_FEATURE_FLAG': True})
+        OTHER_FEATURES['NOT_A_FEATURE_FLAG'] = True
+        """
+
+    msg_ids = "feature-toggle-needs-doc"
+    messages = run_pylint(source, msg_ids)
+    expected = {
+        "A:feature-toggle-needs-doc:feature toggle (NO_DOCUMENTATION_FLAG) is missing annotation",
+        "B:feature-toggle-needs-doc:feature toggle (NO_DOCUMENTATION_KWARG_FLAG) is missing annotation",
+        "C:feature-toggle-needs-doc:feature toggle (NO_DOCUMENTATION_ITEM_FLAG) is missing annotation",
+        "D:feature-toggle-needs-doc:feature toggle (NO_DOCUMENTATION_MERGED_FLAG) is missing annotation",
+    }
+    assert expected == messages
+
+
 def test_illegal_waffle_usage_check():
     source = """\
         switch_is_active('disable_pragma')  #pylint: disable=illegal-waffle-usage
@@ -143,6 +208,32 @@ def test_illegal_waffle_usage_check():
     assert expected == messages
 
 
+def test_waffle_toggles_with_aliases():
+    source = """\
+        import waffle as w
+        from edx_toggles.toggles import WaffleFlag as Flag
+
+        # .. toggle_name: annotated_flag
+        Flag(NAMESPACE, 'annotated_flag')
+
+        Flag(NAMESPACE, FLAG_WITHOUT_ANNOTATION)  #=A
+
+        w.switch_is_active('test_switch')  #=B
+
+        other.switch_is_active('not_a_waffle_switch')
+        """
+
+    msg_ids = "feature-toggle-needs-doc,illegal-waffle-usage,toggle-missing-annotation"
+    messages = run_pylint(source, msg_ids)
+    expected = {
+        "A:feature-toggle-needs-doc:feature toggle (FLAG_WITHOUT_ANNOTATION) is missing annotation",
+        "A:toggle-missing-annotation:missing feature toggle annotation",
+        "B:illegal-waffle-usage:illegal waffle usage with ('test_switch'): "
+        "use utility classes WaffleFlag, WaffleSwitch, CourseWaffleFlag.",
+    }
+    assert expected == messages
+
+
 def test_code_annotations_checker():
     source = """
     # .. toggle_name: MYTOGGLE
@@ -280,3 +371,237 @@ def test_invalid_import_from_django_waffle():
         "3:invalid-django-waffle-import:invalid Django Waffle import",
     }
     assert expected == messages
+
+
+def test_annotation_search_is_shared_between_checkers():
+    source = """
+    # .. toggle_name: MYTOGGLE
+    # .. toggle_default: something
+    # .. setting_name: MYSETTING
+    # .. setting_default: True
+    """
+    with patch.object(
+        StaticSearch, "search_extension", autospec=True, side_effect=StaticSearch.search_extension
+    ) as mock_search:
+        messages = run_pylint(
+            source, "annotation-missing-token,toggle-non-boolean-default-value,setting-boolean-default-value"
+        )
+    assert "2:toggle-non-boolean-default-value:feature toggle (MYTOGGLE) default value must be boolean " \
+        "('True' or 'False')" in messages
+    assert "2:setting-boolean-default-value:setting annotation (MYSETTING) cannot have a boolean value" in messages
+    # One search per configuration file, instead of one per checker and configuration file.
+    assert mock_search.call_count == 2
+    assert not MODULE_ANNOTATION_CACHE._results  # pylint: disable=protected-access
+
+
+def test_annotation_checks_read_module_once():
+    source = """
+    # .. toggle_name: MYTOGGLE
+    # .. toggle_default: something
+    WaffleFlag('MYTOGGLE')
+    """
+    with patch.object(Module, "stream", autospec=True, side_effect=Module.stream) as mock_stream:
+        messages = run_pylint(source, "toggle-non-boolean-default-value,feature-toggle-needs-doc")
+    assert messages == {
+        "2:toggle-non-boolean-default-value:feature toggle (MYTOGGLE) default value must be boolean ('True' or 'False')"
+    }
+    # Pylint itself streams the module to tokenize it; annotation checkers rebuild the source from its tokens.
+    assert mock_stream.call_count == 1
+
+
+def tokens_of(source):
+    """Tokenize some source like pylint does, from bytes."""
+    return list(tokenize.tokenize(BytesIO(source.encode("utf-8")).readline))
+
+
+def test_source_from_tokens():
+    sources = [
+        "",
+        "x = 1",
+        "# .. toggle_name: é\r\nx = 1\r\n",
+        '''def f():\n    """\n    Docstring.\n\n    """\n    return (1,\n\n            2)  # comment\n\n\n''',
+        "x = 1 + \\\n    2\n",
+        "s = '''a\n b'''; t = '''c\n\n d'''\n",
+    ]
+    for source in sources:
+        assert source_from_tokens(tokens_of(source)) == source
+    # A line with nothing but a backslash continuation has no token.
+    assert source_from_tokens(tokens_of("x = \\\n\\\n1\n")) is None
+
+
+def test_source_without_tokens_is_read():
+    module_node = astroid.parse("x = \\\n\\\n1\n", path="continued.py")
+    cache = ModuleAnnotationCache()
+    cache.process_tokens(tokens_of("x = \\\n\\\n1\n"))
+    assert cache.text(module_node) == "x = \\\n\\\n1\n"
+
+
+def test_search_source_matches_code_annotations():
+    # ModuleAnnotationCache mirrors the private StaticSearch._search_one_file(): they must find the same annotations.
+    source = textwrap.dedent("""\
+        # .. toggle_name: MYTOGGLE
+        # .. toggle_default: False
+        # .. toggle_description: A toggle.
+        WaffleFlag('MYTOGGLE')
+
+        # .. setting_name: MYSETTING
+        # .. setting_default: 1
+        # .. setting_description: A setting.
+        MYSETTING = 1
+        """)
+    with open("source.py", "w") as f:
+        f.write(source)
+    module_node = astroid.parse(source, path=os.path.abspath("source.py"))
+    for config_filename in CodeAnnotationChecker.CONFIG_FILENAMES:
+        config_path, config, search = load_annotation_config(config_filename)
+        expected = {}
+        config.source_path = os.path.abspath("source.py")
+        # pylint: disable=protected-access
+        search._search_one_file(
+            os.path.abspath("source.py"),
+            [extension for extensions in config.extensions.values() for extension in extensions],
+            config.extensions,
+            expected,
+        )
+        cache = ModuleAnnotationCache()
+        cache.process_tokens(tokens_of(source))
+        assert expected
+        assert cache.search(module_node, config_path, search) == expected
+
+
+def test_annotation_configs_are_loaded_once():
+    linter = PyLinter()
+    code_checker = CodeAnnotationChecker(linter)
+    toggle_checker = FeatureToggleAnnotationChecker(linter)
+    setting_checker = SettingAnnotationChecker(linter)
+    assert code_checker.config_search == toggle_checker.config_search + setting_checker.config_search
+    assert toggle_checker.config_search[0] is FeatureToggleAnnotationChecker(linter).config_search[0]
+
+
+def test_prefilter_tokens_are_strings():
+    linter = PyLinter()
+    for checker_class in [
+        CodeAnnotationChecker, FeatureToggleAnnotationChecker, SettingAnnotationChecker, EventsAnnotationChecker
+    ]:
+        assert all(isinstance(token, str) for token in checker_class(linter).prefilter_tokens)
+
+
+def test_annotation_lines():
+    module_node = astroid.parse(
+        "# .. toggle_name: é\nx = 1\n  #  .. toggle_name: y\r\ny = 2",
+        path="annotation_lines.py",
+    )
+    lines = AnnotationLines(module_node)
+    MODULE_ANNOTATION_CACHE.clear()
+    assert [lines.is_line_annotated(line_number) for line_number in range(6)] == [
+        False, True, False, True, False, False
+    ]
+    assert lines._get_line_contents(1) == "# .. toggle_name: é"  # pylint: disable=protected-access
+    assert lines._get_line_contents(4) == "y = 2"  # pylint: disable=protected-access
+
+
+def test_missing_annotation_matched_by_position():
+    source = """
+    # .. toggle_name: MYSETTING
+    MYSETTING = False
+
+    # .. toggle_name: MYTOGGLE1
+    waffle1 = WaffleFlag('MYTOGGLE1')
+    waffle2 = WaffleFlag(MYTOGGLE2)
+
+    def get_toggles():
+        return [
+            # .. toggle_name: MYTOGGLE3
+            WaffleSwitch('MYTOGGLE3'),
+        ]
+
+    # .. toggle_name: MYTOGGLE4
+    class Toggles:
+        waffle4 = CourseWaffleFlag('MYTOGGLE4')
+    """
+    messages = run_pylint(source, "toggle-missing-annotation")
+    expected = {
+        "7:toggle-missing-annotation:missing feature toggle annotation"
+    }
+    assert expected == messages
+
+
+def test_annotation_group_index():
+    index = AnnotationGroupIndex()
+    for line_number in [10, 2, 5]:
+        index.add(line_number)
+    assert index.claim(1) is None
+    assert index.claim(7) == 5
+    assert index.claim(6) is None
+    assert index.claim(3) == 2
+    assert index.claim(100) == 10
+    index.clear()
+    assert index.claim(100) is None
+
+
+def test_prefilter_skips_modules_without_annotations():
+    with open("no_annotations.py", "w") as f:
+        f.write("import os\n\nflag = Flag('my_flag')\n")
+    with open("annotations.py", "w") as f:
+        f.write("# .. setting_name: MYSETTING\n# .. setting_default: True\n")
+
+    output = StringIO()
+    with patch.object(
+        StaticSearch, "search_extension", autospec=True, side_effect=StaticSearch.search_extension
+    ) as mock_search:
+        Run(
+            [
+                "no_annotations.py",
+                "annotations.py",
+                "--disable=all",
+                "--enable=setting-boolean-default-value,toggle-missing-annotation",
+                "--load-plugins=edx_lint.pylint",
+                "--reports=y",
+            ],
+            reporter=TextReporter(output),
+            exit=False,
+        )
+    # Only annotations.py is searched, and only for setting annotations.
+    assert mock_search.call_count == 1
+    report = output.getvalue()
+    assert "setting annotation (MYSETTING) cannot have a boolean value" in report
+    assert "setting-annotations prefilter" in report
+    assert "toggle-annotations prefilter" in report
+    assert "|skipped |1       |" in report
+
+
+def test_duplicate_toggle_names_across_modules():
+    with open("first.py", "w") as f:
+        f.write("# .. toggle_name: MYTOGGLE1\nx = 1\n# .. toggle_name: MYTOGGLE2\n")
+    with open("second.py", "w") as f:
+        f.write("x = 1\n# .. toggle_name: MYTOGGLE1\n")
+
+    reporter = SimpleReporter()
+    Run(
+        ["first.py", "second.py", "--disable=all", "--enable=toggle-duplicate-name", "--load-plugins=edx_lint.pylint"],
+        reporter=reporter,
+        exit=False,
+    )
+    assert [message.msg for message in reporter.messages] == [
+        "feature toggle (MYTOGGLE1) is annotated in several modules: first.py:1, second.py:2"
+    ]
+
+
+def test_duplicate_toggle_names_are_merged_across_workers():
+    linter = PyLinter()
+    linter.set_reporter(SimpleReporter())
+    linter.load_default_plugins()
+    checker = FeatureToggleAnnotationChecker(linter)
+    linter.register_checker(checker)
+    linter.set_current_module("c")
+    checker.reduce_map_data(linter, [
+        {"prefilter_stats": {"checked": {"a.py"}, "skipped": set()}, "definitions": {"T1": {("a.py", 1)}}},
+        {"prefilter_stats": {"checked": {"b.py"}, "skipped": set()}, "definitions": {"T1": {("b.py", 3)}}},
+        # Duplicate checker instance in the same worker
+        {"prefilter_stats": {"checked": {"b.py"}, "skipped": set()}, "definitions": {"T1": {("b.py", 3)}}},
+        {"prefilter_stats": {"checked": set(), "skipped": {"c.py"}}, "definitions": {}},
+    ])
+    assert checker.prefilter_stats == {"checked": {"a.py", "b.py"}, "skipped": {"c.py"}}
+    assert [message.msg for message in linter.reporter.messages] == [
+        "feature toggle (T1) is annotated in several modules: a.py:1, b.py:3"
+    ]
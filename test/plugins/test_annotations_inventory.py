@@ -0,0 +1,71 @@
+"""Test annotations_inventory.py"""
+# pylint: disable=toggle-empty-description,annotation-missing-token,toggle-non-boolean-default-value
+
+import json
+import os
+from unittest.mock import patch
+
+from edx_lint.pylint import annotations_check
+from edx_lint.pylint.annotations_inventory import AnnotationInventory
+
+from .pylint_test import run_pylint
+
+
+def test_inventory_of_toggles_and_settings():
+    source = """
+    # .. toggle_name: MYTOGGLE
+    # .. toggle_default: False
+    # .. toggle_use_cases: temporary, open_edx
+    MYTOGGLE = WaffleFlag('MYTOGGLE')
+
+    # .. setting_name: MYSETTING
+    # .. setting_default: True
+    MYSETTING = True
+    """
+    inventory = AnnotationInventory("inventory.jsonl")
+    with patch.object(annotations_check, "ANNOTATION_INVENTORY", inventory):
+        run_pylint(source, "toggle-non-boolean-default-value,setting-boolean-default-value")
+    # The checkers close the inventory file when pylint is done.
+    assert inventory._fd is None  # pylint: disable=protected-access
+
+    with open("inventory.jsonl") as f:
+        records = [json.loads(line) for line in f]
+    for record in records:
+        record["filename"] = os.path.basename(record["filename"])
+    assert sorted(records, key=lambda record: record["line_number"]) == [
+        {
+            "kind": "toggle",
+            "name": "MYTOGGLE",
+            "filename": "source.py",
+            "line_number": 2,
+            "annotations": {
+                "toggle_name": "MYTOGGLE",
+                "toggle_default": "False",
+                "toggle_use_cases": ["temporary", "open_edx"],
+            },
+        },
+        {
+            "kind": "setting",
+            "name": "MYSETTING",
+            "filename": "source.py",
+            "line_number": 7,
+            "annotations": {"setting_name": "MYSETTING", "setting_default": "True"},
+        },
+    ]
+
+
+def test_inventory_appends():
+    with open("inventory.jsonl", "w") as f:
+        f.write('{"kind": "setting"}\n')
+    inventory = AnnotationInventory("inventory.jsonl")
+    annotations = [{"line_number": 3, "annotation_token": ".. setting_name:", "annotation_data": "A"}]
+    inventory.add("setting", "A", "a.py", annotations)
+    # Duplicate checker instances don't write the same group twice.
+    inventory.add("setting", "A", "a.py", annotations)
+    inventory.add("setting", "A", "b.py", annotations)
+    inventory.close()
+
+    with open("inventory.jsonl") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 3
+    assert [json.loads(line).get("filename") for line in lines] == [None, "a.py", "b.py"]
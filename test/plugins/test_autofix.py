@@ -0,0 +1,213 @@
+"""Test autofix.py and the edx_lint fix command."""
+
+import textwrap
+
+from edx_lint.cmd.main import main
+from edx_lint.pylint.autofix import Edit, Fix, FixCollector, SourceFixes
+
+
+def fix_source(source, *argv):
+    """Write some source to a file, run `edx_lint fix` on it, and return the fixed source."""
+    with open("source.py", "w") as f:
+        f.write(textwrap.dedent(source))
+    assert main(["fix", *argv, "source.py"]) == 0
+    with open("source.py") as f:
+        return f.read()
+
+
+def test_fix_simplifiable_range():
+    source = """\
+        range(0, 10)
+        range(0, len(x), 1)  # comment
+        range(2, n, 1)
+        range(0, 10, 2)
+        range(0, *args)
+        range(0, (n))
+        """
+    assert fix_source(source) == textwrap.dedent("""\
+        range(10)
+        range(len(x))  # comment
+        range(2, n)
+        range(0, 10, 2)
+        range(0, *args)
+        range(0, (n))
+        """)
+
+
+def test_fix_literal_used_as_attribute():
+    source = """\
+        x = getattr(obj, "attr")
+        y = getattr(a or b, "attr")
+        setattr(obj, "attr", value)
+        delattr(obj, "attr")
+        z = setattr(obj, "attr", value)
+        getattr(obj, "class")
+        getattr(self, "__private")
+        """
+    assert fix_source(source) == textwrap.dedent("""\
+        x = obj.attr
+        y = (a or b).attr
+        obj.attr = value
+        del obj.attr
+        z = setattr(obj, "attr", value)
+        getattr(obj, "class")
+        getattr(self, "__private")
+        """)
+
+
+def test_fix_wrong_assert_type():
+    source = """\
+        self.assertTrue(a == b)
+        self.assertFalse(a in b, "msg")
+        self.assertTrue(a is None)
+        self.assertTrue((a == b))
+        self.assertTrue(
+            a == b  # comment
+        )
+        """
+    assert fix_source(source, "--messages=wrong-assert-type") == textwrap.dedent("""\
+        self.assertEqual(a, b)
+        self.assertNotIn(a, b, "msg")
+        self.assertIsNone(a)
+        self.assertTrue((a == b))
+        self.assertTrue(
+            a == b  # comment
+        )
+        """)
+
+
+def test_fix_unittest_asserts():
+    source = """\
+        self.assertEqual(a, b)
+        self.assertEqual(a or b, c, "msg")
+        self.assertIn(a, b, msg="nope")
+        self.assertFalse(a and b)
+        self.assertIsInstance(a, (int, str))
+        self.assertIsNone(
+            a,
+        )
+        self.assertEqual(
+            a,
+            b,  # comment
+        )
+        self.assertRaises(ValueError)
+        self.assertAlmostEqual(a, b)
+        result = self.assertTrue(a)
+        self.assertTrue(a)  # pylint: disable=avoid-unittest-asserts
+        """
+    assert fix_source(source, "--messages=avoid-unittest-asserts") == textwrap.dedent("""\
+        assert a == b
+        assert (a or b) == c, "msg"
+        assert a in b, "nope"
+        assert not (a and b)
+        assert isinstance(a, (int, str))
+        assert (
+            a is None
+        )
+        assert (
+            a ==
+            b  # comment
+        )
+        self.assertRaises(ValueError)
+        self.assertAlmostEqual(a, b)
+        result = self.assertTrue(a)
+        self.assertTrue(a)  # pylint: disable=avoid-unittest-asserts
+        """)
+
+
+def test_overlapping_fixes_are_left_for_the_next_run(capsys):
+    messages = "--messages=simplifiable-range,literal-used-as-attribute,avoid-unittest-asserts"
+    source = """\
+        self.assertTrue(getattr(obj, "attr"))
+        range(0, len(getattr(obj, "attr")))
+        """
+    assert fix_source(source, messages) == textwrap.dedent("""\
+        assert obj.attr
+        range(len(getattr(obj, "attr")))
+        """)
+    assert "source.py: 3 fixed, 1 overlapping other fixes" in capsys.readouterr().out
+    with open("source.py") as f:
+        assert fix_source(f.read(), messages) == textwrap.dedent("""\
+            assert obj.attr
+            range(len(obj.attr))
+            """)
+
+
+def test_wrong_assert_type_is_fixed_before_unittest_asserts():
+    messages = "--messages=avoid-unittest-asserts,wrong-assert-type"
+    assert fix_source("self.assertFalse(a is None)\n", messages) == "self.assertIsNotNone(a)\n"
+    with open("source.py") as f:
+        assert fix_source(f.read(), messages) == "assert a is not None\n"
+
+
+def test_fix_the_messages_the_configuration_enables(capsys):
+    source = """\
+        range(0, 10)
+        self.assertTrue(a == b)
+        self.assertEqual(a, b)
+        """
+    # The optional unittest_assert plugin isn't loaded, and the pylintrc disables simplifiable-range.
+    with open("pylintrc", "w") as f:
+        f.write("[MESSAGES CONTROL]\ndisable = simplifiable-range\n")
+    assert fix_source(source) == textwrap.dedent("""\
+        range(0, 10)
+        self.assertEqual(a, b)
+        self.assertEqual(a, b)
+        """)
+
+    with open("source.py", "w") as f:
+        f.write(textwrap.dedent(source))
+    with open("pylintrc", "w") as f:
+        f.write("[MESSAGES CONTROL]\ndisable = all\n")
+    capsys.readouterr()
+    assert main(["fix", "source.py"]) == 1
+    assert capsys.readouterr().out == (
+        "Nothing to fix: the pylint configuration enables none of simplifiable-range, literal-used-as-attribute, "
+        "wrong-assert-type, avoid-unittest-asserts. Name the messages to fix with --messages.\n"
+    )
+    with open("source.py") as f:
+        assert f.read() == textwrap.dedent(source)
+
+
+def test_fix_some_messages():
+    source = """\
+        range(0, 10)
+        self.assertTrue(a == b)
+        """
+    assert fix_source(source, "--messages=wrong-assert-type") == textwrap.dedent("""\
+        range(0, 10)
+        self.assertEqual(a, b)
+        """)
+
+
+def test_fix_arg_errors(capsys):
+    assert main(["fix"]) == 1
+    assert main(["fix", "--messages=unused-import", "source.py"]) == 1
+    assert "Can't fix unused-import" in capsys.readouterr().out
+
+
+def test_fixes_are_applied_once_per_file():
+    with open("source.py", "w") as f:
+        f.write("abcdef\n")
+    source = SourceFixes("source.py")
+    source.add(Fix("one", 1, (Edit(0, 1, "A"), Edit(4, 5, "E"))))
+    source.add(Fix("two", 1, (Edit(2, 4, "CD"),)))
+    source.add(Fix("three", 1, (Edit(3, 3, "x"),)))
+    source.add(Fix("four", 1, (Edit(6, 6, "x"), Edit(4, 4, "y"))))
+    source.add(Fix("two", 1, (Edit(2, 4, "CD"),)))
+    assert source.fixed_source() == (b"AbCDEf\n", 2, 2)
+
+
+def test_invalid_fixed_source_is_not_written():
+    with open("source.py", "w") as f:
+        f.write("x = 1\n")
+    collector = FixCollector()
+    collector.files["source.py"] = source = SourceFixes("source.py")
+    source.add(Fix("bad", 1, (Edit(0, 1, "("),)))
+    results = collector.apply()
+    assert len(results) == 1
+    result = results[0]
+    assert result.fixed == 0
+    assert result.error is not None
+    with open("source.py") as f:
+        assert f.read() == "x = 1\n"
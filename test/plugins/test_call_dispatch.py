@@ -0,0 +1,162 @@
+"""Test call_dispatch.py"""
+
+import astroid
+import pytest
+from pylint.lint import PyLinter
+
+from edx_lint.pylint import plugin
+from edx_lint.pylint.call_dispatch import CallDispatchChecker, CallDispatcher, CallDispatchMixin, calls_to
+from edx_lint.pylint.events_annotation import events_annotation_check
+from edx_lint.pylint.unittest_assert import unittest_assert_check
+
+from .pylint_test import run_pylint
+
+
+class FakeLinter:
+    """Just enough of a linter for the dispatcher."""
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+
+    def is_message_enabled(self, msgid):
+        return msgid in self.enabled
+
+
+class FakeChecker:
+    """A checker with a few call handlers, recording the calls they get."""
+
+    def __init__(self, linter):
+        self.linter = linter
+        self.calls = []
+
+    @calls_to(names=["range"])
+    def check_range(self, node):
+        self.calls.append(("range", node.lineno))
+
+    @calls_to(attrnames=["assertTrue", "assertFalse"])
+    def check_assert(self, node):
+        self.calls.append(("assert", node.lineno))
+
+    @calls_to(name_suffixes=["WaffleFlag"])
+    def check_waffle(self, node):
+        self.calls.append(("waffle", node.lineno))
+
+    @calls_to(qualnames=["yaml.load"])
+    def check_yaml_load(self, node):
+        self.calls.append(("yaml.load", node.lineno))
+
+    @calls_to(names=["getattr"])
+    def check_getattr(self, node):
+        self.calls.append(("getattr", node.lineno))
+
+    check_getattr.checks_msgs = ["literal-used-as-attribute"]
+
+
+def dispatch(source, checker):
+    """Dispatch all the calls of some source to the handlers of a checker."""
+    dispatcher = CallDispatcher()
+    dispatcher.add_checker(checker)
+    for node in astroid.parse(source).nodes_of_class(astroid.nodes.Call):
+        dispatcher.visit_call(node)
+    return sorted(checker.calls)
+
+
+def test_dispatch_by_name():
+    source = """\
+        range(10)
+        self.assertTrue(x)
+        CourseWaffleFlag("flag")
+        WaffleFlag("flag")
+        WaffleFlagged("flag")
+        Flag("flag")
+        assertTrue(x)
+        self.range(10)
+        [range][0](10)
+        getattr(x, "y")
+        """
+    checker = FakeChecker(FakeLinter(enabled=set()))
+    assert dispatch(source, checker) == [("assert", 2), ("range", 1), ("waffle", 3), ("waffle", 4)]
+
+
+def test_dispatch_by_qualified_name():
+    source = """\
+        import yaml as y
+        from yaml import load as yl
+        y.load(x)
+        yl(x)
+        yaml.load(x)
+        load(x)
+        y.safe_load(x)
+        obj.y.load(x)
+        """
+    checker = FakeChecker(FakeLinter(enabled=set()))
+    assert dispatch(source, checker) == [("yaml.load", 3), ("yaml.load", 4), ("yaml.load", 5)]
+
+
+def test_dispatch_by_imported_name():
+    source = """\
+        from builtins import range as r
+        from toggles import WaffleFlag as Flag, Flag as WaffleFlag
+        r(10)
+        Flag("flag")
+        WaffleFlag("flag")
+        """
+    checker = FakeChecker(FakeLinter(enabled=set()))
+    assert dispatch(source, checker) == [("range", 3), ("waffle", 4)]
+
+
+def test_dispatch_to_enabled_handlers():
+    checker = FakeChecker(FakeLinter(enabled={"literal-used-as-attribute"}))
+    assert dispatch("getattr(x, 'y')", checker) == [("getattr", 1)]
+
+
+def test_clear():
+    dispatcher = CallDispatcher()
+    dispatcher.add_checker(FakeChecker(FakeLinter(enabled=set())))
+    assert len(dispatcher.name_handlers["range"]) == 1
+    dispatcher.clear()
+    assert not dispatcher.name_handlers
+
+
+def test_one_dispatcher_visits_calls():
+    linter = PyLinter()
+    plugin.register(linter)
+    unittest_assert_check.register_checkers(linter)
+    events_annotation_check.register_checkers(linter)
+    dispatchers = [checker for checker in linter.get_checkers() if isinstance(checker, CallDispatchChecker)]
+    assert len(dispatchers) == 1
+    visitors = [checker for checker in linter.get_checkers() if hasattr(checker, "visit_call")]
+    assert [checker for checker in visitors if type(checker).__module__.startswith("edx_lint.")] == dispatchers
+    call_checkers = [checker for checker in linter.get_checkers() if isinstance(checker, CallDispatchMixin)]
+    assert sorted(dispatchers[0].call_checkers) == call_checkers
+    assert all(checker.call_dispatcher is dispatchers[0] for checker in call_checkers)
+    # The messages of the call checkers make pylint run the dispatcher, but they are only defined by their checker.
+    assert "E7661" in dispatchers[0].msgs
+    assert not dispatchers[0].messages
+    assert linter.msgs_store.get_message_definitions("simplifiable-range")[0].checker_name == "range-checker"
+
+
+@pytest.mark.parametrize("mod", [*plugin.MODS, events_annotation_check, unittest_assert_check])
+def test_checkers_do_not_visit_calls(mod):
+    for checker_class in vars(mod).values():
+        if isinstance(checker_class, type) and issubclass(checker_class, CallDispatchMixin):
+            assert "visit_call" not in dir(checker_class)
+
+
+def test_checkers_share_the_dispatcher():
+    source = """\
+        range(0, 10)                    #=A
+        getattr(obj, "attr")            #=B
+        self.assertTrue(a == b)         #=C
+        """
+    msg_ids = "simplifiable-range,literal-used-as-attribute,wrong-assert-type"
+    messages = run_pylint(source, msg_ids)
+    expected = {
+        "A:simplifiable-range:range() call could be single-argument",
+        "B:literal-used-as-attribute:getattr using a literal attribute name",
+        "C:wrong-assert-type:assertTrue(a == b) should be assertEqual",
+    }
+    assert expected == messages
+
+    # The dispatcher is emptied when the run is over, so the next run only dispatches to its enabled checkers.
+    assert run_pylint(source, "simplifiable-range") == {"A:simplifiable-range:range() call could be single-argument"}
@@ -49,3 +49,20 @@ def test_getattr_checker():
         "E:literal-used-as-attribute:getattr using a literal attribute name",
     }
     assert expected == messages
+
+
+def test_getattr_checker_with_aliases():
+    source = """\
+        from builtins import getattr as get_attribute, setattr as set_attribute
+
+        get_attribute(name, "hello")            #=A
+        get_attribute(name, "hello", 17)
+        set_attribute(name, "hello", hello)     #=B
+    """
+    msg_ids = "literal-used-as-attribute"
+    messages = run_pylint(source, msg_ids)
+    expected = {
+        "A:literal-used-as-attribute:get_attribute using a literal attribute name",
+        "B:literal-used-as-attribute:set_attribute using a literal attribute name",
+    }
+    assert expected == messages
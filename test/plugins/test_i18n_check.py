@@ -1,5 +1,10 @@
 """Test i18n_check.py"""
 
+import os
+
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
 from .pylint_test import run_pylint
 
 
@@ -22,3 +27,40 @@ def test_i18n_checker():
         "D:translation-of-non-string:i18n function gettext() must be called with a literal string",
     }
     assert expected == messages
+
+
+def test_i18n_checker_with_aliases():
+    source = """\
+        from django.utils.translation import gettext as _t, gettext_lazy as _
+
+        _t("This is fine")
+        _t("Hello"+"There")         #=A
+        _(name)                     #=B
+    """
+
+    msg_ids = "translation-of-non-string"
+    messages = run_pylint(source, msg_ids)
+    expected = {
+        "A:translation-of-non-string:i18n function _t() must be called with a literal string",
+        "B:translation-of-non-string:i18n function _() must be called with a literal string",
+    }
+    assert expected == messages
+
+
+def test_aliases_of_modules_with_the_same_name():
+    # Modules outside of packages are named after their file, so both of these are "script".
+    sources = {
+        "a/script.py": "from django.utils.translation import gettext as _t\n_t(name)\n",
+        "b/script.py": "def _t(value):\n    return value\n_t(name)\n",
+    }
+    for path, source in sources.items():
+        os.makedirs(os.path.dirname(path))
+        with open(path, "w") as f:
+            f.write(source)
+    reporter = CollectingReporter()
+    Run(
+        [*sources, "--disable=all", "--enable=translation-of-non-string", "--load-plugins=edx_lint.pylint"],
+        reporter=reporter,
+        exit=False,
+    )
+    assert [(message.path, message.line) for message in reporter.messages] == [(os.path.join("a", "script.py"), 2)]
@@ -0,0 +1,52 @@
+"""Test import_aliases.py"""
+
+import astroid
+
+from edx_lint.pylint.import_aliases import ImportAliases
+
+
+def test_qualified_names():
+    module = astroid.parse(
+        """\
+        import yaml
+        import yaml as y
+        import a.b
+        import c.d as e
+        from yaml import load, load_all as la
+        from . import rel
+        from ..pkg import z
+        try:
+            import json
+        except ImportError:
+            json = None
+
+        def f():
+            import inner
+        """
+    )
+    assert ImportAliases(module).qualified_names == {
+        "yaml": "yaml",
+        "y": "yaml",
+        "a": "a",
+        "e": "c.d",
+        "load": "yaml.load",
+        "la": "yaml.load_all",
+        "rel": ".rel",
+        "z": "..pkg.z",
+    }
+
+
+def test_resolve():
+    module = astroid.parse(
+        """\
+        import yaml as y
+        from os import path
+        y.load
+        path.join
+        something.else_
+        f().attr
+        """
+    )
+    aliases = ImportAliases(module)
+    resolved = [aliases.resolve(statement.value) for statement in module.body[2:]]
+    assert resolved == ["yaml.load", "os.path.join", "something.else_", None]
@@ -0,0 +1,132 @@
+"""Test inference_budget.py"""
+
+import textwrap
+from io import StringIO
+
+import astroid
+import pytest
+from pylint.lint import PyLinter, Run
+from pylint.reporters.text import TextReporter
+
+from edx_lint.pylint import plugin
+from edx_lint.pylint.filters_docstring import filters_docstring_check
+from edx_lint.pylint.inference_budget import InferenceBudget, InferenceBudgetChecker, InferenceBudgetExceeded
+
+from .pylint_test import run_pylint
+
+MSG_IDS = "test-inherits-tests,super-method-not-called,non-parent-method-called,inference-budget-exceeded"
+
+# Looking for the tests Test inherits takes its two ancestors, telling whether Derived is a test class takes two of its
+# three ancestors, and the receiver of Base.setUp(self) is inferred to four classes, of which only the first is used.
+SOURCE = """\
+    import random
+    import unittest
+
+    if random.random() < .1:
+        Base = unittest.TestCase
+    elif random.random() < .2:
+        Base = object
+    elif random.random() < .3:
+        Base = dict
+    else:
+        Base = list
+
+    class Test(unittest.TestCase):      #=T
+        def test_one(self):
+            pass
+
+    class Derived(Test):                #=A
+        def setUp(self):                #=B
+            Base.setUp(self)            #=C
+
+        def test_two(self):
+            pass
+    """
+
+
+def test_inference_budget_checker_is_registered_once():
+    linter = PyLinter()
+    plugin.register(linter)
+    filters_docstring_check.register_checkers(linter)
+    assert len([checker for checker in linter.get_checkers() if isinstance(checker, InferenceBudgetChecker)]) == 1
+    owners = [checker.name for checker in linter.get_checkers() if "I7605" in checker.msgs]
+    assert owners == ["edx-lint-inference"]
+
+
+def test_inference_budget_values():
+    source = """\
+        if x:
+            Base = int
+        else:
+            Base = str
+        Base  #@
+        """
+    node = astroid.extract_node(textwrap.dedent(source))
+    budget = InferenceBudget(2)
+    assert len(list(budget.values(node.infer()))) == 2
+    assert not budget.exceeded
+
+    budget = InferenceBudget(1)
+    with pytest.raises(InferenceBudgetExceeded):
+        list(budget.values(node.infer()))
+    assert budget.exceeded
+    # Only the checker's iteration is stopped, not astroid's inference.
+    assert len(list(node.infer())) == 2
+
+
+def test_no_inference_budget():
+    messages = run_pylint(SOURCE, MSG_IDS)
+    expected = {
+        "A:test-inherits-tests:test class Derived inherits tests from Test",
+        "C:non-parent-method-called:setUp() was called from a non-parent class (unittest.case.TestCase)",
+    }
+    assert expected == messages
+
+
+def test_inference_budget_exceeded():
+    messages = run_pylint(SOURCE, MSG_IDS, "--edx-lint-inference-budget=1")
+    expected = {
+        "T:inference-budget-exceeded:Gave up inferring for Test: more than 1 values inferred",
+        "A:inference-budget-exceeded:Gave up inferring for Derived: more than 1 values inferred",
+        "C:non-parent-method-called:setUp() was called from a non-parent class (unittest.case.TestCase)",
+    }
+    assert expected == messages
+
+
+def test_trivial_class_within_a_small_budget():
+    source = """\
+        import unittest
+
+        class Test(unittest.TestCase):
+            def setUp(self):
+                super().setUp()
+
+            def test_one(self):
+                pass
+        """
+    assert not run_pylint(source, MSG_IDS, "--edx-lint-inference-budget=2")
+
+
+def test_inference_report():
+    with open("source.py", "w") as f:
+        f.write(textwrap.dedent(SOURCE))
+    output = StringIO()
+    Run(
+        [
+            "source.py",
+            "--disable=all",
+            f"--enable={MSG_IDS}",
+            "--load-plugins=edx_lint.pylint,edx_lint.pylint.filters_docstring",
+            "--edx-lint-inference-budget=1",
+            "--reports=y",
+        ],
+        reporter=TextReporter(output),
+        exit=False,
+    )
+    report = output.getvalue()
+    layered_report = report.split("layered-test-class-checker inference")[1]
+    assert "|nodes   |2         |" in layered_report
+    assert "|gave up |2         |" in layered_report
+    super_report = report.split("unit-test-super-checker inference")[1]
+    assert "|nodes   |1         |" in super_report
+    assert "|gave up |0         |" in super_report
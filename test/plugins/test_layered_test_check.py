@@ -1,5 +1,13 @@
 """Test layered_test_check.py"""
 
+from io import StringIO
+
+import astroid
+from pylint.lint import Run
+from pylint.reporters.text import TextReporter
+
+from edx_lint.pylint.layered_test_check import Classification, ClassificationCache
+
 from .pylint_test import run_pylint
 
 
@@ -86,3 +94,62 @@ def test_layered_test_checker():
         "B:test-inherits-tests:test class TestsWithHelpers2 inherits tests from TestHelpers2",
     }
     assert expected == messages
+
+
+def test_classifications_are_cached():
+    cache = ClassificationCache()
+    source = """\
+        import unittest
+
+        class Base(unittest.TestCase):
+            def test_one(self):
+                pass
+
+        class Helpers(unittest.TestCase):
+            __test__ = False
+
+            def test_two(self):
+                pass
+
+        class Mixin:
+            def test_three(self):
+                pass
+        """
+    module = astroid.parse(source, module_name="tests")
+    base, helpers, mixin = module.body[1:]
+    assert cache.classify(base) == Classification(is_test=True, has_tests=True)
+    assert cache.classify(helpers) == Classification(is_test=False, has_tests=False)
+    assert cache.classify(mixin) == Classification(is_test=False, has_tests=False)
+    assert cache.classify(base) == Classification(is_test=True, has_tests=True)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    # A class with the same qname in another module is not mixed up with the cached one.
+    other_base = astroid.parse(source.replace("test_one", "helper"), module_name="tests").body[1]
+    assert other_base.qname() == base.qname()
+    assert cache.classify(other_base) == Classification(is_test=True, has_tests=False)
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_classification_cache_report():
+    with open("layered_base.py", "w") as f:
+        f.write("import unittest\n\nclass Base(unittest.TestCase):\n    def test_one(self):\n        pass\n")
+    for name in ["layered_first", "layered_second"]:
+        with open(f"{name}.py", "w") as f:
+            f.write("from layered_base import Base\n\nclass Test(Base):\n    def test_two(self):\n        pass\n")
+
+    output = StringIO()
+    Run(
+        ["layered_base.py", "layered_first.py", "layered_second.py", "--disable=all",
+         "--enable=test-inherits-tests", "--load-plugins=edx_lint.pylint", "--reports=y"],
+        reporter=TextReporter(output),
+        exit=False,
+    )
+    report = output.getvalue()
+    assert "layered_first.py:3:0: E7603: test class Test inherits tests from Base" in report
+    assert "layered_second.py:3:0: E7603: test class Test inherits tests from Base" in report
+    assert "layered-test-class-checker test class cache" in report
+    # Base, TestCase, object, and the two Test classes.
+    assert "|misses   |5       |" in report
+    # Base, when it is an ancestor of each Test class.
+    assert "|hits     |2       |" in report
+    assert "|hit rate |28.6%   |" in report
@@ -0,0 +1,62 @@
+"""Test memory_trace.py"""
+
+import json
+import tracemalloc
+
+from pylint.lint import PyLinter
+
+from edx_lint.pylint import memory_trace
+
+from .pylint_test import run_pylint
+
+
+def test_memory_trace(monkeypatch):
+    # The plugin only registers the checker with the environment variable, which the module read when imported.
+    monkeypatch.setenv("EDX_LINT_MEMORY_TRACE", "memory.json")
+    monkeypatch.setattr(memory_trace, "FILENAME", "memory.json")
+    source = """\
+        import os
+
+        NUMBERS = [str(i) for i in range(100)]
+        """
+    # The tracing checker only runs when its message is enabled.
+    run_pylint(source, "unused-import,memory-tracing")
+    assert not tracemalloc.is_tracing()
+
+    with open("memory.json") as f:
+        results = json.load(f)
+    assert results["modules"] == 1
+    (record,) = results["peak"]
+    assert results["retained"] == [record]
+    assert record["file"].endswith("source.py")
+    assert record["peak"] > 0
+    assert record["peak"] >= record["retained"]
+    for file_record in record["files"]:
+        assert file_record["retained"] > 0
+
+
+def test_memory_trace_is_off_by_default():
+    linter = PyLinter()
+    memory_trace.register_checkers(linter)
+    assert not any(isinstance(checker, memory_trace.MemoryTracingChecker) for checker in linter.get_checkers())
+
+
+def test_worker_records_are_merged(monkeypatch):
+    monkeypatch.setattr(memory_trace, "FILENAME", "memory.json")
+    monkeypatch.setattr(memory_trace, "TOP_MODULES", 2)
+    checker = memory_trace.MemoryTracingChecker(PyLinter())
+    workers_data = [
+        [{"file": "a.py", "peak": 10, "retained": 3, "files": []}],
+        [
+            {"file": "b.py", "peak": 30, "retained": 1, "files": []},
+            {"file": "c.py", "peak": 20, "retained": 2, "files": []},
+        ],
+    ]
+    checker.reduce_map_data(checker.linter, workers_data)
+    assert not checker.get_map_data()
+
+    with open("memory.json") as f:
+        results = json.load(f)
+    assert results["modules"] == 3
+    assert [record["file"] for record in results["peak"]] == ["b.py", "c.py"]
+    assert [record["file"] for record in results["retained"]] == ["a.py", "c.py"]
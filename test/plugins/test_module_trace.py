@@ -0,0 +1,90 @@
+"""Test module_trace.py"""
+# pylint: disable=annotation-missing-token,toggle-empty-description,toggle-non-boolean-default-value
+
+import json
+import os
+import time
+
+from pylint.lint import PyLinter
+
+from edx_lint.pylint import module_trace
+from edx_lint.pylint.annotations_check import ModuleAnnotationCache
+
+from .pylint_test import run_pylint
+
+
+def test_module_trace(monkeypatch):
+    monkeypatch.setattr(module_trace, "FILENAME", "trace.jsonl")
+    source = """\
+        import os
+        """
+    # The tracing checker only runs when its message is enabled.
+    run_pylint(source, "unused-import,bogus")
+    run_pylint(source, "unused-import,bogus")
+
+    with open("trace.jsonl") as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == 2
+    for record in records:
+        assert record["file"].endswith("source.py")
+        assert record["pid"] == os.getpid()
+        assert record["size"] == len("import os\n")
+        assert record["start"] <= record["end"]
+        assert record["wall"] >= 0
+
+
+def test_module_trace_is_buffered(monkeypatch):
+    monkeypatch.setattr(module_trace, "FILENAME", "trace.jsonl")
+    linter = PyLinter()
+    checker = module_trace.ModuleTracingChecker(linter)
+
+    class Module:
+        """Just enough of a module node."""
+
+        def __init__(self, file):
+            self.file = file
+
+    checker.open()
+    for name in ["missing", "other"]:
+        linter.set_current_module(name, f"{name}.py")
+        checker.visit_module(Module(f"{name}.py"))
+    assert len(checker.records) == 1
+    assert not os.path.exists("trace.jsonl")
+    checker.close()
+    with open("trace.jsonl") as f:
+        records = [json.loads(line) for line in f]
+    assert [record["file"] for record in records] == ["missing.py", "other.py"]
+    assert records[0]["size"] is None
+    assert not checker.records
+    assert not hasattr(linter.set_current_module, "untraced")
+
+
+def test_module_trace_includes_all_checkers(monkeypatch):
+    monkeypatch.setattr(module_trace, "FILENAME", "trace.jsonl")
+    search = ModuleAnnotationCache.search
+
+    def slow_search(*args, **kwargs):
+        time.sleep(0.2)
+        return search(*args, **kwargs)
+
+    # The annotation checkers sort before the tracing checker, and their search used to be left out of the timings.
+    monkeypatch.setattr(ModuleAnnotationCache, "search", slow_search)
+    source = """\
+        # .. toggle_name: FLAG
+        FLAG = WaffleFlag(NAMESPACE, 'flag')
+        """
+    run_pylint(source, "annotation-missing-token,bogus")
+
+    with open("trace.jsonl") as f:
+        (record,) = [json.loads(line) for line in f]
+    assert record["wall"] >= 0.2
+
+
+def test_module_trace_is_registered_once(monkeypatch):
+    monkeypatch.setattr(module_trace, "FILENAME", "trace.jsonl")
+    linter = PyLinter()
+    module_trace.register_checkers(linter)
+    # -j workers load the plugins again.
+    module_trace.register_checkers(linter)
+    tracers = [checker for checker in linter.get_checkers() if isinstance(checker, module_trace.ModuleTracingChecker)]
+    assert len(tracers) == 1
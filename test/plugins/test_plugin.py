@@ -0,0 +1,102 @@
+"""Test plugin.py"""
+
+import re
+import subprocess
+import sys
+import textwrap
+
+# Modules that only the checkers of enabled annotation messages should import.
+HEAVY_MODULES = ["code_annotations.base", "code_annotations.find_static", "stevedore", "yaml"]
+
+# Modules that only their environment variable or option, or `edx_lint fix`, should import.
+OPT_IN_MODULES = ["edx_lint.pylint.autofix", "edx_lint.pylint.memory_trace", "edx_lint.pylint.profiling"]
+
+
+def run_python(code):
+    """Run some Python code in a new interpreter, and return what it printed on stdout and stderr."""
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout, result.stderr
+
+
+def imported_modules(code):
+    """Run some Python code with `python -X importtime`, and return the names of the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(re.findall(r"^import time:\s+\d+ \|\s+\d+ \|\s+(\S+)$", result.stderr, re.MULTILINE))
+
+
+def test_import_edx_lint_pylint():
+    modules = imported_modules("import edx_lint.pylint")
+    assert "edx_lint.pylint.plugin" in modules
+    assert "edx_lint.pylint.super_check" in modules
+    assert not modules.intersection(HEAVY_MODULES + OPT_IN_MODULES)
+
+
+def test_registering_does_not_import_heavy_modules():
+    stdout, _stderr = run_python(
+        f"""\
+        import sys
+        from pylint.lint import PyLinter
+        from edx_lint.pylint import plugin
+        plugin.register(PyLinter())
+        print("imported:", [name for name in {HEAVY_MODULES + OPT_IN_MODULES!r} if name in sys.modules])
+        """
+    )
+    assert "imported: []" in stdout
+
+
+def test_unused_checkers_do_not_import_heavy_modules():
+    stdout, _stderr = run_python(
+        f"""\
+        import sys
+        from pylint.lint import Run
+        with open("source.py", "w") as f:
+            f.write("import os\\n")
+        Run(["source.py", "--disable=all", "--enable=super-method-not-called", "--load-plugins=edx_lint.pylint"],
+            exit=False)
+        print("imported:", [name for name in {HEAVY_MODULES!r} if name in sys.modules])
+        """
+    )
+    assert "imported: []" in stdout
+
+
+def test_enabled_annotation_checkers_import_code_annotations():
+    stdout, _stderr = run_python(
+        """\
+        import sys
+        from pylint.lint import Run
+        with open("source.py", "w") as f:
+            f.write("import os\\n")
+        Run(["source.py", "--disable=all", "--enable=toggle-no-name", "--load-plugins=edx_lint.pylint"], exit=False)
+        print("imported:", "code_annotations.base" in sys.modules)
+        """
+    )
+    assert "imported: True" in stdout
+
+
+def test_opt_in_modules_are_imported_when_asked_for():
+    stdout, _stderr = run_python(
+        """\
+        import os
+        import sys
+        from pylint.lint import Run
+        with open("source.py", "w") as f:
+            f.write("import os\\n")
+        os.environ["EDX_LINT_MEMORY_TRACE"] = "memory.json"
+        Run(["source.py", "--disable=all", "--enable=super-method-not-called", "--load-plugins=edx_lint.pylint",
+             "--edx-lint-profile=profile.json"], exit=False)
+        print("imported:", [name for name in sorted(sys.modules) if name.startswith("edx_lint.pylint.")])
+        """
+    )
+    assert "'edx_lint.pylint.memory_trace'" in stdout
+    assert "'edx_lint.pylint.profiling'" in stdout
+    assert "'edx_lint.pylint.autofix'" not in stdout
@@ -0,0 +1,57 @@
+"""Test profiling.py"""
+
+import atexit
+import json
+
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+from edx_lint.pylint.profiling import ProfilingChecker
+
+
+def run_profiled(*args):
+    """Run pylint on some source, and return the profiler if profiling is enabled, which hasn't written anything yet."""
+    with open("source.py", "w") as f:
+        f.write("import unittest\n\nclass Test(unittest.TestCase):\n    def setUp(self):\n        range(0, 10)\n")
+    run = Run(
+        ["source.py", "--disable=all", "--enable=super-method-not-called,simplifiable-range",
+         "--load-plugins=edx_lint.pylint", *args],
+        reporter=CollectingReporter(),
+        exit=False,
+    )
+    profilers = [checker for checker in run.linter.get_checkers() if isinstance(checker, ProfilingChecker)]
+    for profiler in profilers:
+        atexit.unregister(profiler.write_profile)
+    return profilers[0] if profilers else None
+
+
+def test_profiling_is_off_by_default():
+    assert run_profiled() is None
+
+
+def test_profile(capsys):
+    profiler = run_profiled("--edx-lint-profile=profile.json")
+    assert profiler.calls["unit-test-super-checker.visit_functiondef"] == 1
+    # The checkers of disabled messages don't run.
+    assert "layered-test-class-checker.visit_classdef" not in profiler.calls
+    # Call handlers are profiled too.
+    assert profiler.calls["range-checker.check_call"] == 1
+
+    profiler.write_profile()
+    with open("profile.json") as f:
+        methods = json.load(f)["methods"]
+    assert {"checker": "unit-test-super-checker", "method": "visit_functiondef", "calls": 1} in [
+        {key: method[key] for key in ["checker", "method", "calls"]} for method in methods
+    ]
+    assert [method["seconds"] for method in methods] == sorted((method["seconds"] for method in methods), reverse=True)
+    table = capsys.readouterr().err.splitlines()
+    assert table[0].split() == ["seconds", "calls", "per", "call", "method"]
+    assert len(table) == len(methods) + 1
+
+
+def test_worker_profiles_are_merged():
+    profiler = run_profiled("--edx-lint-profile=profile.json")
+    worker_data = profiler.get_map_data()
+    assert not profiler.calls
+    profiler.reduce_map_data(profiler.linter, [worker_data, worker_data])
+    assert profiler.total("calls")["unit-test-super-checker.visit_functiondef"] == 2
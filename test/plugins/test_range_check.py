@@ -49,3 +49,17 @@ def test_range(range_name):
         f"E:simplifiable-range:{range_name}() call could be two-argument",
     }
     assert expected == messages
+
+
+def test_range_with_aliases():
+    source = """\
+        from six.moves import range as six_range
+
+        six_range(0, 10)        #=A
+        six_range(10)
+    """
+    messages = run_pylint(source, "simplifiable-range")
+    expected = {
+        "A:simplifiable-range:six_range() call could be single-argument",
+    }
+    assert expected == messages
@@ -1,6 +1,14 @@
 """Test super_check.py"""
 
+import textwrap
+from io import StringIO
+
+import astroid
 import pytest
+from pylint.lint import Run
+from pylint.reporters.text import TextReporter
+
+from edx_lint.pylint.super_check import AncestorMethodCache
 
 from .pylint_test import run_pylint
 
@@ -112,3 +120,101 @@ def test_good_super():
         """
     messages = run_pylint(source, MSG_IDS)
     assert not messages
+
+
+def test_base_class_methods_are_cached():
+    cache = AncestorMethodCache()
+    source = """\
+        import unittest
+
+        class Base(unittest.TestCase):
+            def setUp(self):
+                super().setUp()
+
+        class First(Base):
+            pass
+
+        class Second(Base):
+            pass
+        """
+    module = astroid.parse(source, module_name="tests")
+    base, first, second = module.body[1:]
+    assert cache.ancestors_to_call(first, "setUp") == {base: cache.method(base, "setUp")}
+    assert cache.ancestors_to_call(second, "setUp") == {base: cache.method(base, "setUp")}
+    assert not cache.ancestors_to_call(second, "tearDown")
+    assert (cache.hits, cache.misses) == (3, 2)
+
+    # A class with the same qname in another module is not mixed up with the cached one.
+    other_base = astroid.parse(source, module_name="tests").body[1]
+    assert other_base.qname() == base.qname()
+    assert cache.method(other_base, "setUp").parent is other_base
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_base_class_method_cache_report():
+    with open("cache_base.py", "w") as f:
+        f.write("import unittest\n\nclass Base(unittest.TestCase):\n    def setUp(self):\n        super().setUp()\n")
+    for name in ["cache_first", "cache_second"]:
+        with open(f"{name}.py", "w") as f:
+            f.write(
+                "from cache_base import Base\n\nclass Test(Base):\n"
+                "    def setUp(self):\n        super().setUp()\n"
+                "    def tearDown(self):\n        super().tearDown()\n"
+            )
+
+    output = StringIO()
+    Run(
+        ["cache_base.py", "cache_first.py", "cache_second.py", "--disable=all", f"--enable={MSG_IDS}",
+         "--load-plugins=edx_lint.pylint", "--reports=y"],
+        reporter=TextReporter(output),
+        exit=False,
+    )
+    report = output.getvalue()
+    assert "unit-test-super-checker base class method cache" in report
+    # TestCase.setUp for Base, Base.setUp and Base.tearDown for the first test module.
+    assert "|misses   |3       |" in report
+    # Base.setUp and Base.tearDown for the second test module.
+    assert "|hits     |2       |" in report
+    assert "|hit rate |40.0%   |" in report
+
+
+def test_parent_receivers_are_resolved_without_inference():
+    with open("receivers.py", "w") as f:
+        f.write(textwrap.dedent("""\
+            import unittest
+
+            class Base(unittest.TestCase):
+                def setUp(self):
+                    super().setUp()
+
+            class Other(Base):
+                def setUp(self):
+                    Base.setUp(self)
+
+                def tearDown(self):
+                    base = super()
+                    base.tearDown()
+
+            class Third(unittest.TestCase):
+                def setUp(self):
+                    unittest.TestCase.setUp(self)
+
+            class Fourth(unittest.TestCase):
+                def setUp(self):
+                    Base.setUp(self)
+            """))
+
+    output = StringIO()
+    Run(
+        ["receivers.py", "--disable=all", f"--enable={MSG_IDS}", "--load-plugins=edx_lint.pylint", "--reports=y"],
+        reporter=TextReporter(output),
+        exit=False,
+    )
+    report = output.getvalue()
+    assert "21:8: E7602: setUp() was called from a non-parent class (receivers.Base)" in report
+    assert "unit-test-super-checker receiver inference" in report
+    # super() and Base in Other are resolved syntactically. `base` is inferred, and so are unittest.TestCase, whose
+    # empty setUp() doesn't count as a method to call, and Base in Fourth, which isn't one of its bases.
+    assert "|syntactic         |2         |" in report
+    assert "|inferred          |3         |" in report
+    assert "|inference avoided |40.0%     |" in report
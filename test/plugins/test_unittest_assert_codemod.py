@@ -0,0 +1,136 @@
+"""Test unittest_assert/codemod.py and the edx_lint unittest_to_pytest command."""
+
+import os
+import textwrap
+
+from edx_lint.cmd.main import main
+from edx_lint.pylint.unittest_assert.codemod import CodemodResult, rewrite_file, rewrite_files
+
+
+def write_source(path, source):
+    """Write some dedented source to a file."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        f.write(textwrap.dedent(source))
+
+
+def read_source(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_rewrite_assertions():
+    write_source("test_source.py", """\
+        class TestThings(TestCase):
+            def test_things(self):
+                self.assertEqual(a, b)  # first
+                self.assertNotEqual(a or b, c, "msg")
+                self.assertIsNone(
+                    a,  # the value
+                    msg="nope",
+                )
+                self.assertIsInstance(a, (int, str))
+                self.assertAlmostEqual(a, b)
+                result = self.assertTrue(a)
+        """)
+    assert rewrite_file("test_source.py") == CodemodResult("test_source.py", 4, 2, None)
+    assert read_source("test_source.py") == textwrap.dedent("""\
+        class TestThings(TestCase):
+            def test_things(self):
+                assert a == b  # first
+                assert (a or b) != c, "msg"
+                assert (
+                    a is None), (  # the value
+                    "nope"
+                )
+                assert isinstance(a, (int, str))
+                self.assertAlmostEqual(a, b)
+                result = self.assertTrue(a)
+        """)
+
+
+def test_rewrite_assert_raises():
+    write_source("test_source.py", """\
+        \"\"\"Tests.\"\"\"
+        import unittest
+
+
+        class TestThings(unittest.TestCase):
+            def test_things(self):
+                with self.assertRaises(ValueError) as context:
+                    int("x")
+                self.assertIn("x", str(context.exception))
+                self.assertRaises(KeyError, {}.get, "k", default=1)
+                self.assertRaises(ValueError, int, "x"); x = 1
+                self.assertRaises(ValueError)
+        """)
+    assert rewrite_file("test_source.py") == CodemodResult("test_source.py", 3, 2, None)
+    assert read_source("test_source.py") == textwrap.dedent("""\
+        \"\"\"Tests.\"\"\"
+        import unittest
+        import pytest
+
+
+        class TestThings(unittest.TestCase):
+            def test_things(self):
+                with pytest.raises(ValueError) as context:
+                    int("x")
+                assert "x" in str(context.value)
+                with pytest.raises(KeyError):
+                    {}.get("k", default=1)
+                self.assertRaises(ValueError, int, "x"); x = 1
+                self.assertRaises(ValueError)
+        """)
+
+
+def test_pytest_is_imported_once():
+    source = """\
+        import pytest
+
+        def test_things(self):
+            with self.assertRaises(ValueError):
+                int("x")
+        """
+    write_source("test_source.py", source)
+    assert rewrite_file("test_source.py") == CodemodResult("test_source.py", 1, 0, None)
+    assert read_source("test_source.py") == textwrap.dedent(source).replace("self.assertRaises", "pytest.raises")
+
+
+def test_files_without_assertions_are_not_rewritten():
+    write_source("source.py", "x = 1\n")
+    write_source("broken.py", "self.assertTrue(\n")
+    assert rewrite_file("source.py") == CodemodResult("source.py", 0, 0, None)
+    result = rewrite_file("broken.py")
+    assert result.rewritten == 0
+    assert result.error is not None
+
+
+def test_rewrite_files_in_parallel():
+    for name in ["a", "b", "c"]:
+        write_source(f"tests/test_{name}.py", "self.assertTrue(x)\n")
+    write_source("tests/.hidden/test_d.py", "self.assertTrue(x)\n")
+    results = list(rewrite_files(["tests"], jobs=2))
+    assert [result.path for result in results] == [os.path.join("tests", f"test_{name}.py") for name in "abc"]
+    assert all(result.rewritten == 1 for result in results)
+    assert read_source("tests/test_b.py") == "assert x\n"
+    assert read_source("tests/.hidden/test_d.py") == "self.assertTrue(x)\n"
+
+
+def test_unittest_to_pytest_command(capsys):
+    write_source("tests/test_a.py", "self.assertTrue(x)\nself.assertAlmostEqual(a, b)\n")
+    write_source("tests/test_b.py", "x = 1\n")
+    assert main(["unittest_to_pytest", "--jobs=1", "tests"]) == 0
+    output = capsys.readouterr().out
+    assert "tests/test_a.py: 1 rewritten, 1 left\n" in output
+    assert "test_b.py" not in output
+    assert "1 assertions rewritten in 1 files" in output
+    assert main(["unittest_to_pytest"]) == 1
+
+
+def test_unittest_to_pytest_jobs_errors(capsys):
+    write_source("tests/test_a.py", "self.assertTrue(x)\n")
+    assert main(["unittest_to_pytest", "--jobs=abc", "tests"]) == 1
+    assert "invalid int value: 'abc'" in capsys.readouterr().err
+    assert main(["unittest_to_pytest", "--jobs=0", "tests"]) == 1
+    assert capsys.readouterr().out == "Please provide a number of jobs of at least 1.\n"
+    assert read_source("tests/test_a.py") == "self.assertTrue(x)\n"
@@ -0,0 +1,64 @@
+"""Test worker_counts.py"""
+
+from collections import Counter
+
+import astroid
+
+from edx_lint.pylint.worker_counts import NodeCache, WorkerCountsMixin, ratio_table
+
+
+class Base(WorkerCountsMixin):
+    """A checker with counts."""
+
+    COUNTS = ("things",)
+
+    def __init__(self):
+        super().__init__()
+        self.things = Counter()
+
+
+class Derived(Base):
+    """A checker with more counts."""
+
+    COUNTS = ("others",)
+
+    def __init__(self):
+        super().__init__()
+        self.others = Counter()
+
+
+def test_worker_counts_are_merged():
+    worker = Derived()
+    assert Derived.count_names() == ["things", "others"]
+    worker.things["a"] += 2
+    worker.others["b"] += 1
+    worker_data = worker.get_map_data()
+    assert worker_data == {"things": {"a": 2}, "others": {"b": 1}}
+    assert not worker.things and not worker.others
+    worker.things["a"] += 1
+    assert worker.get_map_data() == {"things": {"a": 1}, "others": {}}
+
+    main = Derived()
+    main.reduce_map_data(None, [worker_data, worker_data])
+    main.things["a"] += 1
+    assert main.total("things") == {"a": 5}
+    assert main.total("others") == {"b": 2}
+
+
+def test_node_cache():
+    counts = Counter()
+    cache = NodeCache(counts)
+    first, second = astroid.extract_node("class A: pass"), astroid.extract_node("class A: pass")
+    assert cache.get("A", first, lambda: 1) == 1
+    assert cache.get("A", first, lambda: 2) == 1
+    # The same key for another node is computed again.
+    assert cache.get("A", second, lambda: 3) == 3
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert counts == {"hits": 1, "misses": 2}
+
+
+def test_ratio_table():
+    table = ratio_table("lookups", Counter(hits=1, misses=3), "hits", "misses", "hit rate")
+    assert [child.data for child in table.children] == ["", "lookups", "hits", "1", "misses", "3", "hit rate", "25.0%"]
+    table = ratio_table("lookups", Counter(), "hits", "misses", "hit rate")
+    assert table.children[-1].data == "-"
@@ -1,5 +1,10 @@
 """Test yaml_load_check.py"""
 
+import os
+
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
 from .pylint_test import run_pylint
 
 
@@ -31,3 +36,59 @@ def test_safe_yaml_invocations_are_fine():
     """
     messages = run_pylint(source, MSG_IDS)
     assert not messages
+
+
+def test_aliased_unsafe_yaml_load_warnings():
+    source = """\
+        import yaml as y
+        from yaml import load, load_all as yaml_load_all
+
+        y.load('foo.bar')                         #=A
+        load('foo.bar')                           #=B
+        yaml_load_all('foo.bar')                  #=C
+        y.safe_load('this.is.fine')
+
+    """
+    messages = run_pylint(source, MSG_IDS)
+
+    expected_messages = {
+        "A:unsafe-yaml-load:yaml.load() call is unsafe, use yaml.safe_load()",
+        "B:unsafe-yaml-load:yaml.load() call is unsafe, use yaml.safe_load()",
+        "C:unsafe-yaml-load:yaml.load_all() call is unsafe, use yaml.safe_load_all()",
+    }
+    assert expected_messages == messages
+
+
+def test_other_yaml_modules_are_fine():
+    source = """\
+        import ruamel.yaml as yaml
+        from json import load
+
+        yaml.load('this.is.fine')
+        load('this.is.fine.too')
+
+    """
+    messages = run_pylint(source, MSG_IDS)
+    assert not messages
+
+
+def test_modules_with_the_same_name():
+    # Modules outside of packages are named after their file, so both of these are "script".
+    sources = {
+        "a/script.py": "import yaml as y\ny.load('x')\n",
+        "b/script.py": "from yaml import load as yl\ny = object()\ny.load('x')\nyl('z')\n",
+    }
+    for path, source in sources.items():
+        os.makedirs(os.path.dirname(path))
+        with open(path, "w") as f:
+            f.write(source)
+    reporter = CollectingReporter()
+    Run(
+        [*sources, "--disable=all", f"--enable={MSG_IDS}", "--load-plugins=edx_lint.pylint", "--persistent=n"],
+        reporter=reporter,
+        exit=False,
+    )
+    assert sorted((message.path, message.line) for message in reporter.messages) == [
+        (os.path.join("a", "script.py"), 2),
+        (os.path.join("b", "script.py"), 4),
+    ]
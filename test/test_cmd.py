@@ -3,6 +3,7 @@
 import contextlib
 import importlib.resources
 import io
+import json
 import os
 import shutil
 import tempfile
@@ -12,6 +13,7 @@ from unittest.mock import patch
 import tomlkit
 
 from edx_lint.cmd import main
+from edx_lint.cmd.shard import plan_shards, read_history
 from edx_lint.cmd.write_uv_constraints import _parse_constraints
 
 
@@ -326,3 +328,79 @@ class WriteUvConstraintsCommandTest(CommandTest):
         assert self.call_command(["write_uv_constraints"]) == 0
         written = self._read_constraint_dependencies()
         assert written.count(GLOBAL_CONSTRAINTS[0]) == 1
+
+
+class ShardCommandTest(CommandTest):
+    """Tests for the shard command."""
+
+    def _make_file(self, path, size):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write("#" * size)
+
+    def _write_history(self, *timings):
+        with open("history.jsonl", "w") as f:
+            for end, (path, wall) in enumerate(timings):
+                record = {"file": os.path.abspath(path), "size": os.path.getsize(path), "end": end, "wall": wall}
+                f.write(json.dumps(record) + "\n")
+
+    def test_plan_shards_longest_first(self):
+        shards = plan_shards({"a": 7, "b": 5, "c": 4, "d": 3, "e": 2, "f": 1}, 2)
+        self.assertEqual(shards, [(11, ["a", "d", "f"]), (11, ["b", "c", "e"])])
+
+    def test_more_shards_than_files(self):
+        self.assertEqual(plan_shards({"a": 1}, 3), [(1, ["a"]), (0.0, []), (0.0, [])])
+
+    def test_shards_by_history_and_size(self):
+        self._make_file("src/slow.py", 100)
+        self._make_file("src/fast.py", 100)
+        self._make_file("src/pkg/new.py", 200)
+        self._make_file("src/.hidden/skipped.py", 100)
+        # The timings of slow.py are averaged, and new files are estimated at the 6s per 300 bytes of the timings.
+        self._write_history(("src/slow.py", 1), ("src/slow.py", 3), ("src/fast.py", 2))
+        with capture_output() as output:
+            ret = self.call_command(["shard", "--shards=2", "--history=history.jsonl", "--output=shard-{}.txt", "src"])
+        self.assertEqual(ret, 0)
+        self.assertEqual(output.getvalue().splitlines(), [
+            "shard-1.txt: 1 files, 4.0s expected",
+            "shard-2.txt: 2 files, 4.0s expected",
+        ])
+        self.assert_file("shard-1.txt", contains="src/pkg/new.py\n")
+        with open("shard-2.txt") as f:
+            self.assertEqual(f.read(), "src/fast.py\nsrc/slow.py\n")
+
+    def test_history_with_other_lines(self):
+        self._make_file("src/slow.py", 100)
+        self._make_file("src/fast.py", 100)
+        self._write_history(("src/slow.py", 4), ("src/fast.py", 1))
+        with open("history.jsonl", "a") as f:
+            # Old bare file names, other JSON values, records without timings, and a line cut short.
+            f.write("src/fast.py\n")
+            f.write('"src/fast.py"\n')
+            f.write("[1, 2]\n")
+            f.write(json.dumps({"file": os.path.abspath("src/fast.py"), "end": 5}) + "\n")
+            f.write(json.dumps({"file": os.path.abspath("src/fast.py"), "end": 6, "wall": "9"}) + "\n")
+            f.write('{"file": "src/fast.py", "end": 7, "wa')
+        history = read_history(["history.jsonl"])
+        self.assertEqual(sorted(history), [os.path.realpath("src/fast.py"), os.path.realpath("src/slow.py")])
+        self.assertEqual([record["wall"] for record in history[os.path.realpath("src/fast.py")]], [1])
+        with capture_output() as output:
+            ret = self.call_command(["shard", "--shards=2", "--history=history.jsonl", "src"])
+        self.assertEqual(ret, 0)
+        self.assertEqual(output.getvalue().splitlines(), ["src/slow.py", "src/fast.py"])
+
+    def test_shards_by_size_without_history(self):
+        self._make_file("src/a.py", 300)
+        self._make_file("src/b.py", 200)
+        self._make_file("src/c.py", 100)
+        with patch.dict(os.environ, {"PYLINT_RECORD_FILES": "missing.jsonl"}):
+            with capture_output() as output:
+                ret = self.call_command(["shard", "--shards=2", "src"])
+        self.assertEqual(ret, 0)
+        self.assertEqual(output.getvalue().splitlines(), ["src/a.py", "src/b.py src/c.py"])
+
+    def test_shard_errors(self):
+        with capture_output():
+            self.assertEqual(self.call_command(["shard", "src"]), 1)
+            self.assertEqual(self.call_command(["shard", "--shards=0", "src"]), 1)
+            self.assertEqual(self.call_command(["shard", "--shards=2", "missing.py"]), 2)